@@ -6,9 +6,21 @@ import sys
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 
 try:
-    from src.data_loader import load_data
+    from src.data_loader import load_data, iter_chunks
+    from src.aggregates import SalaryCube, CUBE_KEYS, VALUE_COLUMN
+    from src.figure_cache import FIGURE_CACHE, file_fingerprint
+    from src.disk_cache import DISK_CACHE, file_digest
+    from src.instrumentation import end_rerun, span, start_metrics_server, start_rerun
+    from src.filters import FilterIndex
+    from src.live_data import LiveDataset
+    from src.shared_data import SharedDataset
     from src.eda import show_eda
-    from src.components.sidebar import render_eda_sidebar
+    from src.parallel import SectionExecutor, SharedData, DEFAULT_TIMEOUT
+    from src.prediction import PredictionEngine
+    from src.snapshot import load_snapshot
+    from src.components.sidebar import render_eda_sidebar, render_filter_sidebar
+    from src.components.debug_panel import PROFILING_KEY, render_debug_panel
+    from src.components.prediction import render_prediction_section
 except ImportError as e:
     st.error(f"Błąd importu: {e}")
     st.info("Uruchom z głównego katalogu projektu: streamlit run app/app.py")
@@ -55,24 +67,129 @@ st.set_page_config(
     layout="wide"
 )
 
+# Używamy ścieżki względnej od lokalizacji app.py (EDA_DATA_PATH - inny plik, np. w teście obciążenia)
+DATA_PATH = os.environ.get(
+    "EDA_DATA_PATH", os.path.join(os.path.dirname(__file__), '..', 'data', 'DataScience_salaries_2025.csv')
+)
+
+# 💾 TRYB OUT-OF-CORE (EDA_OUT_OF_CORE=1) - dla danych większych niż pamięć:
+# kostka składana porcjami z pliku, surowa tabela nigdy nie trafia do pamięci
+OUT_OF_CORE = os.environ.get("EDA_OUT_OF_CORE") == "1"
+
+# 🧬 TRYB WSPÓŁDZIELONY (EDA_SHARED_DIR=/dev/shm/eda) - wiele procesów/replik na węźle:
+# tabela publikowana raz jako plik Arrow IPC i mapowana read-only przez każdy proces
+SHARED_DIR = os.environ.get("EDA_SHARED_DIR")
+
+# 🧵 TRYB RÓWNOLEGŁY (EDA_PARALLEL=thread|process) - wyniki sekcji liczone naraz na puli,
+# renderowane w kolejności strony; EDA_PARALLEL_WORKERS / EDA_PARALLEL_TIMEOUT (s na zadanie).
+# Domyślnie sekwencyjnie - włączamy tylko, gdy benchmark (page:*) pokazuje zysk na danej maszynie.
+# Pula procesów wymaga EDA_SHARED_DIR: procesy robocze mapują opublikowany plik
+# zamiast dostawać kopię tabeli i kostki (bez niego zadania liczone są w wątku skryptu)
+PARALLEL = os.environ.get("EDA_PARALLEL")
+PARALLEL_WORKERS = int(os.environ["EDA_PARALLEL_WORKERS"]) if os.environ.get("EDA_PARALLEL_WORKERS") else None
+PARALLEL_TIMEOUT = float(os.environ.get("EDA_PARALLEL_TIMEOUT", DEFAULT_TIMEOUT))
+
+# 📸 SNAPSHOT (EDA_SNAPSHOT_DIR=snapshot) - wyniki sekcji policzone offline
+# (python -m src.snapshot) dla stanu domyślnego i popularnych stanów widgetów
+SNAPSHOT_DIR = os.environ.get("EDA_SNAPSHOT_DIR")
+
+# 🔬 INSTRUMENTACJA: EDA_PROFILING=1 → profil każdego reruna jako linia JSON w logu;
+# EDA_METRICS_PORT=9100 → endpoint http://host:9100/metrics (format Prometheus)
+PROFILING = os.environ.get("EDA_PROFILING") == "1"
+METRICS_PORT = int(os.environ["EDA_METRICS_PORT"]) if os.environ.get("EDA_METRICS_PORT") else None
+
 # 💾 CACHE DANYCH - KLUCZOWA OPTYMALIZACJA
-# Bez @st.cache_data Streamlit wczytywałby dane przy KAŻDYM rerunie
-# Decorator cache'uje wynik funkcji między rerunami
-@st.cache_data
-def load_cached_data():
-    # Ładuje i cache'uje dane.
-    # Uwaga: @st.cache_data automatycznie wykrywa zmiany w argumentach
-    # Jeśli zmieni się plik CSV, cache się unieważni.
-    
-    # Używamy ścieżki względnej od lokalizacji app.py
-    data_path = os.path.join(os.path.dirname(__file__), '..', 'data', 'DataScience_salaries_2025.csv')
-    return load_data(data_path)
+# Dane wczytujemy RAZ na proces (@st.cache_resource - bez kopii przy rerunie)
+# i odświeżamy PRZYROSTOWO: dopisane do CSV wiersze są parsowane osobno
+# i scalane z tabelą oraz kostką agregatów (src/live_data.py).
+# Każda sesja przy kolejnym rerunie widzi nową wersję - bez zimnego przeładowania.
+# 💽 EDA_CACHE_DIR=/var/cache/eda → tabela, kostka i wykresy zapisane na dysku
+# (src/disk_cache.py) - restart/deploy/nowa replika czyta je zamiast liczyć;
+# rozgrzanie przy budowie: python -m src.warmup
+@st.cache_resource
+def load_live_dataset():
+    if SHARED_DIR:
+        return SharedDataset(DATA_PATH, SHARED_DIR)
+    return LiveDataset(DATA_PATH, disk_cache=DISK_CACHE)
+
+# 🧊 KOSTKA AGREGATÓW (tryb out-of-core) - składana porcjami z pliku
+# @st.cache_resource nie kopiuje obiektu (w przeciwieństwie do cache_data),
+# więc każda sesja korzysta z tych samych komórek i zapamiętanych rollupów.
+@st.cache_resource
+def load_out_of_core_cube():
+    build = lambda: SalaryCube.from_chunks(iter_chunks(DATA_PATH, columns=CUBE_KEYS + [VALUE_COLUMN]))
+    if DISK_CACHE is None:
+        return build()
+    return DISK_CACHE.get_or_build(('cube', file_digest(DATA_PATH)), build)
+
+# 🔑 ODCISK PLIKU (tryb out-of-core) - klucz cache wykresów
+@st.cache_resource
+def load_out_of_core_fingerprint():
+    return file_fingerprint(DATA_PATH)
+
+# 🎛️ INDEKS FILTRÓW - bitmapy/pozycje wierszy budowane raz na wersję danych
+# Widoki po filtrach są zapamiętywane w indeksie i współdzielone przez sesje.
+# Argument z "_" nie jest hashowany - kluczem cache jest odcisk wersji.
+@st.cache_resource(max_entries=2)
+def load_cached_filter_index(_snapshot, fingerprint):
+    return FilterIndex(_snapshot.df, cube=_snapshot.cube)
+
+# 🧵 PULA SEKCJI - jedna na proces, współdzielona przez sesje
+@st.cache_resource
+def load_section_executor():
+    if not PARALLEL:
+        return None
+    return SectionExecutor(PARALLEL, max_workers=PARALLEL_WORKERS, timeout=PARALLEL_TIMEOUT)
+
+# 🤖 MODEL PREDYKCYJNY - jeden silnik na proces; trenuje w tle, nigdy w rerunie
+# Trening zleca dopiero sekcja modelu (albo python -m src.warmup), więc strony
+# EDA go nie uruchamiają (artefakt z EDA_CACHE_DIR przeżywa restart - src/prediction.py)
+@st.cache_resource
+def load_prediction_engine():
+    return PredictionEngine(disk_cache=DISK_CACHE)
+
+# 📸 SNAPSHOT - wczytany raz na proces; używany tylko dla zgodnego odcisku danych
+@st.cache_resource
+def load_eda_snapshot():
+    return load_snapshot(SNAPSHOT_DIR) if SNAPSHOT_DIR else None
+
+def cache_stats():
+    stats = {"figures": FIGURE_CACHE.stats()}
+    if DISK_CACHE is not None:
+        stats["disk"] = DISK_CACHE.stats()
+    return stats
+
+# 📡 ENDPOINT METRYK - jeden serwer na proces
+@st.cache_resource
+def load_metrics_server():
+    if METRICS_PORT is None:
+        return None
+    return start_metrics_server(METRICS_PORT, caches=cache_stats)
 
 # 🚀 GŁÓWNA FUNKCJA APLIKACJI 
 def main():
+    load_metrics_server()
+    # 🔬 Profil reruna: przełącznik w panelu diagnostycznym (stan z session_state) albo EDA_PROFILING=1
+    profile = start_rerun() if PROFILING or st.session_state.get(PROFILING_KEY, False) else None
+    try:
+        render_page()
+    finally:
+        if profile is not None:
+            end_rerun(profile, caches=cache_stats(), log=PROFILING)
+    render_debug_panel(profile, cache_stats())
+
+def render_page():
     try:
         # ⚡ DANE SĄ CACHE'OWANE - szybkie ładowanie przy kolejnych interakcjach
-        df = load_cached_data()
+        if OUT_OF_CORE:
+            snapshot = None
+            df, cube, fingerprint = None, load_out_of_core_cube(), load_out_of_core_fingerprint()
+        else:
+            dataset = load_live_dataset()
+            # 🔄 Tani stat pliku (co najwyżej raz na min_interval) - nowe wiersze → nowa wersja
+            dataset.refresh()
+            snapshot = dataset.current
+            df, cube, fingerprint = snapshot.df, snapshot.cube, snapshot.version_id
     except FileNotFoundError as e:
         st.error(f"Nie znaleziono pliku z danymi: {e}")
         st.info("Upewnij się, że plik data/DataScience_salaries_2025.csv istnieje")
@@ -111,20 +228,38 @@ def main():
     # 📈 SEKCJA EDA - główny showcase Streamlit
     elif menu == "📈 Analiza danych (EDA)":
         # Sidebar z nawigacją dla EDA
-        render_eda_sidebar()
+        # (w trybie leniwym zwraca wybraną sekcję - tylko ona jest liczona)
+        section = render_eda_sidebar()
+        if OUT_OF_CORE:
+            # Bez surowych wierszy nie ma indeksu filtrów - tylko agregaty z kostki
+            st.sidebar.info("Tryb out-of-core: filtry globalne są niedostępne.")
+            show_eda(None, cube, fingerprint, section=section, executor=load_section_executor())
+            return
+        # Globalne filtry → widok danych, z którego korzystają wszystkie sekcje
+        filter_index = load_cached_filter_index(snapshot, fingerprint)
+        filter_state = render_filter_sidebar(filter_index)
+        with span("filters:view"):
+            view = filter_index.view(filter_state)
+        view_fingerprint = view.fingerprint(fingerprint)
+        # 📸 Stan zgodny ze snapshotem → wyniki bez liczenia; reszta na żywo
+        snapshot_eda = load_eda_snapshot()
+        prefetched = snapshot_eda.results if snapshot_eda and snapshot_eda.matches(view_fingerprint) else None
+        # 🧬 Uchwyt danych dla puli procesów (tryb współdzielony): plik + wersja + wiersze widoku
+        shared = None
+        if snapshot.path is not None:
+            shared = SharedData(
+                snapshot.path, fingerprint, view.key, view.positions,
+                filter_index.cube_filters(view.key) if view.is_filtered else None,
+            )
         # Główna zawartość EDA
-        show_eda(df)
+        show_eda(
+            view.frame, view.cube, view_fingerprint,
+            section=section, executor=load_section_executor(), prefetched=prefetched, shared=shared
+        )
         
-    # 🤖 SEKCJA MODEL PREDYKCYJNY - placeholder na przyszłość
+    # 🤖 SEKCJA MODEL PREDYKCYJNY - predykcja z modelu trenowanego w tle
     elif menu == "🤖 Model predykcyjny":
-        st.title("🤖 Model Predykcyjny")
-        st.warning("🎯 Sekcja w przygotowaniu! Pracuję nad modelem predykcyjnym wynagrodzeń.")
-        st.markdown("""
-        Planowane funkcjonalności:
-        - Predykcja wynagrodzenia na podstawie doświadczenia, lokalizacji i stanowiska
-        - Analiza trendów przyszłych wynagrodzeń
-        - Porównanie z rzeczywistymi danymi
-        """)
+        render_prediction_section(load_prediction_engine(), df, fingerprint)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,431 @@
+# 🚦 BENCHMARK: Test obciążenia - wiele równoczesnych sesji dashboardu
+
+# benchmarks/suite.py mierzy etapy pojedynczo; tutaj mierzymy to, co widzi
+# użytkownik, gdy na jednej replice pracuje N sesji naraz. Każda sesja to
+# osobny AppTest (streamlit.testing) na app/app.py - pełny rerun skryptu ze
+# wspólnym dla procesu @st.cache_resource, jak w `streamlit run`. Sesje działają
+# w wątkach i wykonują losowy (z ziarnem) scenariusz interakcji:
+# - przełączenie menu (strona główna / EDA / model) i sekcji EDA
+# - suwak minimalnej liczby rekordów (top_jobs_min_count)
+# - wybór stanowiska (selected_job)
+# - edycja listy krajów (geo_countries)
+# - suwak cutoff rozkładu (distribution_cutoff)
+# Interakcja na widgecie z innej sekcji najpierw przełącza sekcję (osobny rerun).
+
+# Raport: p50/p95/p99 czasu reruna (ogółem i per akcja), przepustowość
+# (reruny/s) i RSS procesu w czasie - przyrost RSS na rerun wyłapuje
+# regresje typu "kopia tabeli przy każdym rerunie". Pierwszy rerun sesji
+# (zimne cache) raportujemy osobno i nie wliczamy do percentyli.
+# Przekroczenie progów (--max-p95-ms, --max-rss-growth-mb) → kod wyjścia 1.
+
+# Uruchomienie (z głównego katalogu projektu):
+#   python -m benchmarks.load_test --sessions 8 --steps 30
+#   python -m benchmarks.load_test --sessions 16 --rows 1M --think 0.5 --json load.json
+
+import argparse
+import contextlib
+import json
+import logging
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+
+import numpy as np
+import streamlit as st
+from streamlit import config as streamlit_config, logger as streamlit_logger
+from streamlit.runtime import Runtime
+from streamlit.testing.v1 import AppTest
+from streamlit.testing.v1 import app_test as streamlit_app_test
+from streamlit.testing.v1.util import build_mock_config_get_option
+
+from benchmarks.suite import SIZES
+from benchmarks.synthetic import make_salaries
+from src.components.sidebar import EDA_SECTION_LABELS
+from src.data_loader import write_dataset
+from src.instrumentation import peak_rss_bytes
+
+APP_PATH = os.path.join(os.path.dirname(__file__), '..', 'app', 'app.py')
+
+MENU_LABEL = "Wybierz sekcję:"
+MENU_HOME = "🏠 Strona główna"
+MENU_EDA = "📈 Analiza danych (EDA)"
+MENU_MODEL = "🤖 Model predykcyjny"
+
+# Akcja → waga w scenariuszu (częściej suwaki i filtry niż przełączanie stron)
+ACTIONS = {
+    'menu': 1,
+    'section': 2,
+    'min_count': 3,
+    'job': 2,
+    'countries': 2,
+    'cutoff': 3,
+}
+
+# Widget → sekcja EDA, w której jest renderowany
+WIDGET_SECTIONS = {
+    'top_jobs_min_count': 'salary_analysis',
+    'selected_job': 'salary_analysis',
+    'geo_countries': 'geo_analysis',
+    'distribution_cutoff': 'salary_distribution',
+}
+
+DEFAULT_TIMEOUT = 120.0
+RSS_SAMPLE_INTERVAL = 0.5
+
+
+class _RuntimeSlotMeta(type):
+    # Przypisanie <klasa>._instance trafia do Runtime._instance, ale None jest
+    # ignorowane - runtime ustawiony przez dowolną sesję zostaje do końca testu
+    def __setattr__(cls, name, value):
+        if name != '_instance':
+            super().__setattr__(name, value)
+        elif value is not None:
+            Runtime._instance = value
+
+
+class _SharedRuntime(Runtime, metaclass=_RuntimeSlotMeta):
+    pass
+
+
+@contextlib.contextmanager
+def concurrent_app_tests():
+    """
+    Pozwala uruchamiać AppTest.run z wielu wątków naraz.
+
+    AppTest ustawia globalne Runtime._instance i opcję global.appTest na czas
+    reruna, a po nim je przywraca - koniec reruna jednej sesji zabierałby
+    runtime (i tryb testowy widgetów) skryptowi drugiej. Na czas testu runtime
+    nie jest zerowany, a global.appTest jest włączone na stałe; po teście
+    przywracamy stan sprzed.
+    """
+    get_option = streamlit_config.get_option
+    streamlit_config.get_option = build_mock_config_get_option({"global.appTest": True})
+    streamlit_app_test.Runtime = _SharedRuntime
+    try:
+        yield
+    finally:
+        streamlit_app_test.Runtime = Runtime
+        Runtime._instance = None
+        streamlit_config.get_option = get_option
+
+
+def current_rss_bytes():
+    """Bieżące zużycie pamięci procesu (RSS) w bajtach; poza Linuksem - szczytowe."""
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, IndexError):
+        return peak_rss_bytes()
+
+
+def percentiles(latencies):
+    """
+    Podsumowanie czasów rerunów.
+
+    Args:
+        latencies: Czasy w sekundach
+
+    Returns:
+        dict: count, mean_ms, p50_ms, p95_ms, p99_ms, max_ms (None dla pustej listy)
+    """
+    if not latencies:
+        return {'count': 0, 'mean_ms': None, 'p50_ms': None, 'p95_ms': None, 'p99_ms': None, 'max_ms': None}
+    ms = np.asarray(latencies, dtype=float) * 1000
+    p50, p95, p99 = np.percentile(ms, [50, 95, 99])
+    return {
+        'count': len(ms),
+        'mean_ms': float(ms.mean()),
+        'p50_ms': float(p50),
+        'p95_ms': float(p95),
+        'p99_ms': float(p99),
+        'max_ms': float(ms.max()),
+    }
+
+
+def rss_growth(samples):
+    """
+    Przyrost pamięci z próbek (sekundy, liczba rerunów, RSS w bajtach).
+
+    Returns:
+        dict: start_mb, end_mb, max_mb, growth_mb i kb_per_rerun (nachylenie
+        prostej RSS ~ reruny; None, gdy za mało próbek)
+    """
+    if not samples:
+        return {'start_mb': None, 'end_mb': None, 'max_mb': None, 'growth_mb': None, 'kb_per_rerun': None}
+    reruns = np.array([s[1] for s in samples], dtype=float)
+    rss = np.array([s[2] for s in samples], dtype=float)
+    slope = None
+    if len(samples) >= 3 and np.ptp(reruns) > 0:
+        slope = float(np.polyfit(reruns, rss, 1)[0] / 1024)
+    return {
+        'start_mb': rss[0] / 1e6,
+        'end_mb': rss[-1] / 1e6,
+        'max_mb': rss.max() / 1e6,
+        'growth_mb': (rss[-1] - rss[0]) / 1e6,
+        'kb_per_rerun': slope,
+    }
+
+
+class Session:
+    """
+    Jedna sesja przeglądarki: AppTest i losowy scenariusz interakcji.
+
+    Args:
+        seed: Ziarno scenariusza (różne sesje - różne ścieżki)
+        timeout: Limit czasu jednego reruna (s)
+        record: Funkcja (akcja, sekundy, błąd) wywoływana po każdym rerunie
+    """
+
+    def __init__(self, seed, timeout, record):
+        self.rng = random.Random(seed)
+        self.timeout = timeout
+        self.record = record
+        self.at = AppTest.from_file(APP_PATH, default_timeout=timeout)
+
+    def _run(self, action):
+        start = time.perf_counter()
+        error = None
+        try:
+            self.at.run(timeout=self.timeout)
+            if self.at.exception:
+                error = self.at.exception[0].message
+        except Exception as e:  # noqa: BLE001 - błąd sesji liczymy, test trwa dalej
+            error = f"{type(e).__name__}: {e}"
+        self.record(action, time.perf_counter() - start, error)
+
+    def _widget(self, kind, key):
+        try:
+            return getattr(self.at, kind)(key=key)
+        except KeyError:
+            return None
+
+    def _menu(self):
+        # None, gdy strona nie wyrenderowała sidebara (np. błąd reruna)
+        return next((radio for radio in self.at.sidebar.radio if radio.label == MENU_LABEL), None)
+
+    def _open_section(self, section):
+        # Menu EDA, potem sekcja (każde przełączenie to osobny rerun)
+        menu = self._menu()
+        if menu is not None and menu.value != MENU_EDA:
+            menu.set_value(MENU_EDA)
+            self._run('menu')
+        radio = self._widget('radio', 'eda_section')
+        if radio is not None and radio.value != section:
+            radio.set_value(section)
+            self._run('section')
+
+    def _on_widget(self, kind, key):
+        widget = self._widget(kind, key)
+        if widget is None:
+            self._open_section(WIDGET_SECTIONS[key])
+            widget = self._widget(kind, key)
+        return widget
+
+    def start(self):
+        """Pierwszy rerun sesji (wejście na stronę)."""
+        self._run('start')
+
+    def step(self):
+        """Wykonuje jedną losową interakcję (z ewentualnym przełączeniem sekcji)."""
+        action = self.rng.choices(list(ACTIONS), weights=list(ACTIONS.values()))[0]
+        if self._menu() is None:
+            # Poprzedni rerun bez strony - "odśwież" (błąd już policzony)
+            action = 'retry'
+        elif action == 'menu':
+            self._menu().set_value(self.rng.choice([MENU_HOME, MENU_EDA, MENU_EDA, MENU_MODEL]))
+        elif action == 'section':
+            self._open_section(self.rng.choice(list(EDA_SECTION_LABELS)))
+            return
+        elif action == 'min_count':
+            widget = self._on_widget('slider', 'top_jobs_min_count')
+            if widget is None:
+                return
+            widget.set_value(self.rng.randrange(10, 301, 10))
+        elif action == 'cutoff':
+            widget = self._on_widget('slider', 'distribution_cutoff')
+            if widget is None:
+                return
+            widget.set_value(self.rng.randint(0, 10))
+        elif action == 'job':
+            widget = self._on_widget('selectbox', 'selected_job')
+            if widget is None or not widget.options:
+                return
+            widget.set_value(self.rng.choice(widget.options))
+        elif action == 'countries':
+            widget = self._on_widget('multiselect', 'geo_countries')
+            if widget is None:
+                return
+            selected = list(widget.value)
+            others = [c for c in widget.options if c not in selected]
+            if len(selected) > 1 and (not others or self.rng.random() < 0.5):
+                widget.unselect(self.rng.choice(selected))
+            elif others:
+                widget.select(self.rng.choice(others))
+        self._run(action)
+
+
+def run_load_test(sessions=4, steps=20, think=0.0, seed=0, timeout=DEFAULT_TIMEOUT,
+                  sample_interval=RSS_SAMPLE_INTERVAL):
+    """
+    Uruchamia równoczesne sesje na app/app.py i zbiera czasy rerunów i RSS.
+
+    Args:
+        sessions: Liczba równoczesnych sesji (wątków)
+        steps: Liczba interakcji na sesję (po pierwszym rerunie)
+        think: Średni czas "namysłu" użytkownika między interakcjami (s)
+        seed: Ziarno scenariuszy (sesja i dostaje seed + i)
+        timeout: Limit czasu jednego reruna (s)
+        sample_interval: Co ile sekund próbkować RSS
+
+    Returns:
+        dict: Raport (patrz report/print_report)
+    """
+    # Świeża replika: zimne cache procesu, dane ze ścieżki z EDA_DATA_PATH
+    st.cache_resource.clear()
+    st.cache_data.clear()
+
+    lock = threading.Lock()
+    reruns = []   # (akcja, sekundy, błąd)
+    samples = []  # (sekundy od startu, liczba rerunów, RSS)
+
+    def record(action, seconds, error):
+        with lock:
+            reruns.append((action, seconds, error))
+
+    def session(i, barrier):
+        user = Session(seed + i, timeout, record)
+        barrier.wait()
+        user.start()
+        for _ in range(steps):
+            if think:
+                time.sleep(user.rng.uniform(0, 2 * think))
+            try:
+                user.step()
+            except Exception as e:  # noqa: BLE001 - np. widget bez oczekiwanych opcji
+                record('step', 0.0, f"{type(e).__name__}: {e}")
+
+    done = threading.Event()
+    wall_start = time.perf_counter()
+
+    def sampler():
+        while True:
+            samples.append((time.perf_counter() - wall_start, len(reruns), current_rss_bytes()))
+            if done.wait(sample_interval):
+                break
+        samples.append((time.perf_counter() - wall_start, len(reruns), current_rss_bytes()))
+
+    barrier = threading.Barrier(sessions)
+    threads = [
+        threading.Thread(target=session, args=(i, barrier), name=f"load-session-{i}", daemon=True)
+        for i in range(sessions)
+    ]
+    monitor = threading.Thread(target=sampler, name="load-rss", daemon=True)
+    monitor.start()
+    with concurrent_app_tests():
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    wall = time.perf_counter() - wall_start
+    done.set()
+    monitor.join()
+    return report(reruns, samples, wall, sessions)
+
+
+def report(reruns, samples, wall, sessions):
+    """Składa raport z listy rerunów (akcja, sekundy, błąd) i próbek RSS."""
+    warm = [(action, seconds) for action, seconds, _ in reruns if action != 'start']
+    actions = sorted({action for action, _, _ in reruns})
+    # RSS po rozgrzaniu (wszystkie sesje po pierwszym rerunie) - przyrost z pracy, nie z ładowania danych
+    starts = sum(action == 'start' for action, _, _ in reruns)
+    steady = [s for s in samples if s[1] >= starts] or samples
+    return {
+        'sessions': sessions,
+        'wall_seconds': wall,
+        'reruns': len(reruns),
+        'throughput_rps': len(warm) / wall if wall else 0.0,
+        'errors': [error for _, _, error in reruns if error],
+        'overall': percentiles([seconds for _, seconds in warm]),
+        'actions': {
+            action: percentiles([seconds for name, seconds, _ in reruns if name == action])
+            for action in actions
+        },
+        'rss': rss_growth(steady),
+        'rss_timeline': [
+            {'seconds': round(t, 2), 'reruns': n, 'rss_mb': round(rss / 1e6, 1)} for t, n, rss in samples
+        ],
+    }
+
+
+def _fmt(value):
+    return "-" if value is None else f"{value:8.1f}"
+
+
+def print_report(result):
+    print(f"\n🚦 {result['sessions']} sesji · {result['reruns']} rerunów w {result['wall_seconds']:.1f} s "
+          f"· {result['throughput_rps']:.2f} rerunów/s")
+    print(f"{'akcja':<12} {'n':>5} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'max ms':>8}")
+    for name, stats in [('* ogółem', result['overall'])] + list(result['actions'].items()):
+        print(f"{name:<12} {stats['count']:>5} {_fmt(stats['p50_ms'])} {_fmt(stats['p95_ms'])} "
+              f"{_fmt(stats['p99_ms'])} {_fmt(stats['max_ms'])}")
+    rss = result['rss']
+    if rss['start_mb'] is not None:
+        per_rerun = "-" if rss['kb_per_rerun'] is None else f"{rss['kb_per_rerun']:.1f} KB/rerun"
+        print(f"\n💾 RSS: {rss['start_mb']:.0f} → {rss['end_mb']:.0f} MB (max {rss['max_mb']:.0f}, "
+              f"przyrost {rss['growth_mb']:+.1f} MB, {per_rerun})")
+    if result['errors']:
+        print(f"\n❌ Błędy: {len(result['errors'])} (pierwszy: {result['errors'][0]})")
+
+
+def check(result, max_p95_ms=None, max_rss_growth_mb=None):
+    """Lista przekroczonych progów (pusta = OK); błędy rerunów zawsze są porażką."""
+    failures = []
+    if result['errors']:
+        failures.append(f"{len(result['errors'])} rerunów z błędem")
+    p95 = result['overall']['p95_ms']
+    if max_p95_ms is not None and p95 is not None and p95 > max_p95_ms:
+        failures.append(f"p95 {p95:.0f} ms > {max_p95_ms:.0f} ms")
+    growth = result['rss']['growth_mb']
+    if max_rss_growth_mb is not None and growth is not None and growth > max_rss_growth_mb:
+        failures.append(f"przyrost RSS {growth:.1f} MB > {max_rss_growth_mb:.1f} MB")
+    return failures
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Test obciążenia: równoczesne sesje dashboardu")
+    parser.add_argument('--sessions', type=int, default=4, help="liczba równoczesnych sesji")
+    parser.add_argument('--steps', type=int, default=20, help="interakcje na sesję")
+    parser.add_argument('--think', type=float, default=0.0, help="średni czas między interakcjami (s)")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--rows', choices=SIZES, help="dane syntetyczne zamiast pliku z data/")
+    parser.add_argument('--timeout', type=float, default=DEFAULT_TIMEOUT, help="limit czasu reruna (s)")
+    parser.add_argument('--json', help="zapis pełnego raportu (z osią czasu RSS) do pliku")
+    parser.add_argument('--max-p95-ms', type=float, help="próg p95 reruna → kod wyjścia 1")
+    parser.add_argument('--max-rss-growth-mb', type=float, help="próg przyrostu RSS → kod wyjścia 1")
+    args = parser.parse_args(argv)
+
+    streamlit_config.get_option('logger.level')
+    streamlit_logger.set_log_level(logging.CRITICAL)
+
+    with tempfile.TemporaryDirectory() as directory:
+        if args.rows:
+            path = os.path.join(directory, 'salaries.csv')
+            write_dataset(make_salaries(SIZES[args.rows]), path)
+            os.environ['EDA_DATA_PATH'] = path
+        result = run_load_test(args.sessions, args.steps, args.think, args.seed, args.timeout)
+
+    print_report(result)
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(result, f, indent=2, ensure_ascii=False)
+    failures = check(result, args.max_p95_ms, args.max_rss_growth_mb)
+    for failure in failures:
+        print(f"⚠️ {failure}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,90 @@
+# ⏱️ BENCHMARK: Przepustowość parsowania formatów danych
+
+# Zapisuje te same dane w każdym formacie z rejestru src/data_loader.FORMATS
+# (+ warianty gzip/zstd) i mierzy czas wczytania przez load_data (bez sidecara).
+# Pozwala wybrać najszybszy / najmniejszy format dla danego wdrożenia.
+
+# Uruchomienie (z głównego katalogu projektu):
+#   python -m benchmarks.parse_formats --rows 1000000
+#   python -m benchmarks.parse_formats --source data/DataScience_salaries_2025.csv
+
+import argparse
+import os
+import tempfile
+import time
+
+import pandas as pd
+
+from benchmarks.synthetic import make_salaries
+from src.data_loader import load_data, write_dataset
+
+# Rozszerzenie pliku → wariant formatu (format + opcjonalna kompresja)
+DEFAULT_VARIANTS = [
+    '.csv', '.csv.gz', '.csv.zst',
+    '.ndjson', '.ndjson.gz', '.json',
+    '.parquet', '.feather',
+]
+
+
+def benchmark_formats(df, directory, variants=DEFAULT_VARIANTS, repeats=3):
+    """
+    Mierzy czas zapisu i najlepszy z `repeats` czasów odczytu dla każdego wariantu.
+
+    Args:
+        df: Dane do zapisania (schemat SCHEMA)
+        directory: Katalog na pliki tymczasowe
+        variants: Lista rozszerzeń (np. '.csv.gz')
+        repeats: Liczba powtórzeń odczytu
+
+    Returns:
+        pd.DataFrame: format, MB, zapis (s), odczyt (s), wiersze/s, MB/s
+    """
+    results = []
+    for ext in variants:
+        path = os.path.join(directory, f"salaries{ext}")
+        try:
+            start = time.perf_counter()
+            write_dataset(df, path)
+            write_seconds = time.perf_counter() - start
+        except ImportError as e:
+            # Np. brak zstandard - pomijamy wariant zamiast przerywać pomiar
+            print(f"Pomijam {ext}: {e}")
+            continue
+
+        timings = []
+        for _ in range(repeats):
+            start = time.perf_counter()
+            loaded = load_data(path, sidecar=None)
+            timings.append(time.perf_counter() - start)
+        assert len(loaded) == len(df)
+
+        megabytes = os.path.getsize(path) / 1e6
+        best = min(timings)
+        results.append({
+            'format': ext,
+            'MB': round(megabytes, 2),
+            'zapis (s)': round(write_seconds, 3),
+            'odczyt (s)': round(best, 3),
+            'wiersze/s': int(len(df) / best),
+            'MB/s': round(megabytes / best, 1),
+        })
+    return pd.DataFrame(results).sort_values('odczyt (s)', ignore_index=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Porównanie szybkości parsowania formatów danych")
+    parser.add_argument('--rows', type=int, default=1_000_000, help="liczba wierszy danych syntetycznych")
+    parser.add_argument('--source', help="zamiast danych syntetycznych: istniejący plik z danymi")
+    parser.add_argument('--repeats', type=int, default=3)
+    parser.add_argument('--formats', nargs='+', default=DEFAULT_VARIANTS, help="np. .csv .parquet")
+    args = parser.parse_args()
+
+    df = load_data(args.source, sidecar=None) if args.source else make_salaries(args.rows)
+    with tempfile.TemporaryDirectory() as directory:
+        results = benchmark_formats(df, directory, args.formats, args.repeats)
+    print(f"Wierszy: {len(df):,}")
+    print(results.to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
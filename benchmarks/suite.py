@@ -0,0 +1,331 @@
+# ⏱️ BENCHMARK: Zestaw pomiarów EDA bez przeglądarki (headless)
+
+# Dla syntetycznych danych 10k / 1M / 10M wierszy (benchmarks/synthetic.py)
+# mierzy kolejne etapy dashboardu:
+# - load_data (parsowanie CSV, odczyt sidecara Parquet)
+# - budowę kostki agregatów, indeksu filtrów i kostki widoku po filtrach
+# - rankingi top-N po dopisaniu danych: przyrostowo (merged) vs od nowa
+# - każdą sekcję z src/eda.EDA_SECTIONS (Streamlit w trybie "bare" - widgety
+#   zwracają wartości domyślne, wykresy nie są wysyłane)
+# - całą stronę sekwencyjnie i z pulą wątków (src/parallel.py)
+# - każdy builder z src/visualization/charts.py i maps.py
+
+# Dla każdego etapu: czas (s), szczytowa pamięć (MB, tracemalloc - sterta
+# Pythona/NumPy; bufory Arrow nie są liczone) i rozmiar JSON wykresów (bajty).
+# Wyniki porównujemy z zapisanym baseline - regresja kończy się kodem 1.
+# Etap bez wpisu w baseline (nowy etap, nowa sekcja) też kończy się kodem 1:
+# zmiana dodająca etap zapisuje go (--add-missing), a zmiana świadomie
+# zmieniająca koszt - cały baseline (--update-baseline) w tym samym commicie;
+# inaczej etap nie byłby pilnowany.
+
+# "Na zimno" = bez żadnej warstwy pamięci: rollupów kostki, wykresów
+# (FIGURE_CACHE, bez drugiego poziomu na dysku), indeksów stanowisk i
+# rankingów - tak, jak pierwszy rerun po wczytaniu nowej wersji danych.
+
+# Uruchomienie (z głównego katalogu projektu):
+#   python -m benchmarks.suite --sizes 10k 1M
+#   python -m benchmarks.suite --sizes 10k 1M 10M --update-baseline
+#   python -m benchmarks.suite --sizes 10k 1M 10M --add-missing   # tylko nowe etapy
+
+import argparse
+import gc
+import json
+import logging
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import pandas as pd
+from streamlit import config as streamlit_config, logger as streamlit_logger
+
+from benchmarks.synthetic import make_salaries
+from src.aggregates import SalaryCube
+from src.data_loader import load_data, write_dataset
+from src.eda import EDA_SECTIONS, show_eda
+from src.figure_cache import FIGURE_CACHE
+from src.filters import FilterIndex
+from src.job_index import clear_job_indexes
+from src.parallel import SectionExecutor
+from src.rankings import Ranking, clear_rankings
+from src.visualization.charts import (
+    create_salary_trend_chart,
+    create_top_jobs_chart,
+    create_salary_distribution_chart,
+    create_country_comparison_chart,
+    create_job_trend_chart
+)
+from src.visualization.maps import create_world_map, create_company_vs_employee_maps
+
+BASELINE_PATH = os.path.join(os.path.dirname(__file__), 'baseline.json')
+
+SIZES = {'10k': 10_000, '1M': 1_000_000, '10M': 10_000_000}
+
+# Progi regresji: względne + bezwzględne (szum pomiaru krótkich etapów)
+TIME_TOLERANCE = 0.25
+MIN_TIME_DELTA = 0.05
+MEMORY_TOLERANCE = 0.25
+MIN_MEMORY_DELTA_MB = 2.0
+JSON_TOLERANCE = 0.05
+
+# Dopisanie danych w etapach rankings:* (liczba wierszy delty) i kolumny rankingów z src/analytics.py
+APPEND_ROWS = 1000
+RANKING_COLUMNS = ('job_title', 'company_location')
+
+
+def _figure_bytes(figure):
+    figures = figure if isinstance(figure, tuple) else (figure,)
+    return sum(len(fig.to_json()) for fig in figures)
+
+
+def measure(func, memory=True):
+    """
+    Mierzy jedno wywołanie: czas (bez narzutu tracemalloc) i osobno szczyt pamięci.
+
+    Args:
+        func: Funkcja bez argumentów; wywoływana raz albo dwa razy (memory=True)
+        memory: Czy mierzyć szczyt pamięci (drugie wywołanie pod tracemalloc)
+
+    Returns:
+        tuple: (wynik pierwszego wywołania, sekundy, szczyt MB lub None)
+    """
+    gc.collect()
+    start = time.perf_counter()
+    result = func()
+    seconds = time.perf_counter() - start
+    peak_mb = None
+    if memory:
+        gc.collect()
+        tracemalloc.start()
+        func()
+        peak_mb = tracemalloc.get_traced_memory()[1] / 1e6
+        tracemalloc.stop()
+    return result, seconds, peak_mb
+
+
+def _chart_inputs(cube):
+    # Wejścia builderów liczone POZA pomiarem - mierzymy samo budowanie wykresów
+    trend = cube.rollup(['work_year']).merge(
+        cube.quantiles((0.5,), ['work_year']).rename(columns={0.5: 'median_salary'}),
+        on='work_year',
+    )
+    jobs = cube.rollup(['job_title'])
+    top10 = jobs[jobs['count'] >= 50].nlargest(10, 'mean_salary')
+    job = jobs.nlargest(1, 'count')['job_title'].iloc[0]
+    locations = cube.rollup(['company_location'])
+    countries = list(locations.nlargest(4, 'count')['company_location'])
+    return {
+        'trend_mean': lambda: create_salary_trend_chart(trend, 'mean'),
+        'trend_median': lambda: create_salary_trend_chart(trend, 'median'),
+        'trend_count': lambda: create_salary_trend_chart(trend, 'count'),
+        'top_jobs': lambda: create_top_jobs_chart(top10),
+        'salary_distribution': lambda: create_salary_distribution_chart(*cube.histogram_bins(60)),
+        'country_comparison': lambda: create_country_comparison_chart(locations, countries),
+        'job_trend': lambda: create_job_trend_chart(
+            cube.rollup(['work_year'], filters={'job_title': [job]}), job
+        ),
+        'world_map': lambda: create_world_map(locations, 'company_location'),
+        'company_vs_employee_maps': lambda: create_company_vs_employee_maps(
+            locations, cube.rollup(['employee_residence'])
+        ),
+    }
+
+
+def run_size(rows, directory, memory=True):
+    """
+    Wykonuje wszystkie etapy dla jednego rozmiaru danych.
+
+    Returns:
+        dict: etap → {'seconds', 'peak_mb', 'json_bytes'}
+    """
+    results = {}
+
+    def record(stage, func, figure=False, reset=None):
+        def call():
+            if reset is not None:
+                reset()
+            return func()
+        result, seconds, peak_mb = measure(call, memory)
+        results[stage] = {
+            'seconds': round(seconds, 4),
+            'peak_mb': None if peak_mb is None else round(peak_mb, 2),
+            'json_bytes': _figure_bytes(result) if figure else None,
+        }
+        return result
+
+    csv_path = os.path.join(directory, f"salaries_{rows}.csv")
+    write_dataset(make_salaries(rows), csv_path)
+
+    df = record('load_data:csv', lambda: load_data(csv_path, sidecar=None))
+    load_data(csv_path)  # zapis sidecara Parquet (poza pomiarem)
+    record('load_data:parquet_sidecar', lambda: load_data(csv_path))
+
+    cube = record('cube:from_frame', lambda: SalaryCube.from_frame(df))
+    record('filters:index', lambda: FilterIndex(df, cube=cube))
+    # Indeks bez pamięci widoków - każdy pomiar liczy widok od nowa
+    index = FilterIndex(df, cube=cube, max_cached_views=0)
+    state = {'experience_level': ['SE'], 'company_location': ['US', 'GB', 'DE', 'PL']}
+    record('filters:view', lambda: index.view(state).frame)
+    # Kostka widoku: wybór komórek kostki bazowej vs przeliczenie z wierszy widoku
+    record('filters:cube', lambda: index.view(state).cube)
+    record('filters:cube_rebuild', lambda: SalaryCube.from_frame(index.view(state).frame))
+
+    # Rankingi po dopisaniu APPEND_ROWS wierszy: od nowa z kostki po scaleniu
+    # vs przyrostowo (src/live_data.py → carry_over) - tylko klucze z delty
+    delta_cube = SalaryCube.from_frame(make_salaries(APPEND_ROWS, seed=7))
+    merged_cube = cube.merge(delta_cube)
+    rankings = {column: Ranking.from_cube(cube, column) for column in RANKING_COLUMNS}
+    record('rankings:rebuild', lambda: [Ranking.from_cube(merged_cube, column) for column in RANKING_COLUMNS])
+    record('rankings:merge', lambda: [
+        rankings[column].merged(Ranking.from_cube(delta_cube, column)) for column in RANKING_COLUMNS
+    ])
+
+    def cold():
+        # Każda sekcja liczona "na zimno": bez żadnej zapamiętanej warstwy
+        cube.clear_cache()
+        clear_job_indexes()
+        clear_rankings()
+        FIGURE_CACHE.clear()
+
+    # Jednorazowa rozgrzewka interpretera (importy Streamlit, pierwszy wykres
+    # Plotly Express) poza pomiarem - inaczej płaci ją pierwsza mierzona sekcja
+    show_eda(df, cube, 'benchmark')
+
+    for key, section in EDA_SECTIONS.items():
+        record(f'section:{key}', lambda: section(df, cube, 'benchmark'), reset=cold)
+        results[f'section:{key}']['json_bytes'] = FIGURE_CACHE.stats()['bytes']
+
+    # Cała strona na zimno: sekcje po kolei vs wyniki liczone naraz na puli wątków
+    record('page:sequential', lambda: show_eda(df, cube, 'benchmark'), reset=cold)
+    executor = SectionExecutor('thread')
+    record('page:thread_pool', lambda: show_eda(df, cube, 'benchmark', executor=executor), reset=cold)
+    executor.shutdown()
+
+    cube.clear_cache()
+    for name, build in _chart_inputs(cube).items():
+        record(f'chart:{name}', build, figure=True)
+    return results
+
+
+def missing(results, baseline):
+    """
+    Etapy bez wpisu w baseline (np. dodane po ostatnim --update-baseline).
+
+    Returns:
+        list: Opisy "rozmiar etap" (pusta lista = wszystkie etapy pilnowane)
+    """
+    return [
+        f"{size} {stage}"
+        for size, stages in results.items()
+        for stage in stages
+        if stage not in baseline.get(size, {})
+    ]
+
+
+def compare(results, baseline):
+    """
+    Porównuje wyniki z baseline.
+
+    Returns:
+        list: Opisy regresji (pusta lista = brak regresji)
+    """
+    regressions = []
+    for size, stages in results.items():
+        for stage, metrics in stages.items():
+            base = baseline.get(size, {}).get(stage)
+            if base is None:
+                continue
+            seconds, base_seconds = metrics['seconds'], base['seconds']
+            if seconds > base_seconds * (1 + TIME_TOLERANCE) and seconds - base_seconds > MIN_TIME_DELTA:
+                regressions.append(f"{size} {stage}: czas {base_seconds:.3f}s → {seconds:.3f}s")
+            peak, base_peak = metrics.get('peak_mb'), base.get('peak_mb')
+            if (
+                peak is not None and base_peak is not None
+                and peak > base_peak * (1 + MEMORY_TOLERANCE) and peak - base_peak > MIN_MEMORY_DELTA_MB
+            ):
+                regressions.append(f"{size} {stage}: pamięć {base_peak:.1f}MB → {peak:.1f}MB")
+            size_bytes, base_bytes = metrics.get('json_bytes'), base.get('json_bytes')
+            if size_bytes is not None and base_bytes and size_bytes > base_bytes * (1 + JSON_TOLERANCE):
+                regressions.append(f"{size} {stage}: JSON {base_bytes:,}B → {size_bytes:,}B")
+    return regressions
+
+
+def _print_results(size, stages):
+    table = pd.DataFrame.from_dict(stages, orient='index')
+    print(f"\n=== {size} wierszy ===")
+    print(table.to_string())
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Headless benchmark dashboardu EDA")
+    parser.add_argument('--sizes', nargs='+', default=['10k', '1M'], choices=list(SIZES))
+    parser.add_argument('--baseline', default=BASELINE_PATH)
+    parser.add_argument('--update-baseline', action='store_true', help="zapisz wyniki jako nowy baseline")
+    parser.add_argument(
+        '--add-missing', action='store_true',
+        help="dopisz do baseline tylko etapy bez wpisu (istniejące progi bez zmian)"
+    )
+    parser.add_argument('--no-memory', action='store_true', help="bez pomiaru pamięci (o połowę szybciej)")
+    parser.add_argument('--output', help="zapisz wyniki do pliku JSON")
+    args = parser.parse_args()
+
+    # Tryb "bare" Streamlit ostrzega przy każdym widgecie - wyciszamy (także loggery
+    # tworzone później); konfigurację wczytujemy najpierw, bo ustawia własny poziom
+    streamlit_config.get_option('logger.level')
+    streamlit_logger.set_log_level(logging.CRITICAL)
+
+    # Bez drugiego poziomu cache wykresów (EDA_CACHE_DIR) - odczyt z dysku to nie "zimny" pomiar
+    FIGURE_CACHE.disk = None
+
+    results = {}
+    with tempfile.TemporaryDirectory() as directory:
+        for size in args.sizes:
+            results[size] = run_size(SIZES[size], directory, memory=not args.no_memory)
+            _print_results(size, results[size])
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+
+    baseline = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+
+    if args.update_baseline or args.add_missing:
+        for size, stages in results.items():
+            if args.update_baseline:
+                baseline[size] = stages
+            else:
+                known = baseline.setdefault(size, {})
+                known.update({stage: m for stage, m in stages.items() if stage not in known})
+        baseline['meta'] = {
+            'python': platform.python_version(),
+            'pandas': pd.__version__,
+            'machine': platform.machine(),
+        }
+        with open(args.baseline, 'w') as f:
+            json.dump(baseline, f, indent=2, sort_keys=True)
+        print(f"\nZapisano baseline: {args.baseline}")
+        return 0
+
+    regressions = compare(results, baseline)
+    unguarded = missing(results, baseline)
+    if regressions:
+        print("\n❌ Regresje względem baseline:")
+        for line in regressions:
+            print(f"  - {line}")
+    if unguarded:
+        print("\n❌ Etapy bez baseline (dopisz: python -m benchmarks.suite --add-missing):")
+        for line in unguarded:
+            print(f"  - {line}")
+    if regressions or unguarded:
+        return 1
+    print("\n✅ Brak regresji względem baseline")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
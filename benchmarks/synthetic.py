@@ -0,0 +1,56 @@
+# 🧪 MODUŁ: Syntetyczne dane wynagrodzeń do benchmarków
+
+# Generuje tabelę o schemacie src/data_loader.SCHEMA o dowolnej liczbie wierszy.
+# Rozkłady są zbliżone do prawdziwych danych: wynagrodzenia log-normalne,
+# stanowiska i kraje o nierównych częstościach (długi ogon kategorii).
+
+import numpy as np
+import pandas as pd
+
+from src.data_loader import apply_schema
+
+JOB_TITLES = [
+    'Data Scientist', 'Data Engineer', 'Data Analyst', 'Machine Learning Engineer',
+    'Research Scientist', 'Analytics Engineer', 'Data Architect', 'AI Engineer',
+] + [f'Specialist {i}' for i in range(120)]
+
+COUNTRIES = ['US', 'GB', 'CA', 'DE', 'PL', 'FR', 'ES', 'IN', 'NL', 'AU'] + [
+    'AT', 'BE', 'BR', 'CH', 'CZ', 'DK', 'FI', 'IE', 'IT', 'JP', 'MX', 'PT', 'SE', 'SG',
+]
+
+
+def _zipf_choice(rng, values, n, a=1.3):
+    # Częstości malejące jak 1/rank^a - kilka dużych kategorii i długi ogon
+    weights = 1 / np.arange(1, len(values) + 1) ** a
+    return pd.Categorical.from_codes(
+        rng.choice(len(values), n, p=weights / weights.sum()), categories=values
+    )
+
+
+def make_salaries(n, seed=0):
+    """
+    Tworzy syntetyczny DataFrame wynagrodzeń.
+
+    Args:
+        n: Liczba wierszy
+        seed: Ziarno generatora
+
+    Returns:
+        pd.DataFrame: Dane z typami zgodnymi ze SCHEMA
+    """
+    rng = np.random.default_rng(seed)
+    salary_in_usd = np.round(rng.lognormal(11.8, 0.45, n), -2)
+    df = pd.DataFrame({
+        'work_year': rng.choice([2020, 2021, 2022, 2023, 2024, 2025], n, p=[.02, .04, .1, .2, .3, .34]),
+        'experience_level': rng.choice(['EN', 'MI', 'SE', 'EX'], n, p=[.15, .3, .45, .1]),
+        'employment_type': rng.choice(['FT', 'PT', 'CT', 'FL'], n, p=[.97, .01, .015, .005]),
+        'job_title': _zipf_choice(rng, JOB_TITLES, n),
+        'salary': salary_in_usd,
+        'salary_currency': rng.choice(['USD', 'EUR', 'GBP'], n, p=[.85, .1, .05]),
+        'salary_in_usd': salary_in_usd,
+        'employee_residence': _zipf_choice(rng, COUNTRIES, n, a=2.0),
+        'remote_ratio': rng.choice([0, 50, 100], n, p=[.6, .05, .35]),
+        'company_location': _zipf_choice(rng, COUNTRIES, n, a=2.0),
+        'company_size': rng.choice(['S', 'M', 'L'], n, p=[.05, .85, .1]),
+    })
+    return apply_schema(df)
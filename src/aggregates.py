@@ -0,0 +1,464 @@
+# 🧊 MODUŁ: Kostka agregatów (aggregate cube)
+
+# Zamiast liczyć groupby na pełnych danych w każdej sekcji przy każdym rerunie,
+# budujemy RAZ (na wersję danych) tabelę komórek:
+#   work_year × job_title × company_location × employee_residence × experience_level
+# Każda komórka trzyma statystyki "mergowalne":
+#   count, sum, sumsq, min, max
+# Z nich da się złożyć średnią, odchylenie standardowe, min i max dla
+# dowolnego podzbioru kluczy - bez dotykania surowych wierszy.
+
+# Komórek jest wielokrotnie mniej niż wierszy, a wyniki rollup() są
+# dodatkowo zapamiętywane (LRU), więc ruch suwaka to zwykle lookup w słowniku.
+
+# Dodatkowo każda komórka ma histogram wynagrodzeń o drobnych koszykach
+# (HISTOGRAM_BIN_WIDTH), zapisany rzadko: (komórka, koszyk, liczność).
+# histogram(filters) sumuje koszyki wybranych komórek, a rebin() skleja je do
+# rozdzielczości wykresu - do przeglądarki trafiają tylko krawędzie i liczności.
+# Koszyki są mergowalne, więc kostkę można złożyć porcjami
+# (SalaryCube.from_chunks) bez wczytywania całej tabeli do pamięci.
+
+# Mediany i percentyle nie są mergowalne z samych sum - dlatego każda komórka
+# ma też szkic kwantyli (src/sketches.py): ≤ SKETCH_SIZE centroidów.
+# quantiles() łączy szkice wybranych komórek bez sortowania surowych danych.
+
+# UWAGA: zwracane DataFrame są współdzielone - nie modyfikuj ich w miejscu.
+
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+from src.instrumentation import timed
+from src.sketches import compress_centroids, grouped_quantiles
+
+CUBE_KEYS = [
+    'work_year',
+    'job_title',
+    'company_location',
+    'employee_residence',
+    'experience_level',
+]
+
+VALUE_COLUMN = 'salary_in_usd'
+
+# Szerokość drobnego koszyka histogramu (USD)
+HISTOGRAM_BIN_WIDTH = 1000
+
+# Jak łączyć poszczególne statystyki przy scalaniu komórek
+STAT_AGGREGATIONS = {
+    'count': 'sum',
+    'sum': 'sum',
+    'sumsq': 'sum',
+    'min': 'min',
+    'max': 'max',
+}
+
+
+def _freeze_filters(filters):
+    # Klucz słownika z filtrów: {'job_title': ['A', 'B']} → (('job_title', ('A', 'B')),)
+    # Wartości zostają w oryginalnym typie (select filtruje po nich) - 2024 i '2024'
+    # to różne filtry; repr służy tylko do ustalenia kolejności
+    if not filters:
+        return ()
+    return tuple(sorted(
+        (col, tuple(sorted(values, key=repr)))
+        for col, values in filters.items()
+    ))
+
+
+def _with_derived_stats(stats):
+    # Średnia i odchylenie standardowe (próbkowe, jak w pandas) z sum
+    count = stats['count'].to_numpy(dtype=float)
+    total = stats['sum'].to_numpy(dtype=float)
+    sumsq = stats['sumsq'].to_numpy(dtype=float)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        mean = total / count
+        var = (sumsq - total * total / count) / (count - 1)
+    stats['mean_salary'] = mean
+    stats['std_salary'] = np.sqrt(np.clip(var, 0, None))
+    return stats
+
+
+def _sum_bins(cell_ids, bin_ids, counts):
+    # Sumuje liczności o tej samej parze (komórka, koszyk); wynik posortowany
+    cell_ids = np.asarray(cell_ids, dtype=np.int64)
+    bin_ids = np.asarray(bin_ids, dtype=np.int64)
+    if len(cell_ids) == 0:
+        return cell_ids, bin_ids, np.zeros(0, dtype=np.int64)
+    width = int(bin_ids.max()) + 1
+    keys, inverse = np.unique(cell_ids * width + bin_ids, return_inverse=True)
+    summed = np.bincount(inverse, weights=counts).astype(np.int64)
+    return keys // width, keys % width, summed
+
+
+class SalaryHistogram:
+    """Mergowalny histogram o stałej szerokości koszyka (koszyk i = [i*w, (i+1)*w))."""
+
+    def __init__(self, counts=None, bin_width=HISTOGRAM_BIN_WIDTH):
+        self.bin_width = bin_width
+        self.counts = np.zeros(0, dtype=np.int64) if counts is None else counts
+
+    @classmethod
+    def from_values(cls, values, bin_width=HISTOGRAM_BIN_WIDTH):
+        """Buduje histogram z tablicy wartości (wartości ujemne trafiają do koszyka 0)."""
+        values = np.asarray(values, dtype='float64')
+        values = values[~np.isnan(values)]
+        bins = np.clip(values // bin_width, 0, None).astype(np.int64)
+        return cls(np.bincount(bins).astype(np.int64), bin_width)
+
+    @property
+    def total(self):
+        return int(self.counts.sum())
+
+    def merge(self, other):
+        """Zwraca nowy histogram będący sumą dwóch histogramów."""
+        if other.bin_width != self.bin_width:
+            raise ValueError("Nie można scalić histogramów o różnej szerokości koszyka")
+        size = max(len(self.counts), len(other.counts))
+        counts = np.zeros(size, dtype=np.int64)
+        counts[:len(self.counts)] += self.counts
+        counts[:len(other.counts)] += other.counts
+        return SalaryHistogram(counts, self.bin_width)
+
+    def quantile(self, q):
+        """
+        Przybliżony kwantyl (interpolacja liniowa w koszyku).
+
+        Błąd bezwzględny jest nie większy niż szerokość koszyka.
+        """
+        total = self.total
+        if total == 0:
+            return float('nan')
+        cumulative = np.cumsum(self.counts)
+        target = q * total
+        i = int(np.searchsorted(cumulative, target, side='left'))
+        i = min(i, len(self.counts) - 1)
+        below = cumulative[i] - self.counts[i]
+        fraction = (target - below) / self.counts[i] if self.counts[i] else 0.0
+        return (i + fraction) * self.bin_width
+
+    def truncated(self, upper):
+        """Zwraca histogram obcięty do wartości nie większych niż `upper` (±1 koszyk)."""
+        return SalaryHistogram(self.counts[:int(upper // self.bin_width) + 1].copy(), self.bin_width)
+
+    def rebin(self, nbins=60, upper=None):
+        """
+        Łączy drobne koszyki w około `nbins` szerszych koszyków.
+
+        Args:
+            nbins: Docelowa liczba koszyków
+            upper: Opcjonalna górna granica wartości (np. próg cutoff)
+
+        Returns:
+            tuple: (krawędzie koszyków, liczności) - np.ndarray
+        """
+        counts = self.counts
+        if upper is not None:
+            counts = counts[:int(upper // self.bin_width) + 1]
+        nonzero = np.flatnonzero(counts)
+        if len(nonzero) == 0:
+            return np.array([0.0, float(self.bin_width)]), np.zeros(1, dtype=np.int64)
+        first, last = nonzero[0], nonzero[-1] + 1
+        step = max(int(np.ceil((last - first) / nbins)), 1)
+        trimmed = counts[first:last]
+        pad = (-len(trimmed)) % step
+        coarse = np.pad(trimmed, (0, pad)).reshape(-1, step).sum(axis=1)
+        edges = (first + np.arange(len(coarse) + 1) * step) * float(self.bin_width)
+        return edges, coarse
+
+
+class SalaryCube:
+    """Mergowalne agregaty wynagrodzeń po kluczach CUBE_KEYS."""
+
+    def __init__(self, cells, bins=None, centroids=None, max_cached_rollups=256):
+        self.cells = cells
+        # Drobne koszyki histogramu: (numer komórki, numer koszyka, liczność)
+        if bins is None:
+            bins = (np.zeros(0, np.int64), np.zeros(0, np.int64), np.zeros(0, np.int64))
+        self.bins = bins
+        # Szkice kwantyli: (numer komórki, średnia centroidu, waga) posortowane po komórce
+        if centroids is None:
+            centroids = (np.zeros(0, np.int64), np.zeros(0), np.zeros(0))
+        self.centroids = centroids
+        self._rollups = OrderedDict()
+        self._max_cached_rollups = max_cached_rollups
+        self._lock = threading.Lock()
+
+    def __getstate__(self):
+        # Pula procesów (src/parallel.py) kopiuje kostkę bez blokady i zapamiętanych rollupów
+        state = self.__dict__.copy()
+        del state['_lock']
+        state['_rollups'] = OrderedDict()
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    @classmethod
+    @timed('cube:from_frame')
+    def from_frame(cls, df, **kwargs):
+        """Buduje kostkę z DataFrame o schemacie danych wynagrodzeń."""
+        values = df[VALUE_COLUMN].astype('float64')
+        frame = df[CUBE_KEYS].assign(
+            _value=values,
+            _value_sq=values * values,
+        )
+        grouped = frame.groupby(CUBE_KEYS, observed=True, sort=False)
+        cells = grouped.agg(
+            count=('_value', 'count'),
+            sum=('_value', 'sum'),
+            sumsq=('_value_sq', 'sum'),
+            min=('_value', 'min'),
+            max=('_value', 'max'),
+        ).reset_index()
+        # ngroup() z sort=False numeruje grupy w tej samej kolejności co wiersze `cells`;
+        # wiersz z brakującym kluczem nie należy do żadnej komórki (ngroup = NaN)
+        groups = grouped.ngroup()
+        valid = (values.notna() & groups.notna()).to_numpy()
+        cell_ids = groups.to_numpy()[valid].astype(np.int64)
+        raw = values.to_numpy()[valid]
+        bins = _sum_bins(
+            cell_ids,
+            np.clip(raw // HISTOGRAM_BIN_WIDTH, 0, None),
+            np.ones(len(raw)),
+        )
+        centroids = compress_centroids(cell_ids, raw, np.ones(len(raw)))
+        return cls(cells, bins=bins, centroids=centroids, **kwargs)
+
+    @classmethod
+    def from_chunks(cls, chunks, **kwargs):
+        """
+        Składa kostkę z kolejnych porcji danych (np. data_loader.iter_chunks).
+
+        W pamięci jest naraz tylko jedna porcja i komórki kostki.
+        """
+        cube = None
+        for chunk in chunks:
+            part = cls.from_frame(chunk, **kwargs)
+            cube = part if cube is None else cube.merge(part)
+        if cube is None:
+            raise ValueError("Brak danych do zbudowania kostki")
+        return cube
+
+    def merge(self, other):
+        """Zwraca nową kostkę będącą sumą dwóch kostek (np. po dopisaniu danych)."""
+        cells = pd.concat([self.cells, other.cells], ignore_index=True)
+        # Po concat różne zbiory kategorii dają object - przywracamy category
+        for col in CUBE_KEYS:
+            if col != 'work_year' and cells[col].dtype != 'category':
+                cells[col] = cells[col].astype('category')
+        grouped = cells.groupby(CUBE_KEYS, observed=True, sort=False)
+        # Stary numer komórki (w połączonej tabeli) → nowy numer komórki
+        new_ids = grouped.ngroup().to_numpy()
+        cells = grouped.agg(STAT_AGGREGATIONS).reset_index()
+
+        own_ids, own_means, own_weights = self.centroids
+        other_ids, other_means, other_weights = other.centroids
+        centroids = compress_centroids(
+            new_ids[np.concatenate([own_ids, other_ids + len(self.cells)])],
+            np.concatenate([own_means, other_means]),
+            np.concatenate([own_weights, other_weights]),
+        )
+        own_cells, own_bins, own_counts = self.bins
+        other_cells, other_bins, other_counts = other.bins
+        bins = _sum_bins(
+            new_ids[np.concatenate([own_cells, other_cells + len(self.cells)])],
+            np.concatenate([own_bins, other_bins]),
+            np.concatenate([own_counts, other_counts]),
+        )
+        return SalaryCube(
+            cells,
+            bins=bins,
+            centroids=centroids,
+            max_cached_rollups=self._max_cached_rollups,
+        )
+
+    def subset(self, filters):
+        """
+        Kostka tylko z komórek spełniających filtry - bez dotykania surowych wierszy.
+
+        Komórki, koszyki i szkice są przepisywane 1:1, więc wynik jest taki sam
+        jak SalaryCube.from_frame na wierszach spełniających te filtry.
+
+        Args:
+            filters: Słownik {kolumna z CUBE_KEYS: lista wartości}
+
+        Returns:
+            SalaryCube
+        """
+        selected = self.select(filters)
+        # Stary numer komórki → nowy (-1 = komórka odfiltrowana); kolejność zachowana
+        new_ids = np.full(len(self.cells), -1, dtype=np.int64)
+        new_ids[selected.index.to_numpy()] = np.arange(len(selected))
+
+        cell_ids, bin_ids, counts = self.bins
+        keep = new_ids[cell_ids] >= 0
+        bins = (new_ids[cell_ids[keep]], bin_ids[keep], counts[keep])
+        cell_ids, means, weights = self.centroids
+        keep = new_ids[cell_ids] >= 0
+        centroids = (new_ids[cell_ids[keep]], means[keep], weights[keep])
+        return SalaryCube(
+            selected.reset_index(drop=True),
+            bins=bins,
+            centroids=centroids,
+            max_cached_rollups=self._max_cached_rollups,
+        )
+
+    def select(self, filters=None):
+        """Zwraca komórki spełniające filtry {kolumna: lista wartości}."""
+        cells = self.cells
+        if not filters:
+            return cells
+        mask = np.ones(len(cells), dtype=bool)
+        for col, values in filters.items():
+            mask &= cells[col].isin(list(values)).to_numpy()
+        return cells[mask]
+
+    def rollup(self, by=(), filters=None):
+        """
+        Agreguje kostkę do podanych kluczy.
+
+        Args:
+            by: Lista kolumn z CUBE_KEYS (pusta = jeden wiersz z całością)
+            filters: Opcjonalny słownik {kolumna: lista wartości}
+
+        Returns:
+            pd.DataFrame: Kolumny `by` + count, sum, sumsq, min, max,
+            mean_salary, std_salary
+        """
+        by = list(by)
+        key = (tuple(by), _freeze_filters(filters))
+        with self._lock:
+            if key in self._rollups:
+                self._rollups.move_to_end(key)
+                return self._rollups[key]
+
+        cells = self.select(filters)
+        if by:
+            stats = (
+                cells.groupby(by, observed=True)
+                .agg(STAT_AGGREGATIONS)
+                .reset_index()
+            )
+        else:
+            stats = pd.DataFrame([{
+                stat: getattr(cells[stat], how)() for stat, how in STAT_AGGREGATIONS.items()
+            }])
+        stats = _with_derived_stats(stats)
+
+        with self._lock:
+            self._rollups[key] = stats
+            if len(self._rollups) > self._max_cached_rollups:
+                self._rollups.popitem(last=False)
+        return stats
+
+    def quantiles(self, qs=(0.5,), by=(), filters=None):
+        """
+        Przybliżone kwantyle wynagrodzeń ze szkiców komórek.
+
+        Błąd rangi ≤ 1/SKETCH_SIZE dla skompresowanych komórek (szczegóły:
+        src/sketches.py); komórki z ≤ SKETCH_SIZE wierszami są dokładne.
+
+        Args:
+            qs: Kwantyle z przedziału [0, 1]
+            by: Lista kolumn z CUBE_KEYS (pusta = jeden wiersz z całością)
+            filters: Opcjonalny słownik {kolumna: lista wartości}
+
+        Returns:
+            pd.DataFrame: Kolumny `by` + po jednej kolumnie na kwantyl (nazwa = q)
+        """
+        by = list(by)
+        qs = tuple(qs)
+        key = ('quantiles', qs, tuple(by), _freeze_filters(filters))
+        with self._lock:
+            if key in self._rollups:
+                self._rollups.move_to_end(key)
+                return self._rollups[key]
+
+        cells = self.select(filters)
+        # Numer grupy wynikowej dla każdej komórki (-1 = komórka odfiltrowana)
+        cell_groups = np.full(len(self.cells), -1, dtype=np.int64)
+        if by:
+            labels = cells.groupby(by, observed=True).ngroup().to_numpy()
+            result = cells.groupby(by, observed=True).size().reset_index()[by]
+        else:
+            labels = np.zeros(len(cells), dtype=np.int64)
+            result = pd.DataFrame(index=[0])
+        cell_groups[cells.index.to_numpy()] = labels
+
+        cell_ids, means, weights = self.centroids
+        groups = cell_groups[cell_ids]
+        keep = groups >= 0
+        order = np.lexsort((means[keep], groups[keep]))
+        groups, means, weights = groups[keep][order], means[keep][order], weights[keep][order]
+        for q in qs:
+            present, values = grouped_quantiles(groups, means, weights, q)
+            column = np.full(len(result), np.nan)
+            column[present] = values
+            result[q] = column
+
+        with self._lock:
+            self._rollups[key] = result
+            if len(self._rollups) > self._max_cached_rollups:
+                self._rollups.popitem(last=False)
+        return result
+
+    def histogram(self, filters=None):
+        """
+        Histogram wynagrodzeń (drobne koszyki) dla komórek spełniających filtry.
+
+        Args:
+            filters: Opcjonalny słownik {kolumna: lista wartości}
+
+        Returns:
+            SalaryHistogram: Współdzielony (zapamiętany) - nie modyfikuj w miejscu
+        """
+        key = ('histogram', _freeze_filters(filters))
+        with self._lock:
+            if key in self._rollups:
+                self._rollups.move_to_end(key)
+                return self._rollups[key]
+
+        cell_ids, bin_ids, counts = self.bins
+        if filters:
+            selected = np.zeros(len(self.cells), dtype=bool)
+            selected[self.select(filters).index.to_numpy()] = True
+            keep = selected[cell_ids]
+            bin_ids, counts = bin_ids[keep], counts[keep]
+        histogram = SalaryHistogram(np.bincount(bin_ids, weights=counts).astype(np.int64))
+
+        with self._lock:
+            self._rollups[key] = histogram
+            if len(self._rollups) > self._max_cached_rollups:
+                self._rollups.popitem(last=False)
+        return histogram
+
+    def histogram_bins(self, nbins=60, upper=None, filters=None):
+        """
+        Koszyki do wykresu rozkładu: drobny histogram sklejony do `nbins` koszyków.
+
+        Args:
+            nbins: Docelowa liczba koszyków (rozdzielczość wykresu)
+            upper: Opcjonalna górna granica wartości (np. próg cutoff)
+            filters: Opcjonalny słownik {kolumna: lista wartości}
+
+        Returns:
+            tuple: (krawędzie koszyków, liczności) - np.ndarray
+        """
+        return self.histogram(filters).rebin(nbins, upper=upper)
+
+    def clear_cache(self):
+        """Czyści zapamiętane rollupy, kwantyle i histogramy (np. przed pomiarem)."""
+        with self._lock:
+            self._rollups.clear()
+
+    def n_unique(self, column):
+        """Liczba unikalnych wartości klucza obecnych w danych."""
+        return self.cells[column].nunique()
+
+    def values(self, column):
+        """Posortowana lista wartości klucza obecnych w danych."""
+        return sorted(self.cells[column].unique())
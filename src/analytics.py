@@ -0,0 +1,218 @@
+# 🧮 MODUŁ: Warstwa obliczeń EDA (bez Streamlit)
+
+# Wszystkie liczby pokazywane w dashboardzie powstają tutaj - jako zwykłe
+# obiekty wynikowe (NamedTuple / DataFrame), bez żadnego wywołania st.*.
+# Dzięki temu można je:
+# - liczyć poza wątkiem UI (np. równolegle albo w zadaniu wsadowym)
+# - cache'ować niezależnie od renderowania
+# - testować i profilować bez runtime Streamlit
+
+# Wejście każdej funkcji to "zbiór danych": kostka agregatów (SalaryCube)
+# i opcjonalnie surowe wiersze (df) - np. FilterIndex.view(stan).cube / .frame
+# dla wybranych filtrów globalnych. exact=True liczy kwantyle dokładnie z df
+# (wolniej); domyślnie kwantyle pochodzą ze szkiców w kostce.
+
+# Funkcje show_* w src/eda.py tylko renderują te wyniki.
+
+from typing import NamedTuple, Optional
+
+import numpy as np
+import pandas as pd
+
+from src.job_index import existing_job_index, job_index
+from src.rankings import ranking
+
+TOP_JOBS_LIMIT = 10
+
+
+class SummaryStats(NamedTuple):
+    """Podstawowe statystyki całego zbioru."""
+    count: int
+    n_jobs: int
+    n_countries: int
+    mean: float
+    median: float
+    max: float
+    # df.describe() dla kolumn liczbowych (None bez surowych danych)
+    describe: Optional[pd.DataFrame]
+
+
+class JobDetail(NamedTuple):
+    """Statystyki jednego stanowiska + trend po latach."""
+    job_title: str
+    count: int
+    mean: float
+    median: float
+    # work_year, count, mean_salary, ... (SalaryCube.rollup)
+    trend: pd.DataFrame
+
+
+class Distribution(NamedTuple):
+    """Rozkład wynagrodzeń po odcięciu górnych `cutoff`% (koszyki + kwartyle)."""
+    cutoff: int
+    threshold: Optional[float]
+    q1: float
+    q3: float
+    bin_edges: np.ndarray
+    counts: np.ndarray
+
+    @property
+    def iqr(self):
+        return self.q3 - self.q1
+
+
+def _use_exact(df, exact):
+    # Dokładne kwantyle wymagają surowych danych (w trybie out-of-core ich nie ma)
+    return exact and df is not None
+
+
+def summary_stats(cube, df=None, exact=False):
+    """Liczność, średnia, mediana i maksimum wynagrodzeń oraz liczba stanowisk/krajów."""
+    totals = cube.rollup().iloc[0]
+    median = (
+        df['salary_in_usd'].median() if _use_exact(df, exact)
+        else cube.quantiles((0.5,)).iloc[0][0.5]
+    )
+    return SummaryStats(
+        count=int(totals['count']),
+        n_jobs=cube.n_unique('job_title'),
+        n_countries=cube.n_unique('company_location'),
+        mean=float(totals['mean_salary']),
+        median=float(median),
+        max=float(totals['max']),
+        describe=None if df is None else df[['work_year', 'salary', 'salary_in_usd']].describe(),
+    )
+
+
+def yearly_trend(cube, df=None, exact=False, with_median=False):
+    """
+    Statystyki per rok (count, mean_salary, ...).
+
+    Args:
+        with_median: Dołącz kolumnę median_salary (szkice albo dokładnie z df)
+
+    Returns:
+        pd.DataFrame: Wiersz na work_year
+    """
+    trend = cube.rollup(['work_year'])
+    if not with_median:
+        return trend
+    if _use_exact(df, exact):
+        medians = df.groupby('work_year', observed=True)['salary_in_usd'].median()
+    else:
+        medians = cube.quantiles((0.5,), ['work_year']).set_index('work_year')[0.5]
+    return trend.assign(median_salary=trend['work_year'].map(medians).astype(float))
+
+
+def top_jobs(cube, min_count=50, limit=TOP_JOBS_LIMIT):
+    """
+    Najlepiej płatne stanowiska z co najmniej `min_count` rekordami.
+
+    Skan zmaterializowanego rankingu (src/rankings.py) - zmiana progu nie
+    przelicza grupowania ani sortowania.
+
+    Returns:
+        pd.DataFrame: job_title, mean_salary, count - malejąco po średniej
+    """
+    return ranking(cube, 'job_title').top(min_count, limit)
+
+
+def job_detail(cube, job_title, df=None, exact=False):
+    """
+    Średnia, mediana, liczność i trend roczny dla jednego stanowiska.
+
+    Z indeksu stanowisk, jeśli już powstał (wyszukiwanie); inaczej z komórek
+    kostki tego stanowiska - bez budowania indeksu na zimnej ścieżce sekcji.
+    """
+    exact = _use_exact(df, exact)
+    index = existing_job_index(cube, df)
+    if index is not None:
+        count, mean, median = index.stats(job_title, exact=exact)
+        trend = index.trend(job_title)
+    else:
+        job_filter = {'job_title': [job_title]}
+        totals = cube.rollup(filters=job_filter).iloc[0]
+        count, mean = int(totals['count']), float(totals['mean_salary'])
+        median = (
+            df.loc[df['job_title'] == job_title, 'salary_in_usd'].median()
+            if exact
+            else cube.quantiles((0.5,), filters=job_filter).iloc[0][0.5]
+        )
+        trend = cube.rollup(['work_year'], filters=job_filter)
+    return JobDetail(
+        job_title=job_title,
+        count=count,
+        mean=mean,
+        median=float(median),
+        trend=trend,
+    )
+
+
+def job_titles(cube, df=None, query=""):
+    """
+    Stanowiska do wyboru: wszystkie (posortowane) albo wyniki wyszukiwania.
+
+    Pełna lista to wartości klucza kostki; indeks stanowisk (src/job_index.py)
+    powstaje dopiero przy pierwszym wyszukiwaniu.
+    """
+    if query.strip():
+        return job_index(cube, df).search(query)
+    return sorted(map(str, cube.values('job_title')))
+
+
+def location_stats(cube, column='company_location'):
+    """Średnie i liczności per kraj (company_location lub employee_residence)."""
+    return cube.rollup([column])
+
+
+def country_stats(cube, df=None, exact=False):
+    """
+    Tabela krajów (lokalizacja firmy) ze średnią, medianą i licznością.
+
+    Returns:
+        pd.DataFrame: company_location, mean_salary, median_salary, count -
+        malejąco po średniej
+    """
+    stats = ranking(cube, 'company_location').table()
+    if _use_exact(df, exact):
+        medians = df.groupby('company_location', observed=True)['salary_in_usd'].median()
+    else:
+        medians = cube.quantiles((0.5,), ['company_location']).set_index('company_location')[0.5]
+    medians.index = medians.index.astype(str)
+    return (
+        stats.assign(median_salary=stats['company_location'].map(medians).astype(float))
+        [['company_location', 'mean_salary', 'median_salary', 'count']]
+    )
+
+
+def salary_distribution(cube, cutoff=0, nbins=60, df=None, exact=False):
+    """
+    Histogram i kwartyle wynagrodzeń po odcięciu górnych `cutoff`%.
+
+    Po odcięciu zostaje ułamek keep = 1 - cutoff/100 danych, więc kwartyle
+    obciętego rozkładu to kwantyle 0.25·keep i 0.75·keep całego rozkładu.
+
+    Args:
+        cube: SalaryCube z koszykami histogramu i szkicami kwantyli
+        cutoff: Procent najwyższych wynagrodzeń do odcięcia (0-100)
+        nbins: Docelowa liczba koszyków wykresu
+        df: Surowe dane (wymagane dla exact=True)
+        exact: Próg i kwartyle dokładnie z df zamiast ze szkiców
+
+    Returns:
+        Distribution: Próg, kwartyle i koszyki (krawędzie + liczności)
+    """
+    keep = 1 - cutoff / 100
+    if _use_exact(df, exact):
+        salaries = df['salary_in_usd']
+        threshold = float(np.percentile(salaries, 100 - cutoff)) if cutoff else None
+        if threshold is not None:
+            salaries = salaries[salaries <= threshold]
+        q1, q3 = salaries.quantile(0.25), salaries.quantile(0.75)
+    else:
+        quantiles = cube.quantiles((keep, 0.25 * keep, 0.75 * keep)).iloc[0]
+        threshold = float(quantiles[keep]) if cutoff else None
+        q1, q3 = quantiles[0.25 * keep], quantiles[0.75 * keep]
+    # Obcięcie koszyków do progu z dokładnością do drobnego koszyka (HISTOGRAM_BIN_WIDTH)
+    bin_edges, counts = cube.histogram_bins(nbins, upper=threshold)
+    return Distribution(cutoff, threshold, float(q1), float(q3), bin_edges, counts)
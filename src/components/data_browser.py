@@ -0,0 +1,209 @@
+import math
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from src.filters import FilterIndex
+
+# 📑 PRZEGLĄDARKA DANYCH Z PAGINACJĄ
+
+# st.dataframe(df) serializuje CAŁY DataFrame do Arrow i wysyła go do przeglądarki
+# przy każdym rerunie. Tutaj sortowanie, filtrowanie i wybór kolumn dzieją się
+# po stronie serwera, a do przeglądarki trafia tylko widoczne okno (jedna strona).
+
+# Indeks przeglądarki (BrowserIndex) powstaje RAZ na DataFrame (wersję danych
+# lub widok filtrów) i jest zapamiętany w małym LRU:
+# - filtr kraju i wyszukiwanie stanowiska idą przez FilterIndex (src/filters.py)
+#   - wyszukiwanie dopasowuje tylko unikalne nazwy, wiersze biorą się z indeksu
+# - kolejność sortowania całej tabeli liczona raz na (kolumna, kierunek)
+# - posortowane pozycje wierszy zapamiętane per (filtry, wyszukiwanie, sortowanie),
+#   więc zmiana strony to tylko wycinek pozycji + take() jednego okna
+
+PAGE_SIZES = [25, 50, 100, 250]
+
+# Limit zapamiętanych tablic pozycji (kolejności sortowania i wyników zapytań)
+MAX_CACHED_ORDERS = 8
+
+# Zapamiętane indeksy (LRU): DataFrame nie jest hashowalny, więc kluczem jest id(df),
+# a wpis trzyma ramkę (id nie zostanie użyte ponownie, dopóki wpis żyje). Indeks
+# i tak trzyma swoją ramkę, więc limit to też limit ramek przytrzymanych w pamięci
+# (bieżący widok + poprzedni, np. przy przełączaniu filtrów)
+MAX_CACHED_FRAMES = 2
+
+_INDEXES = OrderedDict()
+_INDEXES_LOCK = threading.Lock()
+
+
+class BrowserIndex:
+    """
+    Filtry i kolejności sortowania przeglądarki dla jednego DataFrame.
+
+    Args:
+        df: DataFrame z danymi
+    """
+
+    def __init__(self, df):
+        self.df = df
+        self.filters = FilterIndex(df)
+        self._orders = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _remember(self, key, build):
+        with self._lock:
+            if key in self._orders:
+                self._orders.move_to_end(key)
+                return self._orders[key]
+        value = build()
+        with self._lock:
+            self._orders[key] = value
+            while len(self._orders) > MAX_CACHED_ORDERS:
+                self._orders.popitem(last=False)
+        return value
+
+    def _state(self, filters, search):
+        state = {col: values for col, values in (filters or {}).items() if len(values)}
+        if search:
+            # Dopasowanie tylko po unikalnych nazwach stanowisk, nie po każdym wierszu
+            titles = pd.Index(self.filters.columns['job_title'].categories)
+            matches = titles[titles.astype(str).str.contains(search, case=False, regex=False)]
+            if len(matches) == 0:
+                return None
+            state['job_title'] = list(matches)
+        return state
+
+    def positions(self, filters=None, search=None):
+        """
+        Pozycje wierszy spełniających filtry (rosnąco).
+
+        Returns:
+            np.ndarray lub None, gdy żaden filtr nie jest aktywny
+        """
+        state = self._state(filters, search)
+        if state is None:
+            return np.zeros(0, dtype=np.int64)
+        return self.filters.positions(state)
+
+    def sort_order(self, sort_by, ascending=True):
+        """Pozycje wszystkich wierszy w kolejności sortowania (stabilnie, braki na końcu)."""
+        def build():
+            column = self.df[sort_by].reset_index(drop=True)
+            return column.sort_values(ascending=ascending, kind='stable').index.to_numpy()
+        return self._remember(('sort', sort_by, ascending), build)
+
+    def ordered_positions(self, filters=None, search=None, sort_by=None, ascending=True):
+        """
+        Pozycje wierszy po filtrach w kolejności wyświetlania (zapamiętane).
+
+        Returns:
+            np.ndarray lub None (wszystkie wiersze w kolejności oryginalnej)
+        """
+        key = ('query', self.filters_key(filters), search or None, sort_by, ascending)
+
+        def build():
+            positions = self.positions(filters, search)
+            if sort_by is None:
+                return positions
+            order = self.sort_order(sort_by, ascending)
+            if positions is None:
+                return order
+            keep = np.zeros(len(self.df), dtype=bool)
+            keep[positions] = True
+            return order[keep[order]]
+        return self._remember(key, build)
+
+    @staticmethod
+    def filters_key(filters):
+        return tuple(sorted(
+            (col, tuple(sorted(map(str, values)))) for col, values in (filters or {}).items() if len(values)
+        ))
+
+
+def browser_index(df):
+    """Indeks przeglądarki dla DataFrame (budowany raz, zapamiętany w LRU)."""
+    with _INDEXES_LOCK:
+        index = _INDEXES.get(id(df))
+        if index is not None and index.df is df:
+            _INDEXES.move_to_end(id(df))
+            return index
+    index = BrowserIndex(df)
+    with _INDEXES_LOCK:
+        _INDEXES[id(df)] = index
+        while len(_INDEXES) > MAX_CACHED_FRAMES:
+            _INDEXES.popitem(last=False)
+    return index
+
+
+def query_page(df, page=1, page_size=50, sort_by=None, ascending=True,
+               filters=None, columns=None, search=None):
+    """
+    Zwraca jedną stronę danych po filtrowaniu, sortowaniu i projekcji kolumn.
+
+    Args:
+        df: DataFrame z danymi
+        page: Numer strony (od 1)
+        page_size: Liczba wierszy na stronie
+        sort_by: Kolumna sortowania (None = kolejność oryginalna)
+        ascending: Kierunek sortowania
+        filters: Słownik {kolumna: lista dozwolonych wartości} (kolumny FILTER_COLUMNS)
+        columns: Lista widocznych kolumn (None = wszystkie)
+        search: Fragment tekstu szukany w job_title (bez rozróżniania wielkości liter)
+
+    Returns:
+        tuple: (DataFrame z widocznym oknem, liczba wierszy po filtrach)
+    """
+    positions = browser_index(df).ordered_positions(filters, search, sort_by, ascending)
+    start = (max(page, 1) - 1) * page_size
+    stop = start + page_size
+    if positions is None:
+        window, total = df.iloc[start:stop], len(df)
+    else:
+        window, total = df.take(positions[start:stop]), len(positions)
+    # 📦 PROJEKCJA KOLUMN - do przeglądarki trafiają tylko wybrane kolumny
+    if columns:
+        window = window[list(columns)]
+    return window, total
+
+def render_data_browser(df, key="browser"):
+    """Renderuje przeglądarkę danych z paginacją po stronie serwera."""
+    all_columns = list(df.columns)
+
+    col1, col2, col3 = st.columns([2, 1, 1])
+    columns = col1.multiselect(
+        "Kolumny:", all_columns, default=all_columns, key=f"{key}_columns"
+    )
+    sort_by = col2.selectbox(
+        "Sortuj według:", [None] + all_columns,
+        format_func=lambda c: "—" if c is None else c, key=f"{key}_sort_by"
+    )
+    ascending = col3.toggle("Rosnąco", value=True, key=f"{key}_ascending")
+
+    index = browser_index(df)
+    col4, col5 = st.columns([2, 1])
+    search = col4.text_input("Szukaj stanowiska:", key=f"{key}_search")
+    countries = col5.multiselect(
+        "Kraj firmy:", index.filters.options('company_location'), key=f"{key}_countries"
+    )
+
+    filters = {'company_location': countries}
+    # Pozycje są zapamiętane w indeksie - query_page niżej ich nie liczy ponownie
+    positions = index.ordered_positions(filters, search, sort_by, ascending)
+    total_rows = len(df) if positions is None else len(positions)
+
+    col6, col7 = st.columns([1, 1])
+    page_size = col6.selectbox("Wierszy na stronę:", PAGE_SIZES, index=1, key=f"{key}_page_size")
+    page_count = max(math.ceil(total_rows / page_size), 1)
+    # Po zawężeniu filtrów numer strony może wyjść poza zakres - przycinamy go
+    if st.session_state.get(f"{key}_page", 1) > page_count:
+        st.session_state[f"{key}_page"] = page_count
+    page = col7.number_input(
+        "Strona:", min_value=1, max_value=page_count, key=f"{key}_page"
+    )
+
+    window, _ = query_page(df, page, page_size, sort_by, ascending, filters, columns, search)
+    first_row = (page - 1) * page_size + 1 if len(window) else 0
+    last_row = first_row + len(window) - 1 if len(window) else 0
+    st.caption(f"Wiersze {first_row:,}–{last_row:,} z {total_rows:,} (strona {page} z {page_count})")
+    st.dataframe(window, use_container_width=True)
@@ -0,0 +1,64 @@
+import pandas as pd
+import streamlit as st
+
+from src.instrumentation import prometheus_text
+
+# 🛠️ PANEL DIAGNOSTYCZNY (opt-in)
+
+# Pokazuje profil ostatniego reruna (src/instrumentation.py): czas całkowity,
+# najdroższe spany (sekcje, wykresy, mapowanie krajów, st.plotly_chart),
+# bajty payloadu, trafienia cache i szczytową pamięć procesu.
+# Przełącznik włącza profilowanie od NASTĘPNEGO reruna - stan czytamy
+# z st.session_state na początku skryptu (app.py).
+
+PROFILING_KEY = "debug_profiling"
+
+def profile_table(profile):
+    """
+    Spany profilu zsumowane po nazwie.
+
+    Returns:
+        pd.DataFrame: span, wywołania, ms, KB - malejąco po czasie
+    """
+    spans = pd.DataFrame(profile.spans, columns=["span", "seconds", "bytes"])
+    if spans.empty:
+        return pd.DataFrame(columns=["span", "wywołania", "ms", "KB"])
+    table = spans.groupby("span").agg(
+        wywołania=("seconds", "size"),
+        ms=("seconds", "sum"),
+        KB=("bytes", "sum"),
+    )
+    table["ms"] = (table["ms"] * 1000).round(1)
+    table["KB"] = (table["KB"] / 1024).round(1)
+    return table.sort_values("ms", ascending=False).reset_index()
+
+def render_debug_panel(profile, caches=None):
+    """
+    Renderuje panel diagnostyczny w sidebarze.
+
+    Args:
+        profile: RerunProfile z zakończonego reruna albo None (profilowanie wyłączone)
+        caches: Słownik nazwa → statystyki cache (np. FIGURE_CACHE.stats())
+    """
+    with st.sidebar.expander("🛠️ Diagnostyka", expanded=False):
+        st.toggle("Profiluj reruny", value=False, key=PROFILING_KEY)
+        if profile is None:
+            st.caption("Włącz, aby zobaczyć czasy sekcji i wykresów przy kolejnym rerunie.")
+            return
+
+        col1, col2 = st.columns(2)
+        col1.metric("Rerun", f"{profile.seconds * 1000:,.0f} ms")
+        if profile.peak_rss is not None:
+            col2.metric("Szczyt RSS", f"{profile.peak_rss / 1e6:,.0f} MB")
+        for name, stats in (caches or {}).items():
+            st.caption(
+                f"Cache {name}: trafienia {stats['hit_ratio']:.0%} "
+                f"({stats['hits']}/{stats['hits'] + stats['misses']}), {stats['bytes'] / 1e6:.1f} MB"
+            )
+        st.dataframe(profile_table(profile), use_container_width=True, hide_index=True)
+        st.download_button(
+            "⬇️ Metryki (Prometheus)",
+            prometheus_text(caches),
+            file_name="eda_metrics.txt",
+            mime="text/plain",
+        )
@@ -0,0 +1,142 @@
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from src.prediction import FEATURES, profile_grid
+
+# 🤖 SEKCJA MODEL PREDYKCYJNY
+
+# Rerun niczego nie trenuje: model przychodzi z PredictionEngine
+# (src/prediction.py), który trenuje w tle i oddaje ostatni gotowy model.
+# Tutaj tylko predykcja - pojedynczy profil albo setki scenariuszy naraz
+# (siatka wybranych wartości lub plik CSV z profilami).
+
+FEATURE_LABELS = {
+    'experience_level': 'Doświadczenie',
+    'job_title': 'Stanowisko',
+    'company_location': 'Kraj firmy',
+    'company_size': 'Wielkość firmy',
+    'remote_ratio': 'Praca zdalna (%)',
+    'work_year': 'Rok',
+}
+
+# Maksymalna liczba profili w jednej siatce what-if
+MAX_GRID_PROFILES = 5000
+
+
+def _format_usd(value):
+    return f"${value:,.0f}"
+
+
+def prediction_table(model, profiles):
+    """
+    Profile z predykcją i przedziałem (kolumny gotowe do wyświetlenia).
+
+    Returns:
+        pd.DataFrame: FEATURES + prediction, lower, upper - malejąco po predykcji
+    """
+    predictions = model.predict(profiles)
+    return (
+        pd.concat([profiles.reset_index(drop=True), predictions.reset_index(drop=True)], axis=1)
+        .sort_values('prediction', ascending=False, kind='stable')
+        .reset_index(drop=True)
+    )
+
+
+def _render_single(model):
+    st.subheader("👤 Pojedynczy profil")
+    columns = st.columns(3)
+    profile = {}
+    for i, feature in enumerate(FEATURES):
+        options = model.options(feature)
+        profile[feature] = columns[i % 3].selectbox(
+            FEATURE_LABELS[feature], options, key=f"predict_{feature}",
+            index=len(options) - 1 if feature == 'work_year' else 0,
+        )
+    result = model.predict(pd.DataFrame([profile])).iloc[0]
+    col1, col2, col3 = st.columns(3)
+    col1.metric("Prognoza", _format_usd(result['prediction']))
+    col2.metric(f"Dolna granica ({model.coverage:.0%})", _format_usd(result['lower']))
+    col3.metric(f"Górna granica ({model.coverage:.0%})", _format_usd(result['upper']))
+
+
+def _render_batch(model):
+    st.subheader("🧮 Scenariusze what-if")
+    source = st.radio(
+        "Źródło profili:", ["Siatka wartości", "Plik CSV"], horizontal=True, key="predict_source"
+    )
+    if source == "Siatka wartości":
+        columns = st.columns(3)
+        options = {}
+        for i, feature in enumerate(FEATURES):
+            choices = model.options(feature)
+            default = choices[-1:] if feature == 'work_year' else choices[:2]
+            options[feature] = columns[i % 3].multiselect(
+                FEATURE_LABELS[feature], choices, default=default, key=f"predict_grid_{feature}"
+            )
+        if not all(options.values()):
+            st.info("Wybierz co najmniej jedną wartość każdej cechy.")
+            return
+        profiles = profile_grid(options, limit=MAX_GRID_PROFILES)
+    else:
+        upload = st.file_uploader(
+            f"CSV z kolumnami: {', '.join(FEATURES)}", type="csv", key="predict_upload"
+        )
+        if upload is None:
+            return
+        profiles = pd.read_csv(upload)
+        missing = [feature for feature in FEATURES if feature not in profiles.columns]
+        if missing:
+            st.error(f"Brak kolumn: {', '.join(missing)}")
+            return
+        profiles = profiles[FEATURES]
+
+    table = prediction_table(model, profiles)
+    st.caption(f"{len(table):,} profili")
+    st.dataframe(
+        table.rename(columns={**FEATURE_LABELS, 'prediction': 'Prognoza', 'lower': 'Od', 'upper': 'Do'}),
+        hide_index=True,
+        column_config={
+            name: st.column_config.NumberColumn(format="$%.0f") for name in ('Prognoza', 'Od', 'Do')
+        },
+    )
+    st.download_button(
+        "💾 Pobierz CSV", table.to_csv(index=False), "prognozy.csv", "text/csv", key="predict_download"
+    )
+
+
+def render_prediction_section(engine, df, version_id):
+    """
+    Renderuje sekcję modelu predykcyjnego.
+
+    Args:
+        engine: PredictionEngine (wspólny dla sesji, trenuje w tle)
+        df: Dane treningowe (None w trybie out-of-core)
+        version_id: Identyfikator wersji danych
+    """
+    st.title("🤖 Model Predykcyjny")
+    if df is None:
+        st.info("Tryb out-of-core: model wymaga surowych wierszy - sekcja jest niedostępna.")
+        return
+
+    model, current = engine.model(df, version_id)
+    if engine.error is not None:
+        st.error(f"Trening modelu nie powiódł się: {engine.error}")
+    if model is None:
+        st.info("⏳ Model trenuje się w tle - zwykle to kilka sekund.")
+        st.button("🔄 Sprawdź ponownie", key="predict_refresh")
+        return
+    if not current:
+        st.caption("ℹ️ Model z poprzedniej wersji danych - nowy trenuje się w tle.")
+
+    metrics = model.metrics
+    # Pokrycie zmierzone na resztach wstrzymanych od kalibracji (brak przy bardzo małych danych)
+    measured = "" if np.isnan(metrics.coverage) else f" (pokrycie na danych wstrzymanych: {metrics.coverage:.0%})"
+    st.caption(
+        f"Ridge na log(wynagrodzenia), {metrics.rows:,} rekordów · "
+        f"MAE (walidacja krzyżowa): {_format_usd(metrics.mae)} · "
+        f"przedział {model.coverage:.0%}{measured}"
+    )
+    _render_single(model)
+    st.markdown("---")
+    _render_batch(model)
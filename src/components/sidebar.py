@@ -1,8 +1,52 @@
 import streamlit as st
 
+# 📋 SEKCJE EDA - klucz (anchor / rejestr w src/eda.py) → etykieta w nawigacji
+EDA_SECTION_LABELS = {
+    "dataset_overview": "📊 Przegląd danych",
+    "statistics": "📈 Podstawowe statystyki",
+    "time_trends": "⏳ Trendy wynagrodzeń w czasie",
+    "salary_analysis": "💰 Analiza wynagrodzeń",
+    "geo_analysis": "🌍 Analiza geograficzna",
+    "salary_distribution": "📊 Rozkład wynagrodzeń (USD)",
+}
+
+# 🎛️ GLOBALNE FILTRY - kolumna → etykieta (kolumny jak w src/filters.FILTER_COLUMNS)
+FILTER_LABELS = {
+    "experience_level": "Poziom doświadczenia",
+    "company_size": "Wielkość firmy",
+    "remote_ratio": "Praca zdalna (%)",
+    "company_location": "Kraj firmy",
+    "job_title": "Stanowisko",
+}
+
+VIEW_MODE_SINGLE = "🎯 Wybrana sekcja"
+VIEW_MODE_ALL = "📜 Cała strona"
+
 def render_eda_sidebar():
-    """Renderuje sidebar z nawigacją dla sekcji EDA."""
+    """
+    Renderuje sidebar z nawigacją dla sekcji EDA.
+
+    Returns:
+        str: Klucz wybranej sekcji lub None, gdy renderujemy całą stronę
+    """
     st.sidebar.markdown("## 📚 Nawigacja EDA")
+
+    # ⚡ TRYB LENIWY - liczymy tylko wybraną sekcję (krótszy rerun, mniej danych do przeglądarki)
+    # 📐 Kwantyle (mediany, kwartyle, cutoff) domyślnie ze szkiców - szybko, z błędem rangi ≤ 1%
+    st.sidebar.toggle("Dokładne kwantyle", value=False, key="exact_quantiles")
+    view_mode = st.sidebar.radio(
+        "Tryb wyświetlania:",
+        [VIEW_MODE_SINGLE, VIEW_MODE_ALL],
+        key="eda_view_mode"
+    )
+    if view_mode == VIEW_MODE_SINGLE:
+        return st.sidebar.radio(
+            "Sekcja:",
+            list(EDA_SECTION_LABELS),
+            format_func=EDA_SECTION_LABELS.get,
+            key="eda_section"
+        )
+
     st.sidebar.markdown("""
 - [💼 Analiza Wynagrodzeń 2020–2025](#intro)
 - [📊 Przegląd danych](#dataset_overview)
@@ -17,4 +61,30 @@ def render_eda_sidebar():
   - [📌 Porównanie krajów](#geo_compare)
 - [📊 Rozkład wynagrodzeń (USD)](#salary_distribution)
   - [📈 Statystyki rozkładu](#salary_stats)
-""", unsafe_allow_html=True)
\ No newline at end of file
+""", unsafe_allow_html=True)
+    return None
+
+def render_filter_sidebar(filter_index):
+    """
+    Renderuje globalne filtry w sidebarze.
+
+    Args:
+        filter_index: FilterIndex (src/filters.py) z dostępnymi wartościami
+
+    Returns:
+        dict: Stan filtrów {kolumna: lista wartości, 'work_year': (od, do)}
+    """
+    state = {}
+    with st.sidebar.expander("🎛️ Filtry globalne", expanded=False):
+        years = filter_index.options("work_year")
+        if len(years) > 1:
+            state["work_year"] = st.slider(
+                "Lata:", int(years[0]), int(years[-1]),
+                (int(years[0]), int(years[-1])), key="filter_work_year"
+            )
+        for column, label in FILTER_LABELS.items():
+            if column in filter_index.columns:
+                state[column] = st.multiselect(
+                    f"{label}:", filter_index.options(column), key=f"filter_{column}"
+                )
+    return state
@@ -1,14 +1,514 @@
+# 📥 MODUŁ: Wczytywanie danych
+
+# Schemat kolumn jest zdefiniowany raz (SCHEMA) i używany przy każdym odczycie:
+# - kolumny tekstowe o małej liczbie unikalnych wartości → category
+#   (mniej pamięci, szybsze groupby w src/eda.py)
+# - rok jako int16, remote_ratio jako int8
+# - wynagrodzenia jako float64 (sumy i średnie bez utraty precyzji)
+
+# SIDECAR: przy pierwszym odczycie CSV zapisujemy obok plik Parquet/Feather.
+# Przy kolejnych startach czytamy sidecar (kolumnowy, typowany) zamiast CSV
+# i możemy wczytać tylko potrzebne kolumny (column projection).
+
+# OUT-OF-CORE: iter_chunks() czyta dane porcjami (CSV w kawałkach albo
+# memory-mapped row groups / record batches z sidecara), więc pełna tabela
+# nigdy nie musi być w pamięci naraz.
+
+# FORMATY: rejestr FORMATS (CSV, NDJSON, JSON, Parquet, Feather/Arrow IPC)
+# + kompresja gzip/zstd. Format wybieramy po rozszerzeniu, a gdy to nie
+# wystarcza - po magic bytes (detect_format). Każdy czytnik zwraca ten sam
+# typowany schemat (SCHEMA) i umie czytać porcjami (iter_batches).
+
+# DELTA: read_csv_delta() parsuje tylko bajty dopisane do CSV za znacznikiem
+# (offset w bajtach), a append_rows() dokleja je do tabeli z zachowaniem
+# typów - podstawa przyrostowego odświeżania (src/live_data.py).
+
+# TYLKO DO ODCZYTU: freeze_frame() zwraca tabelę na tych samych buforach,
+# ale z tablicami NumPy zabezpieczonymi przed zapisem - tabela współdzielona
+# przez sesje (DatasetSnapshot) nie może zostać zmieniona w miejscu.
+
+import gzip
+import io
+import os
+
+import numpy as np
 import pandas as pd
+from pandas.api.types import union_categoricals
+
+# 📋 SCHEMAT DANYCH - jedno źródło prawdy o typach kolumn
+SCHEMA = {
+    'work_year': 'int16',
+    'experience_level': 'category',
+    'employment_type': 'category',
+    'job_title': 'category',
+    'salary': 'float64',
+    'salary_currency': 'category',
+    'salary_in_usd': 'float64',
+    'employee_residence': 'category',
+    'remote_ratio': 'int8',
+    'company_location': 'category',
+    'company_size': 'category',
+}
+
+SIDECAR_FORMATS = {
+    'parquet': '.parquet',
+    'feather': '.feather',
+}
+
+
+# 🗜️ KOMPRESJA - rozszerzenie / magic bytes → nazwa kompresji
+COMPRESSION_EXTENSIONS = {
+    '.gz': 'gzip',
+    '.gzip': 'gzip',
+    '.zst': 'zstd',
+    '.zstd': 'zstd',
+}
+
+COMPRESSION_MAGIC = {
+    b'\x1f\x8b': 'gzip',
+    b'\x28\xb5\x2f\xfd': 'zstd',
+}
+
+
+def _has_pyarrow():
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def sidecar_path(path: str, fmt: str = 'parquet'):
+    """Zwraca ścieżkę pliku sidecar dla danego pliku z danymi."""
+    if fmt not in SIDECAR_FORMATS:
+        raise ValueError(f"Nieznany format sidecar: {fmt}")
+    root, ext = os.path.splitext(path)
+    if ext.lower() != '.csv':
+        # salaries.json → salaries.json.parquet (bez kolizji z sidecarem CSV)
+        root = path
+    return root + SIDECAR_FORMATS[fmt]
+
+
+def _sidecar_is_fresh(path, sidecar):
+    # Sidecar jest aktualny, jeśli powstał po ostatniej zmianie CSV
+    return (
+        os.path.exists(sidecar)
+        and os.path.getmtime(sidecar) >= os.path.getmtime(path)
+    )
+
+
+def apply_schema(df):
+    """Rzutuje kolumny DataFrame na typy ze SCHEMA (tylko obecne kolumny)."""
+    # Rzutujemy tylko kolumny o innym typie - pozostałe zostają bez kopii
+    dtypes = {
+        col: dtype for col, dtype in SCHEMA.items()
+        if col in df.columns and df[col].dtype != dtype
+    }
+    return df.astype(dtypes) if dtypes else df
+
+
+def read_csv_typed(source, columns=None):
+    """
+    Wczytuje CSV z jawnymi typami kolumn.
+
+    Args:
+        source: Ścieżka do pliku CSV lub strumień bajtów
+        columns: Opcjonalna lista kolumn do wczytania
+
+    Returns:
+        pd.DataFrame: Dane z typami zgodnymi ze SCHEMA
+    """
+    # Typy podajemy od razu do parsera - bez kopiowania przez .astype()
+    kwargs = {'dtype': SCHEMA, 'usecols': columns}
+    if _has_pyarrow():
+        kwargs['engine'] = 'pyarrow'
+    return pd.read_csv(source, **kwargs)
+
+
+def _project(df, columns):
+    # Wybór kolumn + rzutowanie na SCHEMA (dla formatów bez typów w parserze)
+    if columns is not None:
+        df = df[list(columns)]
+    return apply_schema(df)
+
+
+def _iter_csv_batches(stream, chunksize, columns):
+    # Parser pyarrow nie obsługuje chunksize - porcje czyta silnik C
+    dtypes = {col: dtype for col, dtype in SCHEMA.items() if columns is None or col in columns}
+    yield from pd.read_csv(stream, dtype=dtypes, usecols=columns, chunksize=chunksize)
+
+
+def _read_ndjson(stream, columns):
+    if _has_pyarrow():
+        import pyarrow.json as pj
+
+        return _project(pj.read_json(stream).to_pandas(), columns)
+    return _project(pd.read_json(stream, lines=True, dtype=False), columns)
+
+
+def _iter_ndjson_batches(stream, chunksize, columns):
+    for chunk in pd.read_json(stream, lines=True, dtype=False, chunksize=chunksize):
+        yield _project(chunk, columns)
+
+
+def _read_json_records(stream, columns):
+    return _project(pd.read_json(stream, orient='records', dtype=False), columns)
+
+
+def _iter_json_records_batches(stream, chunksize, columns):
+    # Tablicy JSON nie da się parsować przyrostowo bez parsera strumieniowego -
+    # czytamy całość i dzielimy (do dużych plików lepszy jest NDJSON)
+    df = _read_json_records(stream, columns)
+    for start in range(0, len(df), chunksize):
+        yield df.iloc[start:start + chunksize]
+
+
+def _open_stream(path, compression=None):
+    # Strumień bajtów po dekompresji - czytniki tekstowe nie znają kompresji
+    if compression is None:
+        return open(path, 'rb')
+    if compression == 'gzip':
+        return gzip.open(path, 'rb')
+    if compression == 'zstd':
+        try:
+            import zstandard
+        except ImportError as e:
+            raise ImportError("Odczyt plików .zst wymaga pakietu zstandard") from e
+        return zstandard.open(path, 'rb')
+    raise ValueError(f"Nieznana kompresja: {compression}")
+
+
+class DataFormat:
+    """Format pliku z danymi: rozszerzenia, odczyt całości, odczyt porcjami i zapis."""
+
+    def __init__(self, name, extensions, read, iter_batches, write, columnar=False):
+        self.name = name
+        self.extensions = tuple(extensions)
+        # read(źródło, columns), iter_batches(źródło, chunksize, columns):
+        # źródło = ścieżka dla formatów kolumnowych, strumień bajtów dla tekstowych
+        self.read = read
+        self.iter_batches = iter_batches
+        # write(df, ścieżka, kompresja)
+        self.write = write
+        # Formaty kolumnowe są już typowane i czytane przez memory-map (bez kompresji zewnętrznej)
+        self.columnar = columnar
+
+
+# 🗂️ REJESTR FORMATÓW - nazwa → DataFormat
+FORMATS = {}
+
+
+def register_format(data_format):
+    """Dodaje format do rejestru - load_data/iter_chunks obsłużą go bez zmian."""
+    FORMATS[data_format.name] = data_format
+    return data_format
+
+
+def _format_from_extension(path):
+    # (format lub None, kompresja lub None) wyłącznie z rozszerzeń pliku
+    root, ext = os.path.splitext(str(path).lower())
+    compression = COMPRESSION_EXTENSIONS.get(ext)
+    if compression is not None:
+        root, ext = os.path.splitext(root)
+    fmt = next((f.name for f in FORMATS.values() if ext in f.extensions), None)
+    return fmt, compression
+
+
+def _sniff_format(path, compression):
+    with _open_stream(path, compression) as stream:
+        head = stream.read(64)
+    if head.startswith(b'PAR1'):
+        return 'parquet'
+    if head.startswith(b'ARROW1'):
+        return 'feather'
+    text = head.lstrip()
+    if text.startswith(b'['):
+        return 'json'
+    if text.startswith(b'{'):
+        return 'ndjson'
+    return 'csv'
+
+
+def detect_format(path):
+    """
+    Rozpoznaje format i kompresję pliku - po rozszerzeniu, a gdy to nie
+    wystarcza, po magic bytes (PAR1, ARROW1, gzip, zstd, pierwszy znak JSON).
+
+    Returns:
+        tuple: (nazwa formatu z FORMATS, kompresja lub None)
+    """
+    fmt, compression = _format_from_extension(path)
+    exists = os.path.exists(path)
+    if compression is None and exists:
+        with open(path, 'rb') as f:
+            magic = f.read(4)
+        compression = next(
+            (name for prefix, name in COMPRESSION_MAGIC.items() if magic.startswith(prefix)),
+            None,
+        )
+    # '.json' bywa tablicą rekordów albo NDJSON - rozstrzyga pierwszy znak
+    if exists and fmt in (None, 'json'):
+        sniffed = _sniff_format(path, compression)
+        if fmt is None or sniffed == 'ndjson':
+            fmt = sniffed
+    if fmt is None:
+        raise ValueError(f"Nie rozpoznano formatu pliku: {path}")
+    if compression is not None and FORMATS[fmt].columnar:
+        raise ValueError(f"Format {fmt} nie obsługuje zewnętrznej kompresji: {path}")
+    return fmt, compression
+
+
+def read_typed(path: str, columns=None):
+    """
+    Wczytuje plik w dowolnym formacie z rejestru FORMATS (bez sidecara).
+
+    Args:
+        path: Ścieżka do pliku z danymi
+        columns: Opcjonalna lista kolumn do wczytania
+
+    Returns:
+        pd.DataFrame: Dane z typami zgodnymi ze SCHEMA
+    """
+    fmt, compression = detect_format(path)
+    data_format = FORMATS[fmt]
+    if data_format.columnar:
+        return data_format.read(path, columns)
+    with _open_stream(path, compression) as stream:
+        return data_format.read(stream, columns)
+
+
+def write_dataset(df, path: str):
+    """Zapisuje DataFrame w formacie wynikającym z rozszerzenia (np. .ndjson.gz)."""
+    fmt, compression = _format_from_extension(path)
+    if fmt is None:
+        raise ValueError(f"Nie rozpoznano formatu pliku: {path}")
+    FORMATS[fmt].write(df, path, compression)
+    return path
+
+
+def write_sidecar(df, path: str, fmt: str = 'parquet'):
+    """
+    Zapisuje DataFrame jako sidecar Parquet/Feather obok pliku z danymi.
+
+    Zapis jest atomowy (plik tymczasowy + os.replace), więc równoległe
+    procesy nigdy nie zobaczą niedokończonego pliku.
+
+    Returns:
+        str: Ścieżka zapisanego pliku lub None, jeśli zapis się nie udał
+    """
+    target = sidecar_path(path, fmt)
+    tmp = f"{target}.{os.getpid()}.tmp"
+    try:
+        FORMATS[fmt].write(df, tmp, None)
+        os.replace(tmp, target)
+    except (OSError, ImportError, ValueError):
+        # Brak uprawnień do zapisu lub brak pyarrow - sidecar jest opcjonalny
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        return None
+    return target
+
+
+def read_sidecar(path: str, fmt: str = 'parquet', columns=None):
+    """Wczytuje sidecar Parquet/Feather, opcjonalnie tylko wybrane kolumny."""
+    if fmt == 'parquet':
+        df = pd.read_parquet(path, columns=columns)
+    else:
+        df = pd.read_feather(path, columns=columns)
+    return apply_schema(df)
+
+
+def load_data(path: str, columns=None, sidecar: str = 'parquet'):
+    """
+    Wczytuje dane o wynagrodzeniach z typowanym schematem.
+
+    Args:
+        path: Ścieżka do pliku z danymi (format z rejestru FORMATS)
+        columns: Opcjonalna lista kolumn (column projection)
+        sidecar: 'parquet', 'feather' lub None (wyłącza sidecar)
+
+    Returns:
+        pd.DataFrame: Dane z typami zgodnymi ze SCHEMA
+    """
+    if not os.path.exists(path):
+        raise FileNotFoundError(path)
+
+    # Parquet/Feather są już kolumnowe i typowane - sidecar nic by nie dał.
+    # Sidecar wymaga pyarrow - bez niego zawsze parsujemy plik źródłowy.
+    fmt, _ = detect_format(path)
+    if FORMATS[fmt].columnar or sidecar is None or not _has_pyarrow():
+        return read_typed(path, columns)
+
+    target = sidecar_path(path, sidecar)
+    if _sidecar_is_fresh(path, target):
+        return read_sidecar(target, sidecar, columns)
+
+    # 🐢 PIERWSZY START: parsujemy plik raz i zapisujemy sidecar
+    df = read_typed(path)
+    write_sidecar(df, path, sidecar)
+    if columns is not None:
+        df = df[list(columns)]
+    return df
+
+
+def read_csv_delta(path: str, offset: int):
+    """
+    Wczytuje wiersze dopisane do CSV za pozycją `offset` (w bajtach).
+
+    Parsowane są tylko pełne linie - niedokończony ostatni wiersz (zapis
+    w toku) zostaje na następne wywołanie.
+
+    Args:
+        path: Ścieżka do pliku CSV
+        offset: Pozycja w pliku, do której dane są już wczytane
+
+    Returns:
+        tuple: (DataFrame z nowymi wierszami lub None, nowy offset)
+    """
+    with open(path, 'rb') as f:
+        header = f.readline()
+        f.seek(max(offset, len(header)))
+        data = f.read()
+    end = data.rfind(b'\n') + 1
+    if not data[:end].strip():
+        return None, offset + end
+    # Nagłówek doklejamy do delty, żeby parser znał nazwy i typy kolumn
+    delta = pd.read_csv(io.BytesIO(header + data[:end]), dtype=SCHEMA)
+    return delta, offset + end
+
+
+def append_rows(df, delta):
+    """
+    Dokleja wiersze `delta` do `df` z zachowaniem SCHEMA.
+
+    Kolumny category są łączone przez union_categoricals - kody istniejących
+    wierszy się nie zmieniają, nowe wartości dostają nowe kategorie
+    (zwykły pd.concat dałby object przy różnych zbiorach kategorii).
+    """
+    delta = apply_schema(delta[list(df.columns)])
+    columns = {}
+    for col in df.columns:
+        if isinstance(df[col].dtype, pd.CategoricalDtype):
+            columns[col] = union_categoricals([df[col], delta[col]], ignore_order=True)
+        else:
+            columns[col] = pd.concat([df[col], delta[col]], ignore_index=True)
+    return pd.DataFrame(columns)
+
+
+def _read_only(values):
+    view = values.view()
+    view.flags.writeable = False
+    return view
+
+
+def freeze_frame(df):
+    """
+    Zwraca DataFrame na tych samych buforach co `df`, ale tylko do odczytu.
+
+    Bez kopiowania danych: kolumny liczbowe i kody category to widoki
+    z flagą writeable=False (zapis w miejscu → ValueError), kolumny Arrow
+    są niezmienne same z siebie. Operacje tworzące nowe tablice (filtr,
+    sortowanie, assign) działają normalnie.
+
+    Args:
+        df: DataFrame, którego nikt już nie modyfikuje (np. świeżo wczytany)
+    """
+    columns = {}
+    for col in df.columns:
+        series = df[col]
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            columns[col] = pd.Categorical.from_codes(
+                _read_only(series.array.codes), dtype=series.dtype, validate=False
+            )
+        elif isinstance(series.dtype, np.dtype):
+            columns[col] = _read_only(series.to_numpy())
+        else:
+            columns[col] = series.array
+    return pd.DataFrame(columns, index=df.index, copy=False)
+
+
+def _iter_parquet_batches(path, chunksize, columns):
+    import pyarrow.parquet as pq
+
+    parquet_file = pq.ParquetFile(path, memory_map=True)
+    for batch in parquet_file.iter_batches(batch_size=chunksize, columns=columns):
+        yield apply_schema(batch.to_pandas())
+
+
+def _iter_feather_batches(path, chunksize, columns):
+    import pyarrow as pa
+    import pyarrow.ipc as ipc
+
+    with pa.memory_map(path, 'r') as source:
+        reader = ipc.open_file(source)
+        for i in range(reader.num_record_batches):
+            batch = reader.get_batch(i)
+            if columns is not None:
+                batch = batch.select(list(columns))
+            # Duże record batche dzielimy, żeby trzymać się limitu chunksize
+            for offset in range(0, batch.num_rows, chunksize):
+                yield apply_schema(batch.slice(offset, chunksize).to_pandas())
+
+
+register_format(DataFormat(
+    'csv', ['.csv'], read_csv_typed, _iter_csv_batches,
+    lambda df, path, compression: df.to_csv(path, index=False, compression=compression),
+))
+register_format(DataFormat(
+    'ndjson', ['.ndjson', '.jsonl'], _read_ndjson, _iter_ndjson_batches,
+    lambda df, path, compression: df.to_json(path, orient='records', lines=True, compression=compression),
+))
+register_format(DataFormat(
+    'json', ['.json'], _read_json_records, _iter_json_records_batches,
+    lambda df, path, compression: df.to_json(path, orient='records', compression=compression),
+))
+register_format(DataFormat(
+    'parquet', ['.parquet', '.pq'],
+    lambda path, columns: read_sidecar(path, 'parquet', columns),
+    _iter_parquet_batches,
+    lambda df, path, compression: df.to_parquet(path, index=False),
+    columnar=True,
+))
+register_format(DataFormat(
+    'feather', ['.feather', '.arrow', '.ipc'],
+    lambda path, columns: read_sidecar(path, 'feather', columns),
+    _iter_feather_batches,
+    lambda df, path, compression: df.reset_index(drop=True).to_feather(path),
+    columnar=True,
+))
+
+
+def iter_chunks(path: str, chunksize: int = 500_000, columns=None, sidecar: str = 'parquet'):
+    """
+    Czyta dane porcjami - bez wczytywania całej tabeli do pamięci.
+
+    Jeśli plik jest kolumnowy albo istnieje aktualny sidecar Parquet/Feather,
+    czytamy row groups / record batches przez memory-map; w przeciwnym razie
+    plik źródłowy (po dekompresji) w kawałkach.
+
+    Args:
+        path: Ścieżka do pliku z danymi (format z rejestru FORMATS)
+        chunksize: Maksymalna liczba wierszy w porcji
+        columns: Opcjonalna lista kolumn (column projection)
+        sidecar: 'parquet', 'feather' lub None (zawsze plik źródłowy)
+
+    Yields:
+        pd.DataFrame: Kolejne porcje danych z typami zgodnymi ze SCHEMA
+    """
+    if not os.path.exists(path):
+        raise FileNotFoundError(path)
+
+    fmt, compression = detect_format(path)
+    data_format = FORMATS[fmt]
+    if data_format.columnar:
+        yield from data_format.iter_batches(path, chunksize, columns)
+        return
+
+    if sidecar is not None and _has_pyarrow():
+        target = sidecar_path(path, sidecar)
+        if _sidecar_is_fresh(path, target):
+            yield from FORMATS[sidecar].iter_batches(target, chunksize, columns)
+            return
 
-def load_data(path: str):
-    # Wczytuje plik CSV i konwertuje kolumny do odpowiednich typów.
-    
-    df = pd.read_csv(path)
-
-    # Upewnij się, że salary_in_usd jest float
-    df['salary_in_usd'] = df['salary_in_usd'].astype(float)
-    
-    # work_year jako int
-    df['work_year'] = df['work_year'].astype(int)
-    
-    return df
\ No newline at end of file
+    with _open_stream(path, compression) as stream:
+        yield from data_format.iter_batches(stream, chunksize, columns)
@@ -0,0 +1,283 @@
+# 💽 MODUŁ: Trwały cache na dysku (przeżywa restart, deploy i nowe repliki)
+
+# @st.cache_resource i FIGURE_CACHE żyją w pamięci procesu - każdy restart,
+# deploy albo nowa replika płaciła od nowa za parsowanie danych, kostkę
+# agregatów i wykresy. DiskCache zapisuje te wyniki w katalogu EDA_CACHE_DIR:
+# - ADRESOWANIE TREŚCIĄ: klucz = hash(wersja kodu + klucz wyniku), gdzie klucz
+#   wyniku zawiera hash zawartości pliku danych (file_digest) albo odcisk
+#   danych - ten sam plik i ten sam kod dają ten sam wpis na każdej maszynie
+# - WERSJA KODU: hash plików src/*.py (albo EDA_CODE_VERSION, np. SHA commita)
+#   → po zmianie kodu stare wpisy nie są czytane, tylko wypadają przy eviction
+# - ZAPIS ATOMOWY: plik tymczasowy w tym samym katalogu + os.replace, więc
+#   równoległe procesy nigdy nie czytają połowy wpisu
+# - LIMIT ROZMIARU (EDA_CACHE_MAX_BYTES): proces pamięta łączny rozmiar
+#   wpisów (jeden skan katalogu, potem suma bieżąca przy zapisie); skan
+#   i usuwanie najdawniej używanych wpisów (odczyt odświeża czas modyfikacji
+#   pliku) tylko po przekroczeniu limitu - albo co RESCAN_SECONDS, żeby
+#   uwzględnić wpisy zapisane przez inne procesy/repliki
+
+# Rozgrzanie cache przy budowie obrazu (python -m src.warmup) sprawia,
+# że pierwszy start po deployu czyta gotowe wyniki zamiast liczyć je od zera.
+
+# UWAGA: wpisy to pickle - katalog cache musi być zaufany (jak kod aplikacji).
+
+import functools
+import hashlib
+import logging
+import os
+import pickle
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_BYTES = 1024 * 1024 * 1024
+
+# Porzucone pliki tymczasowe (np. po zabiciu procesu) starsze niż to są usuwane
+STALE_TMP_SECONDS = 3600
+
+# Co ile sekund zapis i tak skanuje katalog (wpisy innych procesów w sumie bieżącej)
+RESCAN_SECONDS = 300
+
+# Porcja odczytu przy liczeniu skrótu pliku
+DIGEST_CHUNK_BYTES = 1024 * 1024
+
+SRC_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Czytane ze zmiennych środowiskowych, bo dziedziczą je też procesy puli sekcji
+CACHE_DIR = os.environ.get("EDA_CACHE_DIR")
+CACHE_MAX_BYTES = int(os.environ.get("EDA_CACHE_MAX_BYTES", DEFAULT_MAX_BYTES))
+
+
+def write_atomic(path, write):
+    """
+    Zapisuje plik atomowo: write(tmp) do pliku tymczasowego, potem os.replace.
+
+    Args:
+        path: Docelowa ścieżka
+        write: Funkcja zapisująca pod podaną ścieżką tymczasową
+    """
+    tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        write(tmp)
+        os.replace(tmp, path)
+    finally:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+
+
+def digest_range(path, start, end, digest=None):
+    """
+    SHA-1 bajtów pliku [start, end), czytanych porcjami DIGEST_CHUNK_BYTES.
+
+    Args:
+        digest: Stan skrótu do kontynuowania (kopiowany - oryginał zostaje bez zmian)
+
+    Returns:
+        hashlib.sha1: Stan skrótu (hexdigest() = odcisk, można go kontynuować)
+    """
+    digest = hashlib.sha1() if digest is None else digest.copy()
+    with open(path, 'rb') as f:
+        f.seek(start)
+        remaining = end - start
+        while remaining > 0:
+            chunk = f.read(min(DIGEST_CHUNK_BYTES, remaining))
+            if not chunk:
+                break
+            digest.update(chunk)
+            remaining -= len(chunk)
+    return digest
+
+
+def file_digest(path):
+    """Hash zawartości pliku (SHA-1) - ten sam na każdej maszynie, niezależny od mtime."""
+    return digest_range(path, 0, os.path.getsize(path)).hexdigest()
+
+
+@functools.lru_cache(maxsize=None)
+def code_version():
+    """
+    Wersja kodu liczącego wyniki: EDA_CODE_VERSION albo hash plików src/**/*.py.
+    """
+    if os.environ.get("EDA_CODE_VERSION"):
+        return os.environ["EDA_CODE_VERSION"]
+    digest = hashlib.sha1()
+    for root, dirs, files in os.walk(SRC_DIR):
+        dirs[:] = sorted(d for d in dirs if d != '__pycache__')
+        for name in sorted(files):
+            if name.endswith('.py'):
+                path = os.path.join(root, name)
+                digest.update(os.path.relpath(path, SRC_DIR).encode())
+                with open(path, 'rb') as f:
+                    digest.update(f.read())
+    return digest.hexdigest()
+
+
+class DiskCache:
+    """
+    Cache wyników (pickle) w katalogu, z limitem rozmiaru i zapisem atomowym.
+
+    Args:
+        directory: Katalog cache (tworzony przy pierwszym zapisie)
+        max_bytes: Limit łącznego rozmiaru wpisów
+        version: Wersja kodu w kluczu (domyślnie code_version())
+    """
+
+    def __init__(self, directory, max_bytes=DEFAULT_MAX_BYTES, version=None):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.version = version or code_version()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        # (liczba wpisów, bajty): skan katalogu + suma bieżąca zapisów tego procesu
+        self._usage = None
+        self._scanned_at = 0.0
+        self._lock = threading.Lock()
+
+    def _path(self, key):
+        digest = hashlib.sha1(repr((self.version, key)).encode()).hexdigest()
+        return os.path.join(self.directory, digest[:2], f"{digest}.pkl")
+
+    def get(self, key, default=None):
+        """Zwraca zapisany wynik albo `default` (brak wpisu lub wpis uszkodzony)."""
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as f:
+                value = pickle.load(f)
+        except FileNotFoundError:
+            with self._lock:
+                self.misses += 1
+            return default
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError) as e:
+            logger.warning("Uszkodzony wpis cache %s: %s", path, e)
+            with self._lock:
+                self.misses += 1
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            return default
+        try:
+            # Czas modyfikacji = ostatnie użycie (kolejność eviction LRU)
+            os.utime(path)
+        except OSError:
+            pass
+        with self._lock:
+            self.hits += 1
+        return value
+
+    def put(self, key, value):
+        """Zapisuje wynik; wpisy większe niż cały limit są pomijane."""
+        payload = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        if len(payload) > self.max_bytes:
+            return
+
+        def write(tmp):
+            with open(tmp, 'wb') as f:
+                f.write(payload)
+
+        path = self._path(key)
+        try:
+            # Nadpisanie istniejącego wpisu zmienia sumę tylko o różnicę rozmiarów
+            previous = os.path.getsize(path)
+        except OSError:
+            previous = None
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            write_atomic(path, write)
+        except OSError as e:
+            # Brak miejsca/uprawnień - cache jest tylko przyspieszeniem
+            logger.warning("Nie udało się zapisać wpisu cache %s: %s", path, e)
+            return
+        with self._lock:
+            scan = self._usage is None or time.monotonic() - self._scanned_at > RESCAN_SECONDS
+            if not scan:
+                count, total = self._usage
+                self._usage = (count + (previous is None), total + len(payload) - (previous or 0))
+                scan = self._usage[1] > self.max_bytes
+        if scan:
+            self._evict()
+
+    def get_or_build(self, key, builder):
+        """Zwraca wynik z dysku albo liczy go (builder()) i zapisuje."""
+        missing = object()
+        value = self.get(key, missing)
+        if value is missing:
+            value = builder()
+            self.put(key, value)
+        return value
+
+    def _entries(self):
+        now = time.time()
+        entries = []
+        for root, _, files in os.walk(self.directory):
+            for name in files:
+                path = os.path.join(root, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                if name.endswith('.pkl'):
+                    entries.append((stat.st_mtime, stat.st_size, path))
+                elif name.endswith('.tmp') and now - stat.st_mtime > STALE_TMP_SECONDS:
+                    try:
+                        os.remove(path)
+                    except OSError:
+                        pass
+        return entries
+
+    def _evict(self):
+        # Pełny skan + sortowanie - tylko po przekroczeniu limitu (albo co RESCAN_SECONDS)
+        entries = sorted(self._entries())
+        total = sum(size for _, size, _ in entries)
+        count = len(entries)
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+            count -= 1
+            with self._lock:
+                self.evictions += 1
+        with self._lock:
+            self._usage = (count, total)
+            self._scanned_at = time.monotonic()
+
+    def stats(self):
+        """Zwraca słownik z licznikami cache (do panelu diagnostycznego)."""
+        if self._usage is None:
+            entries = self._entries()
+            with self._lock:
+                self._usage = (len(entries), sum(size for _, size, _ in entries))
+                self._scanned_at = time.monotonic()
+        with self._lock:
+            total = self.hits + self.misses
+            count, size = self._usage
+            return {
+                'entries': count,
+                'bytes': size,
+                'max_bytes': self.max_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'hit_ratio': self.hits / total if total else 0.0,
+            }
+
+    def clear(self):
+        """Usuwa wszystkie wpisy i zeruje liczniki."""
+        for _, _, path in self._entries():
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+        with self._lock:
+            self.hits = self.misses = self.evictions = 0
+            self._usage = (0, 0)
+
+
+# 🌍 GLOBALNA INSTANCJA - tylko gdy ustawiono EDA_CACHE_DIR
+DISK_CACHE = DiskCache(CACHE_DIR, CACHE_MAX_BYTES) if CACHE_DIR else None
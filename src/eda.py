@@ -11,40 +11,160 @@
 # - show_eda() - główna funkcja orchestrator
 # - Każda podsekcja to osobna funkcja
 # - Użycie st.container() do grupowania
+# - Statystyki grupowe (średnie, liczności) pochodzą z SalaryCube
+#   (src/aggregates.py) - budowanej raz na wersję danych
+# - Liczby liczy czysta warstwa src/analytics.py (bez st.*); funkcje show_*
+#   tylko renderują jej wyniki
+# - EDA_SECTIONS - rejestr sekcji; w trybie leniwym liczymy tylko wybraną
+# - Sekcje dostają już przefiltrowane dane (globalne filtry: src/filters.py)
+# - TRYB OUT-OF-CORE: df = None, wszystko liczymy z kostki (bez surowych wierszy)
+# - Mediany/kwartyle domyślnie ze szkiców kwantyli w kostce (src/sketches.py);
+#   przełącznik "Dokładne kwantyle" w sidebarze wraca do sortowania danych
+# - EDA_SECTION_TASKS - plan niezależnych obliczeń sekcji; z SectionExecutor
+#   (src/parallel.py) liczone równolegle, a renderowane w kolejności strony
+# - Wykresy przechodzą przez cache (src/figure_cache.py) - klucz to odcisk
+#   danych + stan widgetów, więc niezmienione sekcje nie są przebudowywane
 
 
+import time
+
+import plotly.io as pio
 import streamlit as st
-import pandas as pd
-import numpy as np
+from src import analytics
+from src.aggregates import SalaryCube
+from src.figure_cache import cached_figure, dataset_fingerprint
 from src.visualization.charts import (
     create_salary_trend_chart,
     create_top_jobs_chart,
     create_salary_distribution_chart,
-    create_country_comparison_chart
+    create_country_comparison_chart,
+    create_job_trend_chart
 )
 from src.visualization.maps import create_world_map, create_company_vs_employee_maps
 from src.components.menu import show_intro_section
+from src.components.data_browser import render_data_browser
+from src.instrumentation import current_profile, record, span
+from src.parallel import SectionTask, SectionTimeout, resolve
+
+def _plotly_chart(fig, name, container=st):
+    # 🔬 Czas st.plotly_chart (serializacja + wysyłka) jako span; rozmiar payloadu
+    # liczymy tylko przy aktywnym profilu reruna - to dodatkowa serializacja
+    start = time.perf_counter()
+    container.plotly_chart(fig, use_container_width=True)
+    seconds = time.perf_counter() - start
+    payload = len(pio.to_json(fig, validate=False)) if current_profile() is not None else None
+    record(f"plotly_chart:{name}", seconds, payload)
+
+def _exact_quantiles(df, state=None):
+    # Dokładne kwantyle wymagają surowych danych (w trybie out-of-core ich nie ma)
+    state = st.session_state if state is None else state
+    return df is not None and state.get("exact_quantiles", False)
 
 def show_dataset_overview(df):
      
     # 📊 SEKCJA: Przegląd danych
     
     # Pokazuje:
-    # - Raw danych w expanderze (optymalizacja pamięci)
+    # - Raw danych w przeglądarce z paginacją (optymalizacja pamięci)
     # - Podstawowe informacje o dataset
     
     # Uwaga: st.dataframe(df) może być wolne dla dużych datasetów
-    # Dlatego umieszczamy w expanderze (ładowane na żądanie)
+    # Zawartość expandera jest liczona i wysyłana nawet gdy jest zwinięty,
+    # dlatego dane pokazujemy dopiero po włączeniu przełącznika (na żądanie)
+    # i tylko stronami (src/components/data_browser.py)
     
     # 🎯 ANCHOR HTML - pozwala na nawigację wewnątrz strony
     # Streamlit nie ma natywnego routing, więc używamy HTML anchor
     """Pokazuje przegląd danych."""
     st.markdown('<a id="dataset_overview"></a>', unsafe_allow_html=True)
     st.header("📊 Przegląd danych")
-    with st.expander("Rozwiń dane", expanded=False):
-        st.dataframe(df)
+    if df is None:
+        st.info("Tryb out-of-core: surowe dane nie są wczytane do pamięci, dostępne są tylko agregaty.")
+        return
+    if st.toggle("Pokaż dane", value=False, key="overview_show_data"):
+        # 📑 Do przeglądarki trafia tylko widoczna strona, nie cały DataFrame
+        render_data_browser(df, key="overview_browser")
+
+# 🎚️ DOMYŚLNE WARTOŚCI WIDGETÓW - wspólne dla renderowania i planowania zadań
+DEFAULT_MIN_COUNT = 50
+DEFAULT_CUTOFF = 2
+DEFAULT_NBINS = 60
+DEFAULT_COUNTRIES = ["US", "GB", "DE", "PL"]
+TREND_METRICS = {"mean": "Średnie wynagrodzenie", "median": "Mediana", "count": "Liczba ofert"}
+
+# 🧮 OBLICZENIA SEKCJI - funkcje modułu (bez st.*), więc mogą działać na puli
+# wątków/procesów (src/parallel.py). Zwracają wyniki analityki i gotowe wykresy.
+
+def _statistics_result(df, cube, exact):
+    return analytics.summary_stats(cube, df, exact=exact)
+
+def _trend_figure(df, cube, fingerprint, metric, exact):
+    if metric == "median":
+        return cached_figure(
+            fingerprint, 'salary_trend', ('median', exact),
+            lambda: create_salary_trend_chart(
+                analytics.yearly_trend(cube, df, exact=exact, with_median=True), 'median'
+            )
+        )
+    return cached_figure(
+        fingerprint, 'salary_trend', (metric,),
+        lambda: create_salary_trend_chart(analytics.yearly_trend(cube), metric)
+    )
 
-def show_statistics(df):
+def _top_jobs_result(cube, fingerprint, min_count):
+    top10 = analytics.top_jobs(cube, min_count)
+    fig = cached_figure(fingerprint, 'top_jobs', (min_count,), lambda: create_top_jobs_chart(top10))
+    return top10, fig
+
+def _job_detail_result(df, cube, fingerprint, job, exact):
+    detail = analytics.job_detail(cube, job, df, exact=exact)
+    fig = None
+    if not detail.trend.empty:
+        fig = cached_figure(
+            fingerprint, 'job_trend', (job,),
+            lambda: create_job_trend_chart(detail.trend, job)
+        )
+    return detail, fig
+
+def _country_table_result(df, cube, exact):
+    return analytics.country_stats(cube, df, exact=exact)
+
+def _world_map_result(cube, fingerprint):
+    location_stats = analytics.location_stats(cube, "company_location")
+    fig = cached_figure(
+        fingerprint, 'world_map', ('company_location',),
+        lambda: create_world_map(location_stats, "company_location")
+    )
+    return location_stats, fig
+
+def _country_comparison_figure(cube, fingerprint, countries):
+    return cached_figure(
+        fingerprint, 'country_comparison', tuple(sorted(countries)),
+        lambda: create_country_comparison_chart(analytics.location_stats(cube), list(countries))
+    )
+
+def _company_vs_employee_figures(cube, fingerprint):
+    return cached_figure(
+        fingerprint, 'company_vs_employee_maps', (),
+        lambda: create_company_vs_employee_maps(
+            analytics.location_stats(cube, "company_location"),
+            analytics.location_stats(cube, "employee_residence"),
+        )
+    )
+
+def _distribution_result(df, cube, fingerprint, cutoff, nbins, exact):
+    distribution = analytics.salary_distribution(cube, cutoff, nbins, df, exact=exact)
+    fig = cached_figure(
+        fingerprint, 'salary_distribution', (cutoff, nbins, exact),
+        lambda: create_salary_distribution_chart(distribution.bin_edges, distribution.counts)
+    )
+    return distribution, fig
+
+def _default_countries(cube):
+    countries = cube.values("company_location")
+    return DEFAULT_COUNTRIES if "US" in countries else countries[:4]
+
+def show_statistics(df, cube, prefetched=None):
     # 📈 SEKCJA: Podstawowe statystyki
     
     # Pokazuje:
@@ -59,25 +179,31 @@ def show_statistics(df):
     st.markdown('<a id="statistics"></a>', unsafe_allow_html=True)
     st.subheader("📈 Podstawowe statystyki")
     
+    # 🧮 Liczby z warstwy obliczeń (src/analytics.py) - tu tylko renderujemy
+    # Mediana ze szkicu kwantyli w kostce (albo dokładna - przełącznik w sidebarze)
+    exact = _exact_quantiles(df)
+    stats = resolve(prefetched, 'statistics', (exact,), _statistics_result, df, cube, exact)
+    
      # 🎪 LAYOUT KOLUMNOWY - responsive design w Streamlit
     col1, col2, col3 = st.columns(3)
-    col1.metric("Liczba rekordów", f"{df.shape[0]:,}", border=True)
-    col2.metric("Unikalne stanowiska", f"{df['job_title'].nunique():,}", border=True)
-    col3.metric("Kraje (firmy)", f"{df['company_location'].nunique():,}", border=True)
+    col1.metric("Liczba rekordów", f"{stats.count:,}", border=True)
+    col2.metric("Unikalne stanowiska", f"{stats.n_jobs:,}", border=True)
+    col3.metric("Kraje (firmy)", f"{stats.n_countries:,}", border=True)
 
     col4, col5, col6 = st.columns(3)
-    col4.metric("Średnie wynagrodzenie", f"{int(df['salary_in_usd'].mean()):,} USD", border=True)
-    col5.metric("Mediana", f"{int(df['salary_in_usd'].median()):,} USD", border=True)
-    col6.metric("Maksymalne", f"{int(df['salary_in_usd'].max()):,} USD", border=True)
+    col4.metric("Średnie wynagrodzenie", f"{int(stats.mean):,} USD", border=True)
+    col5.metric("Mediana", f"{int(stats.median):,} USD", border=True)
+    col6.metric("Maksymalne", f"{int(stats.max):,} USD", border=True)
 
     # 📦 EXPANDER ZE SZCZEGÓŁOWYMI STATYSTYKAMI
     # Pandas .describe() daje pełny przegląd
-    with st.expander("Szczegółowe statystyki", expanded=False):
-        st.write(df[['work_year', 'salary', 'salary_in_usd']].describe())
+    if stats.describe is not None:
+        with st.expander("Szczegółowe statystyki", expanded=False):
+            st.write(stats.describe)
     
     st.divider()
 
-def show_time_trends(df):
+def show_time_trends(df, cube, fingerprint, prefetched=None):
     # ⏳ SEKCJA: Trendy czasowe
     
     # Demonstruje:
@@ -92,24 +218,21 @@ def show_time_trends(df):
     st.markdown('<a id="time_trends"></a>', unsafe_allow_html=True)
     st.header("⏳ Trendy wynagrodzeń w czasie")
     
-    col1, col2, col3 = st.columns(3)
-    
     # 🔘 KAŻDY PRZYCISK WYWOŁUJE RERUN I POKAZUJE INNY WYKRES
-    if col1.button("Średnie wynagrodzenie", use_container_width=True):
-        fig = create_salary_trend_chart(df, 'mean')
-        st.plotly_chart(fig, use_container_width=True)
-    
-    if col2.button("Mediana", use_container_width=True):
-        fig = create_salary_trend_chart(df, 'median')
-        st.plotly_chart(fig, use_container_width=True)
-    
-    if col3.button("Liczba ofert", use_container_width=True):
-        fig = create_salary_trend_chart(df, 'count')
-        st.plotly_chart(fig, use_container_width=True)
+    # 📊 Średnie i liczności z kostki agregatów - bez groupby na surowych danych,
+    # mediany per rok ze szkiców kwantyli (albo dokładne)
+    exact = _exact_quantiles(df)
+    for col, (metric, label) in zip(st.columns(3), TREND_METRICS.items()):
+        if col.button(label, use_container_width=True, key=f"trend_{metric}"):
+            fig = resolve(
+                prefetched, 'trend', (metric, exact),
+                _trend_figure, df, cube, fingerprint, metric, exact
+            )
+            _plotly_chart(fig, f"salary_trend_{metric}")
     
     st.divider()
 
-def show_salary_analysis(df):
+def show_salary_analysis(df, cube, fingerprint, prefetched=None):
     # 💰 SEKCJA: Analiza wynagrodzeń
     
     # Najbardziej złożona sekcja pokazująca:
@@ -128,15 +251,11 @@ def show_salary_analysis(df):
 
     # 🎚️ SLIDER DO FILTROWANIA DANYCH
     # Pokazuje jak dane wejściowe wpływają na wyniki
-    min_count = st.slider("Minimalna liczba rekordów:", 10, 300, 50, 10)
-    
-    job_stats = (
-        df.groupby('job_title')
-        .agg(mean_salary=('salary_in_usd', 'mean'), count=('salary_in_usd', 'count'))
-        .reset_index()
+    min_count = st.slider("Minimalna liczba rekordów:", 10, 300, DEFAULT_MIN_COUNT, 10, key="top_jobs_min_count")
+    top10, fig = resolve(
+        prefetched, 'top_jobs', (min_count,),
+        _top_jobs_result, cube, fingerprint, min_count
     )
-    job_stats_filtered = job_stats[job_stats['count'] >= min_count]
-    top10 = job_stats_filtered.sort_values('mean_salary', ascending=False).head(10)
     
      # 2-KOLUMNOWY LAYOUT: tabela + wykres
     col1, col2 = st.columns(2)
@@ -153,8 +272,7 @@ def show_salary_analysis(df):
     
     with col2:
         # 📈 WYKRES POZIOMY - lepszy dla długich nazw
-        fig = create_top_jobs_chart(top10)
-        st.plotly_chart(fig, use_container_width=True)
+        _plotly_chart(fig, "top_jobs")
     
     st.divider()
     
@@ -162,35 +280,35 @@ def show_salary_analysis(df):
     st.markdown('<a id="salary_detail"></a>', unsafe_allow_html=True)
     st.subheader("🔍 Szczegółowa analiza stanowiska")
     
-    # 🔽 SELECTBOX Z WSZYSTKIMI STANOWISKAMI
-    jobs = sorted(df['job_title'].unique())
-    selected_job = st.selectbox("Wybierz stanowisko:", jobs)
-    
-    # 🎯 FILTROWANIE DANYCH W CZASIE RZECZYWISTYM
-    job_df = df[df['job_title'] == selected_job]
+    # 🔎 WYSZUKIWARKA + SELECTBOX - indeks stanowisk (src/job_index.py):
+    # prefiks / fragment / dopasowanie rozmyte, budowany raz na wersję danych
+    query = st.text_input("Szukaj stanowiska:", key="job_search", placeholder="np. data sci, enginer")
+    options = analytics.job_titles(cube, df, query)
+    if not options:
+        st.info("Brak stanowisk pasujących do wyszukiwania.")
+        st.divider()
+        return
+    selected_job = st.selectbox("Wybierz stanowisko:", options, key="selected_job")
+    # 🎯 MEDIANA: szkic kwantyli (albo dokładna - wycinek wierszy stanowiska z indeksu)
+    exact = _exact_quantiles(df)
+    detail, fig = resolve(
+        prefetched, 'job_detail', (selected_job, exact),
+        _job_detail_result, df, cube, fingerprint, selected_job, exact
+    )
     
      # 📊 3 METRYKI W KOLUMNACH
     colA, colB, colC = st.columns(3)
-    colA.metric("Średnie", f"{int(job_df['salary_in_usd'].mean()):,} USD")
-    colB.metric("Mediana", f"{int(job_df['salary_in_usd'].median()):,} USD")
-    colC.metric("Rekordy", job_df.shape[0])
+    colA.metric("Średnie", f"{int(detail.mean):,} USD")
+    colB.metric("Mediana", f"{int(detail.median):,} USD")
+    colC.metric("Rekordy", detail.count)
     
     # 📈 WYKRES TRENDU DLA WYBRANEGO STANOWISKA
-    trend_data = job_df.groupby('work_year')['salary_in_usd'].mean().reset_index()
-    if not trend_data.empty:
-        import plotly.express as px
-        fig = px.line(
-            trend_data,
-            x='work_year',
-            y='salary_in_usd',
-            title=f"Trend wynagrodzeń — {selected_job}",
-            markers=True
-        )
-        st.plotly_chart(fig, use_container_width=True)
+    if fig is not None:
+        _plotly_chart(fig, "job_trend")
     
     st.divider()
 
-def show_geography_analysis(df):
+def show_geography_analysis(df, cube, fingerprint, prefetched=None):
     # 🌍 SEKCJA: Analiza geograficzna
     
     # Pokazuje zaawansowane features:
@@ -205,17 +323,9 @@ def show_geography_analysis(df):
     # Statystyki krajów
     st.markdown('<a id="geo_global"></a>', unsafe_allow_html=True)
     st.subheader("🌎 Globalne wynagrodzenia według krajów")
-    # Tablica krajów z metrykami
-    country_stats = (
-        df.groupby("company_location")
-        .agg(
-            mean_salary=("salary_in_usd", "mean"), 
-            median_salary=("salary_in_usd", "median"),
-            count=("salary_in_usd", "count")
-        )
-        .reset_index()
-        .sort_values("mean_salary", ascending=False)
-    )
+    # Tablica krajów z metrykami - mediany ze szkiców kwantyli (albo dokładne)
+    exact = _exact_quantiles(df)
+    country_stats = resolve(prefetched, 'country_table', (exact,), _country_table_result, df, cube, exact)
     st.dataframe(
         country_stats.rename(columns={
             "company_location": "Kraj",
@@ -229,22 +339,26 @@ def show_geography_analysis(df):
     # Mapa
     st.markdown('<a id="geo_map"></a>', unsafe_allow_html=True)
     st.subheader("🗺️ Mapa średnich wynagrodzeń")
-    fig = create_world_map(df, "company_location")
-    st.plotly_chart(fig, use_container_width=True)
+    _, fig = resolve(prefetched, 'world_map', (), _world_map_result, cube, fingerprint)
+    _plotly_chart(fig, "world_map")
     
     # Porównanie krajów
     st.markdown('<a id="geo_compare"></a>', unsafe_allow_html=True)
     st.subheader("📌 Porównanie krajów")
-    unique_countries = sorted(df["company_location"].unique())
     selected_countries = st.multiselect(
         "Wybierz kraje do porównania:",
-        unique_countries,
-        default=["US", "GB", "DE", "PL"] if "US" in unique_countries else unique_countries[:4]
+        cube.values("company_location"),
+        default=_default_countries(cube),
+        key="geo_countries"
     )
     # Jeśli wybrano kraje, pokaż wykres porównawczy
     if selected_countries:
-        fig = create_country_comparison_chart(df, selected_countries)
-        st.plotly_chart(fig, use_container_width=True)
+        countries = tuple(sorted(selected_countries))
+        fig = resolve(
+            prefetched, 'country_comparison', countries,
+            _country_comparison_figure, cube, fingerprint, countries
+        )
+        _plotly_chart(fig, "country_comparison")
     
     # Mapa firmy vs pracownika
     st.subheader("🏙️ Lokalizacja pracownika vs lokalizacja firmy")
@@ -254,16 +368,21 @@ def show_geography_analysis(df):
     - 🧑‍💻 **lokalizacją pracownika**
     """)
     
-    fig_company, fig_employee = create_company_vs_employee_maps(df)
-    
-    # 2-KOLUMNOWY LAYOUT DLA MAP
-    colA, colB = st.columns(2)
-    colA.plotly_chart(fig_company, use_container_width=True)
-    colB.plotly_chart(fig_employee, use_container_width=True)
+    # 🗺️ Dwie mapy choropleth to duży payload - budujemy je na żądanie
+    if st.toggle("Pokaż porównanie map", value=False, key="geo_show_maps"):
+        fig_company, fig_employee = resolve(
+            prefetched, 'company_vs_employee_maps', (),
+            _company_vs_employee_figures, cube, fingerprint
+        )
+        
+        # 2-KOLUMNOWY LAYOUT DLA MAP
+        colA, colB = st.columns(2)
+        _plotly_chart(fig_company, "company_map", colA)
+        _plotly_chart(fig_employee, "employee_map", colB)
     
     st.divider()
 
-def show_salary_distribution(df):
+def show_salary_distribution(df, cube, fingerprint, prefetched=None):
     # 📊 SEKCJA: Rozkład wynagrodzeń
     
     # Demonstruje:
@@ -271,43 +390,120 @@ def show_salary_distribution(df):
     # - Histogram z dynamicznym bins
     # - Statystyki pozycyjne (kwartyle)
     # - Integracja NumPy dla obliczeń
+    
+    # ⚡ Histogram z koszyków kostki (SalaryCube.histogram_bins): serwer skleja
+    # drobne koszyki do wybranej rozdzielczości, a do przeglądarki trafiają tylko
+    # krawędzie i liczności - bez surowych wierszy, także w trybie out-of-core.
     """Rozkład wynagrodzeń."""
     st.markdown('<a id="salary_distribution"></a>', unsafe_allow_html=True)
     st.header("📊 Rozkład wynagrodzeń")
     
      # 🎚️ SLIDER DO USUWANIA OUTLIERÓW
     # Pokazuje jak filtrować dane w czasie rzeczywistym
-    cutoff = st.slider("Usuń górne % wynagrodzeń:", 0, 10, 2)
-    
-     # 🎯 FILTROWANIE DANYCH Z NUMPY
-    # percentile() to czysty NumPy - integracja z ekosystemem Python
-    if cutoff > 0:
-        threshold = np.percentile(df['salary_in_usd'], 100 - cutoff)
-        df_plot = df[df['salary_in_usd'] <= threshold].copy()
-    else:
-        df_plot = df.copy()
-    
-     # 📈 HISTOGRAM Z PLOTLY
-    # Pokazuje rozkład po filtracji
-    fig = create_salary_distribution_chart(df_plot)
-    st.plotly_chart(fig, use_container_width=True)
+    cutoff = st.slider("Usuń górne % wynagrodzeń:", 0, 10, DEFAULT_CUTOFF, key="distribution_cutoff")
+    nbins = st.select_slider("Liczba koszyków:", options=[30, 60, 120], value=DEFAULT_NBINS, key="distribution_bins")
+    
+     # 🎯 PRÓG CUTOFF I KWARTYLE: szkic kwantyli z kostki albo dokładny np.percentile
+     # 📈 HISTOGRAM Z PLOTLY - pokazuje rozkład po filtracji
+    exact = _exact_quantiles(df)
+    distribution, fig = resolve(
+        prefetched, 'salary_distribution', (cutoff, nbins, exact),
+        _distribution_result, df, cube, fingerprint, cutoff, nbins, exact
+    )
+    _plotly_chart(fig, "salary_distribution")
     
     # Statystyki
     st.markdown('<a id="salary_stats"></a>', unsafe_allow_html=True)
     st.subheader("📈 Statystyki rozkładu")
-    q1 = int(df_plot['salary_in_usd'].quantile(0.25))
-    q3 = int(df_plot['salary_in_usd'].quantile(0.75))
-    iqr = q3 - q1
     
     # 3 METRYKI W KOLUMNACH
     col1, col2, col3 = st.columns(3)
-    col1.metric("Q1 (25%)", f"{q1:,} USD")
-    col2.metric("Q3 (75%)", f"{q3:,} USD")
-    col3.metric("IQR", f"{iqr:,} USD")
+    col1.metric("Q1 (25%)", f"{int(distribution.q1):,} USD")
+    col2.metric("Q3 (75%)", f"{int(distribution.q3):,} USD")
+    col3.metric("IQR", f"{int(distribution.q3) - int(distribution.q1):,} USD")
+    if df is None:
+        st.caption("Wartości przybliżone ze szkiców kwantyli - tryb out-of-core.")
     
     st.divider()
 
-def show_eda(df):
+# 📋 REJESTR SEKCJI - klucz → odroczone wywołanie (df, cube, fingerprint, prefetched)
+# Kolejność = kolejność na stronie w trybie "Cała strona".
+# Etykiety do nawigacji są w src/components/sidebar.py (EDA_SECTION_LABELS).
+EDA_SECTIONS = {
+    "dataset_overview": lambda df, cube, fingerprint, prefetched=None: show_dataset_overview(df),
+    "statistics": lambda df, cube, fingerprint, prefetched=None: show_statistics(df, cube, prefetched),
+    "time_trends": show_time_trends,
+    "salary_analysis": show_salary_analysis,
+    "geo_analysis": show_geography_analysis,
+    "salary_distribution": show_salary_distribution,
+}
+
+# 🗓️ PLAN ZADAŃ SEKCJI - te same klucze (nazwa, parametry) co resolve() w sekcjach.
+# Stan widgetów czytamy z st.session_state (wartość domyślna, gdy widget jeszcze
+# nie istniał) albo z podanego słownika `state` (np. stany snapshotu,
+# src/snapshot.py). Gdy widget zmieni wartość przy renderowaniu (np. opcja
+# zniknęła po filtrach), resolve() nie znajdzie wyniku i policzy go na miejscu.
+def _widget(state, key, default):
+    return (st.session_state if state is None else state).get(key, default)
+
+def _plan_statistics(df, cube, fingerprint, state=None):
+    exact = _exact_quantiles(df, state)
+    return [SectionTask('statistics', (exact,), _statistics_result, (df, cube, exact))]
+
+def _plan_time_trends(df, cube, fingerprint, state=None):
+    exact = _exact_quantiles(df, state)
+    return [
+        SectionTask('trend', (metric, exact), _trend_figure, (df, cube, fingerprint, metric, exact))
+        for metric in TREND_METRICS if _widget(state, f"trend_{metric}", False)
+    ]
+
+def _plan_salary_analysis(df, cube, fingerprint, state=None):
+    exact = _exact_quantiles(df, state)
+    min_count = _widget(state, "top_jobs_min_count", DEFAULT_MIN_COUNT)
+    tasks = [SectionTask('top_jobs', (min_count,), _top_jobs_result, (cube, fingerprint, min_count))]
+    options = analytics.job_titles(cube, df, _widget(state, "job_search", ""))
+    if options:
+        job = _widget(state, "selected_job", options[0])
+        tasks.append(SectionTask(
+            'job_detail', (job, exact), _job_detail_result, (df, cube, fingerprint, job, exact)
+        ))
+    return tasks
+
+def _plan_geography_analysis(df, cube, fingerprint, state=None):
+    exact = _exact_quantiles(df, state)
+    countries = tuple(sorted(_widget(state, "geo_countries", _default_countries(cube))))
+    tasks = [
+        SectionTask('country_table', (exact,), _country_table_result, (df, cube, exact)),
+        SectionTask('world_map', (), _world_map_result, (cube, fingerprint)),
+    ]
+    if countries:
+        tasks.append(SectionTask(
+            'country_comparison', countries, _country_comparison_figure, (cube, fingerprint, countries)
+        ))
+    if _widget(state, "geo_show_maps", False):
+        tasks.append(SectionTask(
+            'company_vs_employee_maps', (), _company_vs_employee_figures, (cube, fingerprint)
+        ))
+    return tasks
+
+def _plan_salary_distribution(df, cube, fingerprint, state=None):
+    exact = _exact_quantiles(df, state)
+    cutoff = _widget(state, "distribution_cutoff", DEFAULT_CUTOFF)
+    nbins = _widget(state, "distribution_bins", DEFAULT_NBINS)
+    return [SectionTask(
+        'salary_distribution', (cutoff, nbins, exact),
+        _distribution_result, (df, cube, fingerprint, cutoff, nbins, exact)
+    )]
+
+EDA_SECTION_TASKS = {
+    "statistics": _plan_statistics,
+    "time_trends": _plan_time_trends,
+    "salary_analysis": _plan_salary_analysis,
+    "geo_analysis": _plan_geography_analysis,
+    "salary_distribution": _plan_salary_distribution,
+}
+
+def show_eda(df, cube=None, fingerprint=None, section=None, executor=None, prefetched=None, shared=None):
 
     # 🚀 GŁÓWNA FUNKCJA EDA - ORCHESTRATOR
     
@@ -316,12 +512,48 @@ def show_eda(df):
     
     # Uwaga: Kolejność wywołań = kolejność na stronie
     # Streamlit renderuje sekwencyjnie od góry do dołu.
+    
+    # ⚡ TRYB LENIWY: section = klucz z EDA_SECTIONS → liczymy tylko tę sekcję.
+    # section = None → cała strona (wszystkie sekcje po kolei).
+    
+    # 🧵 TRYB RÓWNOLEGŁY: executor = SectionExecutor (src/parallel.py) → wyniki
+    # wszystkich sekcji liczone naraz na puli, potem renderowane po kolei.
+    # Pula procesów dostaje zamiast df/cube uchwyt shared (SharedData - plik
+    # Arrow IPC z trybu współdzielonego); bez niego liczy w wątku skryptu.
+    
+    # 📸 SNAPSHOT: prefetched = wyniki policzone wcześniej (src/snapshot.py)
+    # dla popularnych stanów widgetów; sekcje biorą z niego wyniki o pasującym
+    # kluczu, a resztę liczą na żywo (albo na puli executora).
+    
+    # 💾 TRYB OUT-OF-CORE: df = None, a cube zbudowana porcjami
+    # (SalaryCube.from_chunks) - wtedy fingerprint trzeba podać.
+    if cube is None:
+        cube = SalaryCube.from_frame(df)
+    # 🔑 Odcisk danych - klucz cache wykresów (najlepiej też z cache w app.py)
+    if fingerprint is None and df is not None:
+        fingerprint = dataset_fingerprint(df)
+    show_intro_section()
+    
+    # 🎛️ Globalne filtry mogą dać pusty wynik - wtedy nie ma czego liczyć
+    if df is not None and df.empty:
+        st.warning("Brak rekordów dla wybranych filtrów. Zmień ustawienia w sidebarze.")
+        return
+    
+    keys = list(EDA_SECTIONS) if section is None else [section]
+    if executor is not None:
+        tasks = [
+            task for key in keys if key in EDA_SECTION_TASKS
+            for task in EDA_SECTION_TASKS[key](df, cube, fingerprint)
+            if not prefetched or task.key not in prefetched
+        ]
+        with span("prefetch"):
+            prefetched = {**(prefetched or {}), **executor.run(tasks, shared=shared, frame=df, cube=cube)}
+    
     # 🎪 SEKWENCJA SEKCJI
     # Każda sekcja to osobny "blok" w dashboardzie
-    show_intro_section()
-    show_dataset_overview(df)
-    show_statistics(df)
-    show_time_trends(df)
-    show_salary_analysis(df)
-    show_geography_analysis(df)
-    show_salary_distribution(df)
\ No newline at end of file
+    for key in keys:
+        try:
+            with span(f"section:{key}"):
+                EDA_SECTIONS[key](df, cube, fingerprint, prefetched)
+        except SectionTimeout as e:
+            st.warning(f"⏱️ Część sekcji nie zdążyła się policzyć ({e}). Odśwież stronę, aby spróbować ponownie.")
@@ -0,0 +1,202 @@
+# 🗃️ MODUŁ: Cache wykresów (figure cache)
+
+# Streamlit przy każdej interakcji wykonuje cały skrypt od nowa.
+# Bez cache każdy rerun buduje WSZYSTKIE wykresy Plotly - także te,
+# których wejścia się nie zmieniły (np. mapy, gdy ruszamy suwakiem cutoff).
+
+# Rozwiązanie:
+# - klucz = odcisk danych (hash zawartości DataFrame) + nazwa sekcji + stan widgetów
+#   + ustawienia zmniejszania wykresów (EDA_COMPACT_FIGURES, EDA_POINT_BUDGET)
+# - wartość = zserializowany wykres (JSON Plotly)
+# - limit pamięci liczony w bajtach JSON, usuwanie najdawniej używanych (LRU)
+# - liczniki trafień/chybień do diagnostyki
+
+# Cache jest globalny dla procesu - współdzielą go wszystkie sesje.
+# Z EDA_CACHE_DIR ma drugi poziom na dysku (src/disk_cache.py): chybienie
+# w pamięci sprawdza dysk, a zbudowany wykres trafia do obu - wykresy
+# przeżywają restart procesu i są wspólne dla replik.
+
+import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict
+
+import pandas as pd
+import plotly.io as pio
+
+from src.disk_cache import DISK_CACHE
+from src.instrumentation import record
+from src.visualization.compact import DEFAULT_POINT_BUDGET, compact_figure
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+# 📦 KOMPAKTOWE WYKRESY (src/visualization/compact.py) - domyślnie włączone;
+# EDA_COMPACT_FIGURES=0 wyłącza, EDA_POINT_BUDGET = maks. punktów serii liniowej.
+# Czytane ze zmiennych środowiskowych, bo dziedziczą je też procesy puli sekcji.
+COMPACT_FIGURES = os.environ.get("EDA_COMPACT_FIGURES", "1") != "0"
+POINT_BUDGET = int(os.environ.get("EDA_POINT_BUDGET", DEFAULT_POINT_BUDGET))
+
+
+def dataset_fingerprint(df):
+    """
+    Liczy odcisk zawartości DataFrame (hash wierszy + nazwy kolumn).
+
+    Args:
+        df: DataFrame z danymi
+
+    Returns:
+        str: Heksadecymalny skrót SHA-1
+    """
+    row_hashes = pd.util.hash_pandas_object(df, index=False).to_numpy()
+    digest = hashlib.sha1(row_hashes.tobytes())
+    digest.update(",".join(map(str, df.columns)).encode())
+    return digest.hexdigest()
+
+
+def file_fingerprint(path):
+    """
+    Liczy odcisk pliku z jego metadanych (ścieżka, rozmiar, czas modyfikacji).
+
+    Używany w trybie out-of-core, gdzie nie ma DataFrame do zahashowania.
+    """
+    stat = os.stat(path)
+    key = f"{os.path.abspath(path)}:{stat.st_size}:{stat.st_mtime_ns}"
+    return hashlib.sha1(key.encode()).hexdigest()
+
+
+def _entry_size(entry):
+    # Rozmiar wpisu = suma długości JSON wszystkich wykresów
+    _, payloads = entry
+    return sum(len(p) for p in payloads)
+
+
+class FigureCache:
+    """
+    Cache LRU zserializowanych wykresów Plotly z limitem rozmiaru w bajtach.
+
+    Args:
+        max_bytes: Limit pamięci (bajty JSON)
+        disk: Opcjonalny DiskCache - drugi poziom, trwały między restartami
+    """
+
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES, disk=None):
+        self.max_bytes = max_bytes
+        self.disk = disk
+        self.disk_hits = 0
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def _put(self, key, entry):
+        size = _entry_size(entry)
+        if size > self.max_bytes:
+            # Pojedynczy wykres większy niż cały cache - nie zapisujemy
+            return
+        with self._lock:
+            if key in self._entries:
+                self.current_bytes -= _entry_size(self._entries.pop(key))
+            self._entries[key] = entry
+            self.current_bytes += size
+            while self.current_bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self.current_bytes -= _entry_size(evicted)
+                self.evictions += 1
+
+    def get_or_build(self, key, builder):
+        """
+        Zwraca wykres z cache albo buduje go i zapisuje.
+
+        Args:
+            key: Krotka (odcisk danych, nazwa sekcji, *stan widgetów)
+            builder: Funkcja bez argumentów zwracająca Figure lub krotkę Figure
+
+        Returns:
+            Figure lub krotka Figure (zawsze nowe obiekty - można je modyfikować)
+        """
+        entry = self._get(key)
+        if entry is None and self.disk is not None:
+            entry = self.disk.get(('figure', key))
+            if entry is not None:
+                with self._lock:
+                    self.disk_hits += 1
+                self._put(key, entry)
+        if entry is None:
+            start = time.perf_counter()
+            figures = builder()
+            is_tuple = isinstance(figures, tuple)
+            payloads = tuple(
+                pio.to_json(fig, validate=False)
+                for fig in (figures if is_tuple else (figures,))
+            )
+            self._put(key, (is_tuple, payloads))
+            if self.disk is not None:
+                self.disk.put(('figure', key), (is_tuple, payloads))
+            # 🔬 Czas budowy + serializacji i rozmiar JSON (src/instrumentation.py)
+            # Klucz z cached_figure: (odcisk, nazwa sekcji, parametry)
+            name = key[1] if isinstance(key, tuple) and len(key) > 1 else 'figure'
+            record(f"figure:{name}", time.perf_counter() - start, sum(len(p) for p in payloads))
+            return figures
+
+        is_tuple, payloads = entry
+        figures = tuple(pio.from_json(p) for p in payloads)
+        return figures if is_tuple else figures[0]
+
+    def stats(self):
+        """Zwraca słownik z licznikami cache (do panelu diagnostycznego)."""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                'entries': len(self._entries),
+                'bytes': self.current_bytes,
+                'max_bytes': self.max_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'disk_hits': self.disk_hits,
+                'hit_ratio': self.hits / total if total else 0.0,
+            }
+
+    def clear(self):
+        """Czyści cache i liczniki."""
+        with self._lock:
+            self._entries.clear()
+            self.current_bytes = 0
+            self.hits = self.misses = self.evictions = self.disk_hits = 0
+
+
+# 🌍 GLOBALNA INSTANCJA - współdzielona przez wszystkie sesje w procesie
+FIGURE_CACHE = FigureCache(disk=DISK_CACHE)
+
+
+def cached_figure(fingerprint, section, params, builder):
+    """
+    Skrót do FIGURE_CACHE.get_or_build.
+
+    Args:
+        fingerprint: Odcisk danych (dataset_fingerprint)
+        section: Nazwa sekcji/wykresu
+        params: Krotka z wartościami widgetów wpływających na wykres
+        builder: Funkcja budująca wykres przy braku w cache
+    """
+    build = builder
+    # Ustawienia zmniejszania są częścią klucza - wpis z dysku (inny proces,
+    # inna konfiguracja EDA_COMPACT_FIGURES / EDA_POINT_BUDGET) nie zostanie pomylony
+    render = ('compact', POINT_BUDGET) if COMPACT_FIGURES else ('full',)
+    if COMPACT_FIGURES:
+        # Cache i przeglądarka dostają już zmniejszony wykres
+        build = lambda: compact_figure(builder(), point_budget=POINT_BUDGET)
+    return FIGURE_CACHE.get_or_build((fingerprint, section, params, render), build)
@@ -0,0 +1,264 @@
+# 🎛️ MODUŁ: Globalne filtry (cross-filter)
+
+# Zamiast filtrować DataFrame osobno w każdej sekcji (df[df[...] == ...]),
+# budujemy RAZ na wersję danych indeks filtrów:
+# - kolumny o małej liczbie wartości (rok, poziom, wielkość firmy, praca zdalna)
+#   → gotowa bitmapa (np.packbits) dla każdej wartości
+# - kolumny o dużej liczbie wartości (stanowiska, kraje)
+#   → posortowane pozycje wierszy dla każdej wartości
+# Połączony filtr = kilka operacji OR/AND na spakowanych bitmapach (n/8 bajtów).
+
+# Wynik to FilteredView, z którego korzystają wszystkie sekcje:
+# - bez aktywnych filtrów view.frame to ten sam DataFrame (bez kopii)
+# - z filtrami view.frame to KOPIA wybranych wierszy (df.take(positions)),
+#   tworzona leniwie raz na stan filtrów - sekcje biorą z niej tylko opis
+#   (describe), dokładne mediany i wiersze stanowiska; reszta idzie z kostki
+# - widoki są zapamiętywane (LRU) z limitem łącznej liczby wierszy
+#   (max_cached_rows, domyślnie liczba wierszy tabeli) - kopie widoków
+#   zajmują więc razem najwyżej tyle pamięci, co jedna dodatkowa tabela,
+#   niezależnie od liczby zapamiętanych stanów filtrów
+# - kostka widoku: gdy filtry dotyczą tylko kluczy kostki (rok, poziom,
+#   kraj, stanowisko), to wybór gotowych komórek kostki bazowej
+#   (SalaryCube.subset - O(komórek)); inne filtry (wielkość firmy, praca
+#   zdalna) wymagają przeliczenia kostki z wierszy widoku
+
+import hashlib
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+from src.aggregates import CUBE_KEYS, SalaryCube
+from src.data_loader import freeze_frame
+
+# Kolumny dostępne w globalnych filtrach (kolejność = kolejność w sidebarze)
+FILTER_COLUMNS = [
+    'work_year',
+    'experience_level',
+    'company_size',
+    'remote_ratio',
+    'company_location',
+    'job_title',
+]
+
+# Filtry zakresowe: wartość w stanie filtrów to krotka (od, do)
+RANGE_COLUMNS = {'work_year'}
+
+# Powyżej tej liczby wartości trzymamy pozycje wierszy zamiast bitmap
+MAX_BITMAP_VALUES = 64
+
+
+def filter_state_key(state):
+    """Zamienia stan filtrów na krotkę nadającą się na klucz słownika."""
+    items = []
+    for col in FILTER_COLUMNS:
+        value = (state or {}).get(col)
+        if value is None or (col not in RANGE_COLUMNS and len(value) == 0):
+            continue
+        if col in RANGE_COLUMNS:
+            items.append((col, tuple(value)))
+        else:
+            items.append((col, tuple(sorted(map(str, value)))))
+    return tuple(items)
+
+
+class _ColumnIndex:
+    # Indeks jednej kolumny: kategorie + bitmapy albo posortowane pozycje
+
+    def __init__(self, series):
+        categorical = pd.Categorical(series)
+        self.categories = categorical.categories
+        codes = categorical.codes
+        self.n_rows = len(codes)
+        self.bitmaps = None
+        self.order = None
+        if len(self.categories) <= MAX_BITMAP_VALUES:
+            self.bitmaps = [np.packbits(codes == code) for code in range(len(self.categories))]
+        else:
+            # Pozycje wierszy posortowane po kodzie; offsets[c]:offsets[c+1] = wiersze wartości c
+            self.order = np.argsort(codes, kind='stable').astype(np.int64)
+            sorted_codes = codes[self.order]
+            self.offsets = np.searchsorted(sorted_codes, np.arange(len(self.categories) + 1))
+
+    def codes_for(self, values):
+        codes = self.categories.get_indexer(pd.Index(list(values)))
+        return codes[codes >= 0]
+
+    def packed_mask(self, codes):
+        if self.bitmaps is not None:
+            packed = np.zeros_like(self.bitmaps[0]) if self.bitmaps else np.zeros(0, np.uint8)
+            for code in codes:
+                packed |= self.bitmaps[code]
+            return packed
+        mask = np.zeros(self.n_rows, dtype=bool)
+        for code in codes:
+            mask[self.order[self.offsets[code]:self.offsets[code + 1]]] = True
+        return np.packbits(mask)
+
+
+class FilteredView:
+    """Wynik filtrowania: pozycje wierszy + leniwie tworzone ramka i kostka."""
+
+    def __init__(self, index, key, positions):
+        self._index = index
+        self.key = key
+        self.positions = positions
+        self._frame = None
+        self._cube = None
+        # Widok jest współdzielony przez sesje (i wątki puli) - ramka i kostka powstają raz
+        self._lock = threading.RLock()
+
+    @property
+    def rows_held(self):
+        """Wiersze, które widok trzyma (pozycje i ewentualna kopia ramki) - 0 bez filtrów."""
+        return 0 if self.positions is None else len(self.positions)
+
+    @property
+    def is_filtered(self):
+        return self.positions is not None
+
+    @property
+    def count(self):
+        return len(self._index.df) if self.positions is None else len(self.positions)
+
+    @property
+    def frame(self):
+        """DataFrame z wierszami widoku (bez filtrów - ten sam obiekt, bez kopii)."""
+        if self.positions is None:
+            return self._index.df
+        with self._lock:
+            if self._frame is None:
+                # Tak jak tabela bazowa, tylko do odczytu
+                self._frame = freeze_frame(self._index.df.take(self.positions))
+            return self._frame
+
+    @property
+    def cube(self):
+        """SalaryCube dla wierszy widoku (bez filtrów - kostka bazowa)."""
+        base = self._index.cube
+        if self.positions is None and base is not None:
+            return base
+        with self._lock:
+            if self._cube is None:
+                filters = self._index.cube_filters(self.key)
+                if base is not None and filters is not None:
+                    self._cube = base.subset(filters)
+                else:
+                    self._cube = SalaryCube.from_frame(self.frame)
+            return self._cube
+
+    def fingerprint(self, base_fingerprint):
+        """Odcisk widoku do cache wykresów: odcisk danych + stan filtrów."""
+        if not self.key:
+            return base_fingerprint
+        digest = hashlib.sha1(repr(self.key).encode()).hexdigest()[:12]
+        return f"{base_fingerprint}:{digest}"
+
+
+class FilterIndex:
+    """
+    Indeks bitmap/pozycji dla FILTER_COLUMNS, budowany raz na wersję danych.
+
+    Args:
+        df: Dane (tabela bazowa)
+        cube: Opcjonalna kostka bazowa (kostki widoków z jej komórek)
+        max_cached_views: Maksymalna liczba zapamiętanych widoków
+        max_cached_rows: Limit łącznej liczby wierszy zapamiętanych widoków
+            (domyślnie len(df) - najwyżej jedna dodatkowa tabela w pamięci)
+    """
+
+    def __init__(self, df, cube=None, max_cached_views=16, max_cached_rows=None):
+        self.df = df
+        self.cube = cube
+        self.columns = {col: _ColumnIndex(df[col]) for col in FILTER_COLUMNS if col in df.columns}
+        self._views = OrderedDict()
+        self._max_cached_views = max_cached_views
+        self._max_cached_rows = len(df) if max_cached_rows is None else max_cached_rows
+        self._cached_rows = 0
+        self._lock = threading.Lock()
+
+    def options(self, column):
+        """Posortowane wartości kolumny dostępne w filtrze."""
+        return sorted(self.columns[column].categories)
+
+    def _codes(self, column, value):
+        index = self.columns[column]
+        if column in RANGE_COLUMNS:
+            low, high = value
+            values = [v for v in index.categories if low <= v <= high]
+            return index.codes_for(values)
+        return index.codes_for(value)
+
+    def cube_filters(self, key):
+        """
+        Filtry kostki odpowiadające stanowi filtrów (klucz z filter_state_key).
+
+        Returns:
+            dict {kolumna: lista wartości} albo None, gdy któryś filtr nie
+            dotyczy kluczy kostki (wtedy kostkę trzeba liczyć z wierszy)
+        """
+        filters = {}
+        for column, value in key:
+            if column not in CUBE_KEYS:
+                return None
+            categories = self.columns[column].categories
+            if column in RANGE_COLUMNS:
+                low, high = value
+                filters[column] = [v for v in categories if low <= v <= high]
+            else:
+                # Wartości w kluczu są tekstem - wracamy do wartości z danych
+                wanted = set(value)
+                filters[column] = [v for v in categories if str(v) in wanted]
+        return filters
+
+    def positions(self, state):
+        """
+        Zwraca posortowane pozycje wierszy spełniających filtry.
+
+        Args:
+            state: Słownik {kolumna: lista wartości} lub {kolumna: (od, do)} dla RANGE_COLUMNS
+
+        Returns:
+            np.ndarray lub None, gdy żaden filtr nie jest aktywny
+        """
+        packed = None
+        for column, value in filter_state_key(state):
+            if column in RANGE_COLUMNS:
+                index = self.columns[column]
+                # Zakres obejmujący wszystkie wartości nie zawęża danych
+                if value[0] <= index.categories.min() and value[1] >= index.categories.max():
+                    continue
+                value = tuple(state[column])
+            else:
+                value = state[column]
+            column_mask = self.columns[column].packed_mask(self._codes(column, value))
+            packed = column_mask if packed is None else packed & column_mask
+        if packed is None:
+            return None
+        return np.flatnonzero(np.unpackbits(packed, count=len(self.df)))
+
+    def view(self, state=None):
+        """Zwraca (zapamiętany) FilteredView dla stanu filtrów."""
+        key = filter_state_key(state)
+        with self._lock:
+            if key in self._views:
+                self._views.move_to_end(key)
+                return self._views[key]
+
+        positions = self.positions(state)
+        view = FilteredView(self, key if positions is not None else (), positions)
+
+        with self._lock:
+            previous = self._views.pop(key, None)
+            if previous is not None:
+                self._cached_rows -= previous.rows_held
+            self._views[key] = view
+            self._cached_rows += view.rows_held
+            # Najdawniej używane widoki wypadają, aż zmieści się limit widoków i wierszy
+            while self._views and (
+                len(self._views) > self._max_cached_views or self._cached_rows > self._max_cached_rows
+            ):
+                _, evicted = self._views.popitem(last=False)
+                self._cached_rows -= evicted.rows_held
+        return view
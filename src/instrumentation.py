@@ -0,0 +1,243 @@
+# 🔬 MODUŁ: Instrumentacja gorących ścieżek i profil reruna
+
+# Bez pomiarów nie wiadomo, gdzie rerun traci czas: wczytanie CSV, rollupy
+# w sekcjach, mapowanie ISO2 → ISO3, budowa wykresów Plotly czy serializacja
+# w st.plotly_chart. Ten moduł daje:
+# - span(nazwa) - pomiar czasu fragmentu kodu (perf_counter, narzut ~1 µs)
+# - METRICS - liczniki procesu (liczba, suma i maksimum czasu, bajty payloadu)
+#   eksportowane w formacie tekstowym Prometheus (prometheus_text)
+# - RerunProfile - spany JEDNEGO reruna (panel diagnostyczny w sidebarze,
+#   log JSON); aktywny tylko na żądanie, bo liczenie bajtów payloadu kosztuje
+#   dodatkową serializację wykresów
+
+# Profil reruna jest trzymany w ContextVar - każdy wątek skryptu Streamlit
+# (czyli każda sesja) ma własny. Pula wątków sekcji (src/parallel.py)
+# przekazuje kontekst do zadań, więc ich spany trafiają do tego samego profilu.
+
+import contextvars
+import functools
+import json
+import logging
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+logger = logging.getLogger(__name__)
+
+_CURRENT_PROFILE = contextvars.ContextVar('eda_rerun_profile', default=None)
+
+
+def peak_rss_bytes():
+    """Szczytowe zużycie pamięci procesu (RSS) w bajtach; None poza Unixem."""
+    try:
+        import resource
+    except ImportError:
+        return None
+    # ru_maxrss: kilobajty na Linuksie, bajty na macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+
+class MetricsRegistry:
+    """Liczniki spanów dla całego procesu (współdzielone przez sesje)."""
+
+    def __init__(self):
+        self._spans = {}
+        self._lock = threading.Lock()
+        self.reruns = 0
+
+    def observe(self, name, seconds, payload_bytes=None):
+        with self._lock:
+            entry = self._spans.setdefault(name, {'count': 0, 'seconds': 0.0, 'max_seconds': 0.0, 'bytes': 0})
+            entry['count'] += 1
+            entry['seconds'] += seconds
+            entry['max_seconds'] = max(entry['max_seconds'], seconds)
+            if payload_bytes:
+                entry['bytes'] += payload_bytes
+
+    def count_rerun(self, seconds):
+        with self._lock:
+            self.reruns += 1
+        self.observe('rerun', seconds)
+
+    def snapshot(self):
+        """Kopia liczników: nazwa spanu → {count, seconds, max_seconds, bytes}."""
+        with self._lock:
+            return {name: dict(entry) for name, entry in self._spans.items()}
+
+    def clear(self):
+        with self._lock:
+            self._spans.clear()
+            self.reruns = 0
+
+
+# 🌍 GLOBALNA INSTANCJA - liczniki procesu
+METRICS = MetricsRegistry()
+
+
+class RerunProfile:
+    """Spany jednego reruna: (nazwa, sekundy, bajty payloadu lub None)."""
+
+    def __init__(self):
+        self.spans = []
+        self.started = time.perf_counter()
+        self.seconds = None
+        self.peak_rss = None
+        self.caches = {}
+        self._lock = threading.Lock()
+
+    def add(self, name, seconds, payload_bytes=None):
+        with self._lock:
+            self.spans.append((name, seconds, payload_bytes))
+
+    def to_dict(self):
+        """Profil jako słownik (do logu JSON i panelu)."""
+        return {
+            'seconds': self.seconds,
+            'peak_rss_bytes': self.peak_rss,
+            'caches': self.caches,
+            'spans': [
+                {'name': name, 'seconds': round(seconds, 6), 'bytes': payload_bytes}
+                for name, seconds, payload_bytes in self.spans
+            ],
+        }
+
+
+def current_profile():
+    """Profil bieżącego reruna albo None, gdy profilowanie jest wyłączone."""
+    return _CURRENT_PROFILE.get()
+
+
+def record(name, seconds, payload_bytes=None):
+    """Zapisuje zmierzony czas w licznikach procesu i (jeśli aktywny) w profilu reruna."""
+    METRICS.observe(name, seconds, payload_bytes)
+    profile = _CURRENT_PROFILE.get()
+    if profile is not None:
+        profile.add(name, seconds, payload_bytes)
+
+
+@contextmanager
+def span(name):
+    """Mierzy czas bloku `with span('nazwa'):`."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        record(name, time.perf_counter() - start)
+
+
+def timed(name):
+    """Dekorator: każde wywołanie funkcji mierzone jako span `name`."""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with span(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def start_rerun():
+    """Włącza profil dla bieżącego reruna (wątku skryptu) i go zwraca."""
+    profile = RerunProfile()
+    _CURRENT_PROFILE.set(profile)
+    return profile
+
+
+def end_rerun(profile, caches=None, log=False):
+    """
+    Zamyka profil reruna: czas całkowity, szczyt pamięci i stan cache.
+
+    Args:
+        profile: RerunProfile ze start_rerun
+        caches: Słownik nazwa → statystyki cache (np. FIGURE_CACHE.stats())
+        log: Zapisz profil jako jedną linię JSON w logu (logi strukturalne)
+    """
+    profile.seconds = time.perf_counter() - profile.started
+    profile.peak_rss = peak_rss_bytes()
+    profile.caches = caches or {}
+    _CURRENT_PROFILE.set(None)
+    METRICS.count_rerun(profile.seconds)
+    if log:
+        logger.info(json.dumps({'event': 'rerun_profile', **profile.to_dict()}, default=str))
+    return profile
+
+
+def _escape_label(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def prometheus_text(caches=None):
+    """
+    Liczniki procesu w formacie tekstowym Prometheus (exposition format 0.0.4).
+
+    Args:
+        caches: Słownik nazwa → statystyki cache (hits, misses, bytes, ...)
+    """
+    lines = [
+        '# HELP eda_span_seconds Czas spanów instrumentacji EDA.',
+        '# TYPE eda_span_seconds summary',
+    ]
+    spans = METRICS.snapshot()
+    for name, entry in sorted(spans.items()):
+        label = f'span="{_escape_label(name)}"'
+        lines.append(f'eda_span_seconds_count{{{label}}} {entry["count"]}')
+        lines.append(f'eda_span_seconds_sum{{{label}}} {entry["seconds"]:.6f}')
+    lines += ['# HELP eda_span_max_seconds Najdłuższy pojedynczy span.', '# TYPE eda_span_max_seconds gauge']
+    lines += [
+        f'eda_span_max_seconds{{span="{_escape_label(name)}"}} {entry["max_seconds"]:.6f}'
+        for name, entry in sorted(spans.items())
+    ]
+    lines += ['# HELP eda_payload_bytes_total Bajty payloadu wysłane do przeglądarki.', '# TYPE eda_payload_bytes_total counter']
+    lines += [
+        f'eda_payload_bytes_total{{span="{_escape_label(name)}"}} {entry["bytes"]}'
+        for name, entry in sorted(spans.items()) if entry['bytes']
+    ]
+    lines += ['# HELP eda_reruns_total Profilowane reruny.', '# TYPE eda_reruns_total counter']
+    lines.append(f'eda_reruns_total {METRICS.reruns}')
+    for cache, stats in sorted((caches or {}).items()):
+        for key in ('hits', 'misses', 'bytes', 'entries'):
+            if key in stats:
+                lines.append(f'eda_cache_{key}{{cache="{_escape_label(cache)}"}} {stats[key]}')
+        if 'hit_ratio' in stats:
+            lines.append(f'eda_cache_hit_ratio{{cache="{_escape_label(cache)}"}} {stats["hit_ratio"]:.4f}')
+    rss = peak_rss_bytes()
+    if rss is not None:
+        lines += ['# HELP eda_process_peak_rss_bytes Szczytowy RSS procesu.', '# TYPE eda_process_peak_rss_bytes gauge']
+        lines.append(f'eda_process_peak_rss_bytes {rss}')
+    return '\n'.join(lines) + '\n'
+
+
+def start_metrics_server(port, caches=None, host='0.0.0.0'):
+    """
+    Uruchamia w tle endpoint HTTP GET /metrics (tekst Prometheus).
+
+    Args:
+        port: Port nasłuchu
+        caches: Funkcja bez argumentów zwracająca statystyki cache
+        host: Adres nasłuchu
+
+    Returns:
+        ThreadingHTTPServer: Działający serwer (server.shutdown() zatrzymuje)
+    """
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split('?')[0] != '/metrics':
+                self.send_error(404)
+                return
+            body = prometheus_text(caches() if caches else None).encode()
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            logger.debug("metrics: " + format, *args)
+
+    server = ThreadingHTTPServer((host, port), Handler)
+    threading.Thread(target=server.serve_forever, name='eda-metrics', daemon=True).start()
+    logger.info("Endpoint metryk: http://%s:%d/metrics", host, port)
+    return server
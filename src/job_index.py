@@ -0,0 +1,190 @@
+# 🔎 MODUŁ: Indeks stanowisk (drill-down "Szczegółowa analiza stanowiska")
+
+# Szczegóły stanowiska wymagały przy każdym rerunie skanu całej tabeli
+# (df[df['job_title'] == wybrane]) albo wszystkich komórek kostki.
+# Indeks budujemy RAZ na wersję danych (i widok filtrów):
+# - posortowane pozycje wierszy per stanowisko (offsets[c]:offsets[c+1])
+#   → wiersze stanowiska to wycinek O(grupa), bez skanu
+# - statystyki per (stanowisko, rok) z jednego rollupu kostki → trend od ręki
+# - sumy i mediany (szkice) per stanowisko → metryki od ręki
+# - wyszukiwanie po prefiksie (bisect po posortowanych nazwach) i rozmyte
+#   (difflib) - dla tysięcy stanowisk w większych eksportach
+
+# Indeks jest zapamiętywany przy kostce (job_index) - kostka już jest
+# "jedna na wersję danych / widok", więc indeks żyje dokładnie tak długo jak ona.
+# Budowa kosztuje (przy 1M wierszy) setki ms, więc powstaje dopiero przy
+# pierwszym wyszukiwaniu - lista stanowisk i szczegóły jednego stanowiska
+# idą z kostki (src/analytics.py), a z indeksu tylko gdy już istnieje
+# (existing_job_index).
+
+import bisect
+import difflib
+import threading
+import weakref
+
+import numpy as np
+import pandas as pd
+
+SEARCH_LIMIT = 50
+
+_INDEXES = weakref.WeakKeyDictionary()
+_INDEXES_LOCK = threading.Lock()
+
+
+class JobTitleIndex:
+    """
+    Indeks stanowisk: pozycje wierszy, trend roczny i metryki per stanowisko.
+
+    Args:
+        cube: SalaryCube z danymi (źródło statystyk)
+        df: Opcjonalne surowe dane (pozycje wierszy, dokładne mediany)
+    """
+
+    def __init__(self, cube, df=None):
+        self.df = df
+        totals = cube.rollup(['job_title'])
+        medians = cube.quantiles((0.5,), ['job_title']).set_index('job_title')[0.5]
+        self.titles = sorted(map(str, totals['job_title']))
+        self._totals = totals.assign(
+            median_salary=totals['job_title'].map(medians).astype(float)
+        ).set_index(totals['job_title'].astype(str))
+
+        # Trend: jeden rollup (stanowisko, rok) posortowany po nazwie stanowiska;
+        # wiersze stanowiska to wycinek _trend_offsets[c]:_trend_offsets[c+1]
+        yearly = cube.rollup(['job_title', 'work_year'])
+        trend_codes = pd.Index(self.titles).get_indexer(yearly['job_title'].astype(str))
+        order = np.lexsort((yearly['work_year'].to_numpy(), trend_codes))
+        self._yearly = yearly.drop(columns='job_title').take(order).reset_index(drop=True)
+        self._trend_offsets = np.searchsorted(trend_codes[order], np.arange(len(self.titles) + 1))
+
+        # Wyszukiwanie bez rozróżniania wielkości liter: posortowane małe litery → nazwa
+        self._search_keys = sorted((title.lower(), title) for title in self.titles)
+        self._lowered = [key for key, _ in self._search_keys]
+
+        self._order = None
+        if df is not None:
+            # Kody kategorii kolumny przemapowane na pozycje w self.titles (bez
+            # zamiany 1M wierszy na tekst - tylko lista kategorii)
+            categorical = pd.Categorical(df['job_title'])
+            remap = pd.Index(self.titles).get_indexer(categorical.categories.astype(str))
+            codes = np.where(categorical.codes >= 0, remap[categorical.codes], -1)
+            self._order = np.argsort(codes, kind='stable').astype(np.int64)
+            self._offsets = np.searchsorted(codes[self._order], np.arange(len(self.titles) + 1))
+            self._salaries = df['salary_in_usd'].to_numpy()
+
+    def _code(self, title):
+        code = bisect.bisect_left(self.titles, title)
+        if code == len(self.titles) or self.titles[code] != title:
+            return None
+        return code
+
+    def __contains__(self, title):
+        return self._code(title) is not None
+
+    def positions(self, title):
+        """Posortowane pozycje wierszy stanowiska (None bez surowych danych)."""
+        if self._order is None:
+            return None
+        code = self._code(title)
+        if code is None:
+            return np.zeros(0, dtype=np.int64)
+        # Stabilne sortowanie → pozycje w obrębie stanowiska są już rosnące
+        return self._order[self._offsets[code]:self._offsets[code + 1]]
+
+    def rows(self, title):
+        """Wiersze stanowiska jako DataFrame (wycinek, bez skanu tabeli)."""
+        return self.df.take(self.positions(title))
+
+    def trend(self, title):
+        """Statystyki per rok dla stanowiska (jak SalaryCube.rollup(['work_year']))."""
+        code = self._code(title)
+        if code is None:
+            return self._yearly.iloc[:0]
+        return self._yearly.iloc[self._trend_offsets[code]:self._trend_offsets[code + 1]].reset_index(drop=True)
+
+    def stats(self, title, exact=False):
+        """
+        Liczność, średnia i mediana stanowiska.
+
+        Args:
+            exact: Mediana dokładnie z wierszy stanowiska (wymaga df)
+
+        Returns:
+            tuple: (count, mean, median)
+        """
+        if title not in self._totals.index:
+            return 0, float('nan'), float('nan')
+        row = self._totals.loc[title]
+        median = row['median_salary']
+        if exact and self._order is not None:
+            values = self._salaries[self.positions(title)]
+            values = values[~np.isnan(values)]
+            median = float(np.median(values)) if len(values) else float('nan')
+        return int(row['count']), float(row['mean_salary']), float(median)
+
+    def search(self, query, limit=SEARCH_LIMIT):
+        """
+        Szuka stanowisk: najpierw po prefiksie, potem po fragmencie, na końcu rozmyto.
+
+        Args:
+            query: Tekst wpisany przez użytkownika (wielkość liter bez znaczenia)
+            limit: Maksymalna liczba wyników
+
+        Returns:
+            list: Nazwy stanowisk w kolejności trafności
+        """
+        query = query.strip().lower()
+        if not query:
+            return self.titles[:limit]
+        found = []
+        # Prefiks: ciągły zakres w posortowanych kluczach
+        start = bisect.bisect_left(self._lowered, query)
+        for key, title in self._search_keys[start:]:
+            if not key.startswith(query) or len(found) >= limit:
+                break
+            found.append(title)
+        if len(found) < limit:
+            seen = set(found)
+            found += [
+                title for key, title in self._search_keys
+                if query in key and title not in seen
+            ][:limit - len(found)]
+        if len(found) < limit:
+            seen = set(found)
+            for key in difflib.get_close_matches(query, self._lowered, n=limit, cutoff=0.6):
+                title = self._search_keys[bisect.bisect_left(self._lowered, key)][1]
+                if title not in seen:
+                    found.append(title)
+                    seen.add(title)
+        return found[:limit]
+
+
+def existing_job_index(cube, df=None):
+    """Zapamiętany indeks kostki albo None - bez budowania (tanie ścieżki w src/analytics.py)."""
+    with _INDEXES_LOCK:
+        index = _INDEXES.get(cube)
+    return index if index is not None and index.df is df else None
+
+
+def job_index(cube, df=None):
+    """
+    Indeks stanowisk dla kostki (budowany raz, zapamiętany przy kostce).
+
+    Args:
+        cube: SalaryCube danych lub widoku filtrów
+        df: Surowe dane odpowiadające kostce (None w trybie out-of-core)
+    """
+    with _INDEXES_LOCK:
+        index = _INDEXES.get(cube)
+    if index is not None and index.df is df:
+        return index
+    index = JobTitleIndex(cube, df)
+    with _INDEXES_LOCK:
+        _INDEXES[cube] = index
+    return index
+
+
+def clear_job_indexes():
+    """Zapomina wszystkie zapamiętane indeksy (np. przed pomiarem "na zimno")."""
+    with _INDEXES_LOCK:
+        _INDEXES.clear()
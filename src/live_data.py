@@ -0,0 +1,220 @@
+# 🔄 MODUŁ: Przyrostowe odświeżanie danych (append-only)
+
+# Plik CSV z wynagrodzeniami jest tylko DOPISYWANY (nowe wiersze, nowe lata).
+# Zamiast przeładowywać całą tabelę i przeliczać wszystko od zera:
+# - pamiętamy znacznik (watermark): offset w bajtach + liczbę wierszy
+# - przy odświeżeniu parsujemy tylko bajty za znacznikiem (read_csv_delta)
+# - deltę doklejamy do tabeli (append_rows) i scalamy z kostką agregatów
+#   (SalaryCube.merge - koszt proporcjonalny do liczby komórek, nie wierszy)
+# - odcisk danych = SHA-1 bajtów pliku do znacznika; przy dopisaniu
+#   kontynuujemy zapamiętany stan skrótu bajtami delty (koszt ~ delta), więc
+#   wynik jest ten sam, co przy pełnym wczytaniu tego samego pliku - także w
+#   innym procesie, po restarcie i na innej replice (cache na dysku, snapshot)
+# - dopisane same puste linie też przesuwają znacznik i odcisk (nowa wersja
+#   z tą samą tabelą i kostką), żeby nie czytać ich przy każdym odświeżeniu
+
+# Każda wersja to niezmienny DatasetSnapshot podmieniany jednym przypisaniem,
+# więc sesje czytające w trakcie odświeżania widzą spójną (starą albo nową)
+# wersję. Tabela snapshotu jest tylko do odczytu (freeze_frame) - sesje
+# dostają ją przez referencję, bez kopii przy rerunie. LiveDataset trzymany w @st.cache_resource jest wspólny dla sesji -
+# nowa wersja jest widoczna przy najbliższym rerunie każdej z nich.
+
+# Jeśli plik został PRZEPISANY (krótszy niż znacznik albo zmienione bajty przed
+# znacznikiem) albo nie jest zwykłym CSV, wracamy do pełnego wczytania.
+
+# UWAGA: doklejenie wierszy kopiuje tabelę (pandas nie ma append w miejscu),
+# ale bez parsowania CSV i bez przeliczania agregatów. Sidecar Parquet staje się
+# nieaktualny i zostanie odtworzony przy następnym zimnym starcie.
+
+import copy
+import logging
+import os
+import threading
+import time
+
+from src.aggregates import SalaryCube
+from src.data_loader import load_data, read_csv_delta, append_rows, detect_format, freeze_frame
+from src.disk_cache import digest_range
+from src.instrumentation import span
+from src.rankings import carry_over
+
+logger = logging.getLogger(__name__)
+
+# Ile bajtów przed znacznikiem porównujemy, żeby wykryć przepisanie pliku
+TAIL_SIGNATURE_BYTES = 256
+
+
+def _read_tail(path, offset):
+    # Bajty tuż przed znacznikiem - "podpis" już wczytanej części pliku
+    start = max(offset - TAIL_SIGNATURE_BYTES, 0)
+    with open(path, 'rb') as f:
+        f.seek(start)
+        return f.read(offset - start)
+
+
+class DatasetSnapshot:
+    """
+    Niezmienna wersja danych: tabela, kostka, odcisk i numer wersji.
+
+    Tabela jest zamrażana (freeze_frame) - sesje dostają ją przez referencję,
+    bez kopii, a próba zapisu w miejscu kończy się błędem.
+    """
+
+    def __init__(self, df, cube, fingerprint, version, offset, tail, digest=None, path=None):
+        self.df = freeze_frame(df) if df is not None else None
+        self.cube = cube
+        self.fingerprint = fingerprint
+        self.version = version
+        # Znacznik: dane wczytane do bajtu `offset`, `tail` = bajty przed nim,
+        # `digest` = stan SHA-1 bajtów do znacznika (kontynuowany przy dopisaniu)
+        self.offset = offset
+        self.tail = tail
+        self.digest = digest
+        # Plik Arrow IPC, z którego zmapowano tabelę (tryb współdzielony, src/shared_data.py)
+        self.path = path
+
+    @property
+    def rows(self):
+        return len(self.df)
+
+    def advanced(self, offset, tail, digest, version):
+        """Ta sama tabela i kostka (te same obiekty) z nowym znacznikiem i odciskiem."""
+        snapshot = copy.copy(self)
+        snapshot.fingerprint = digest.hexdigest()
+        snapshot.version = version
+        snapshot.offset = offset
+        snapshot.tail = tail
+        snapshot.digest = digest
+        return snapshot
+
+    @property
+    def version_id(self):
+        """Identyfikator wersji dla cache zależnych od danych (odcisk treści, stały między procesami)."""
+        return self.fingerprint
+
+
+class LiveDataset:
+    """
+    Dane wczytane raz i odświeżane przyrostowo przy dopisaniu wierszy do CSV.
+
+    Args:
+        path: Ścieżka do pliku CSV
+        min_interval: Minimalny odstęp (s) między sprawdzeniami pliku
+        disk_cache: Opcjonalny DiskCache (src/disk_cache.py) - tabela, kostka
+            i odcisk z pełnego wczytania przeżywają restart procesu
+    """
+
+    def __init__(self, path, min_interval=2.0, disk_cache=None):
+        self.path = path
+        self.min_interval = min_interval
+        self.disk_cache = disk_cache
+        self._lock = threading.Lock()
+        self._checked_at = time.monotonic()
+        # Deltę po offsecie czytamy tylko z nieskompresowanego CSV; inne
+        # formaty (src/data_loader.FORMATS) przy zmianie pliku wczytujemy w całości
+        self.incremental = detect_format(path) == ('csv', None)
+        self.current = self._full_load(version=1)
+
+    def _parse(self):
+        with span('load_data'):
+            df = load_data(self.path)
+        return df, SalaryCube.from_frame(df)
+
+    def _full_load(self, version):
+        # Rozmiar mierzymy przed i po wczytaniu - dopisanie w trakcie = ponów
+        while True:
+            size = os.path.getsize(self.path)
+            # Odcisk = hash zawartości pliku (nie mtime) - wspólny dla procesów, deployów i replik
+            with span('file_digest'):
+                digest = digest_range(self.path, 0, size)
+            key = None
+            if self.disk_cache is not None:
+                key = ('dataset', digest.hexdigest())
+                with span('disk_cache:dataset'):
+                    tables = self.disk_cache.get(key)
+                if tables is not None:
+                    if os.path.getsize(self.path) == size:
+                        break
+                    continue
+            tables = self._parse()
+            if os.path.getsize(self.path) == size:
+                if key is not None:
+                    self.disk_cache.put(key, tables)
+                break
+        df, cube = tables
+        return DatasetSnapshot(
+            df,
+            cube,
+            digest.hexdigest(),
+            version,
+            size,
+            _read_tail(self.path, size),
+            digest,
+        )
+
+    def _is_rewritten(self, snapshot, size):
+        return size < snapshot.offset or _read_tail(self.path, snapshot.offset) != snapshot.tail
+
+    def refresh(self, force=False):
+        """
+        Sprawdza plik i wczytuje dopisane wiersze.
+
+        Args:
+            force: Pomija limit min_interval
+
+        Returns:
+            bool: True, jeśli powstała nowa wersja danych
+        """
+        now = time.monotonic()
+        if not force and now - self._checked_at < self.min_interval:
+            return False
+        # Jedno odświeżenie naraz - pozostałe sesje czytają bieżącą wersję
+        if not self._lock.acquire(blocking=False):
+            return False
+        try:
+            self._checked_at = now
+            snapshot = self.current
+            size = os.path.getsize(self.path)
+            rewritten = self._is_rewritten(snapshot, size)
+            if size == snapshot.offset and not rewritten:
+                return False
+            if rewritten or not self.incremental:
+                logger.info("Plik %s został zmieniony - pełne wczytanie", self.path)
+                self.current = self._full_load(snapshot.version + 1)
+                return True
+
+            with span('read_csv_delta'):
+                delta, offset = read_csv_delta(self.path, snapshot.offset)
+            if offset == snapshot.offset:
+                # Tylko niedokończony wiersz (zapis w toku) - poczekamy na resztę
+                return False
+            # Ten sam odcisk, co pełne wczytanie pliku o długości `offset`
+            digest = digest_range(self.path, snapshot.offset, offset, snapshot.digest)
+            if delta is None or delta.empty:
+                # Same puste linie: bez nowych wierszy, ale znacznik i odcisk idą
+                # dalej - inaczej każde kolejne odświeżenie czytałoby je od nowa
+                self.current = snapshot.advanced(
+                    offset, _read_tail(self.path, offset), digest, snapshot.version + 1
+                )
+                return True
+            delta_cube = SalaryCube.from_frame(delta)
+            cube = snapshot.cube.merge(delta_cube)
+            # Rankingi top-N aktualizujemy przyrostowo zamiast budować od nowa
+            carry_over(snapshot.cube, cube, delta_cube)
+            self.current = DatasetSnapshot(
+                append_rows(snapshot.df, delta),
+                cube,
+                digest.hexdigest(),
+                snapshot.version + 1,
+                offset,
+                _read_tail(self.path, offset),
+                digest,
+            )
+            logger.info("Dopisano %d wierszy (wersja %d)", len(delta), snapshot.version + 1)
+            return True
+        except (OSError, ValueError) as e:
+            # Błąd odczytu/parsowania delty - zostajemy przy bieżącej wersji
+            logger.warning("Odświeżenie %s nie powiodło się: %s", self.path, e)
+            return False
+        finally:
+            self._lock.release()
@@ -0,0 +1,272 @@
+# ⚡ MODUŁ: Równoległe liczenie wyników sekcji EDA
+
+# Sekcje dashboardu (trend, top stanowisk, tabela krajów, mapy, rozkład) są
+# od siebie niezależne, a show_eda liczył je po kolei. Tutaj liczymy je
+# naraz na puli wątków lub procesów, a renderowanie zostaje w wątku skryptu
+# Streamlit - w kolejności strony.
+
+# Zadanie = (nazwa wyniku, parametry widgetów, funkcja, argumenty).
+# Funkcje zadań nie wołają st.* (warstwa src/analytics.py + buildery wykresów),
+# więc mogą działać poza wątkiem skryptu. W puli procesów funkcja musi być
+# zdefiniowana na poziomie modułu, a tabela i kostka NIE są kopiowane do
+# procesu roboczego: zadanie dostaje uchwyt SharedData (plik Arrow IPC z trybu
+# współdzielonego src/shared_data.py + odcisk wersji + wiersze widoku filtrów).
+# Proces roboczy mapuje plik (bez kopii) i buduje kostkę raz na wersję
+# (_worker_data - pamięć podręczna procesu z kluczem = wersja i widok).
+# Bez uchwytu (dane nie są opublikowane) zadania puli procesów liczymy
+# w wątku skryptu - serializacja tabeli i kostki per zadanie kosztuje więcej,
+# niż zyskuje równoległość.
+
+# Domyślnie (bez EDA_PARALLEL w app.py) sekcje liczone są sekwencyjnie -
+# na benchmarku (page:sequential vs page:thread_pool) pula nie daje zysku
+# na jednym rdzeniu; włączamy ją tylko tam, gdzie pomiar pokazuje przyspieszenie.
+
+# Każde zadanie ma limit czasu liczony od zlecenia. Zadanie, które nie
+# zdążyło, jest oznaczane jako przeterminowane (wątku nie da się przerwać -
+# kończy się w tle, a jego wynik przepada).
+
+import contextvars
+import logging
+import multiprocessing
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Any, Callable, NamedTuple, Optional
+
+import numpy as np
+
+from src.instrumentation import record
+
+logger = logging.getLogger(__name__)
+
+EXECUTOR_KINDS = ('thread', 'process')
+DEFAULT_TIMEOUT = 30.0
+
+# Ile par (wersja danych, widok filtrów) trzyma proces roboczy
+WORKER_CACHE_SIZE = 4
+
+
+class SectionTask(NamedTuple):
+    """Jedno niezależne obliczenie: wynik `name` dla parametrów `params`."""
+    name: str
+    params: tuple
+    func: Callable
+    args: tuple
+
+    @property
+    def key(self):
+        return (self.name, self.params)
+
+
+class TaskResult(NamedTuple):
+    """Wynik zadania: wartość albo wyjątek; timed_out = przekroczony limit czasu."""
+    value: Any
+    error: Optional[BaseException]
+    seconds: float
+    timed_out: bool = False
+
+
+class SectionTimeout(Exception):
+    """Wynik sekcji nie został policzony w limicie czasu."""
+
+
+class SharedData(NamedTuple):
+    """
+    Uchwyt danych dla procesu roboczego zamiast tabeli i kostki.
+
+    path: plik Arrow IPC opublikowanej wersji (src/shared_data.py)
+    version: odcisk wersji danych - klucz pamięci podręcznej procesu
+    view: klucz widoku filtrów (FilteredView.key, () = cała tabela)
+    positions: wiersze widoku (None = cała tabela)
+    cube_filters: filtry kostki widoku (FilterIndex.cube_filters) albo None
+    """
+    path: str
+    version: str
+    view: tuple = ()
+    positions: Optional[np.ndarray] = None
+    cube_filters: Optional[dict] = None
+
+
+class _Shared(NamedTuple):
+    # Znacznik w argumentach zadania: 'frame' albo 'cube' z SharedData
+    part: str
+
+
+_FRAME, _CUBE = _Shared('frame'), _Shared('cube')
+
+# Pamięć podręczna procesu roboczego: tabela i kostka bazowa per wersja,
+# ramka i kostka per (wersja, widok) - LRU o rozmiarze WORKER_CACHE_SIZE
+_WORKER_TABLES = OrderedDict()
+_WORKER_VIEWS = OrderedDict()
+
+
+def _remember(cache, key, build):
+    if key in cache:
+        cache.move_to_end(key)
+        return cache[key]
+    cache[key] = value = build()
+    if len(cache) > WORKER_CACHE_SIZE:
+        cache.popitem(last=False)
+    return value
+
+
+def _worker_data(shared):
+    """Tabela i kostka dla uchwytu SharedData (w procesie roboczym, raz na wersję i widok)."""
+    from src.aggregates import SalaryCube
+    from src.data_loader import freeze_frame
+    from src.shared_data import map_frame
+
+    def table():
+        df = map_frame(shared.path)
+        return df, SalaryCube.from_frame(df)
+
+    def view():
+        df, cube = _remember(_WORKER_TABLES, shared.version, table)
+        if shared.positions is None:
+            return df, cube
+        frame = freeze_frame(df.take(shared.positions))
+        if shared.cube_filters is not None:
+            return frame, cube.subset(shared.cube_filters)
+        return frame, SalaryCube.from_frame(frame)
+
+    return _remember(_WORKER_VIEWS, (shared.version, shared.view), view)
+
+
+def _timed_call(func, args):
+    # Czas liczony w procesie/wątku roboczym - bez czekania w kolejce puli
+    start = time.perf_counter()
+    value = func(*args)
+    return value, time.perf_counter() - start
+
+
+def _shared_call(shared, func, args):
+    # Proces roboczy: znaczniki _FRAME/_CUBE → dane z uchwytu (bez serializacji tabeli)
+    frame, cube = _worker_data(shared)
+    parts = {'frame': frame, 'cube': cube}
+    return _timed_call(func, tuple(parts[a.part] if isinstance(a, _Shared) else a for a in args))
+
+
+class SectionExecutor:
+    """
+    Pula do równoległego liczenia zadań sekcji (współdzielona przez sesje).
+
+    Args:
+        kind: 'thread' albo 'process'
+        max_workers: Liczba wątków/procesów (None = domyślna dla puli)
+        timeout: Limit czasu (s) na jedno zadanie, liczony od zlecenia
+    """
+
+    def __init__(self, kind='thread', max_workers=None, timeout=DEFAULT_TIMEOUT):
+        if kind not in EXECUTOR_KINDS:
+            raise ValueError(f"Nieznany rodzaj puli: {kind} (dostępne: {', '.join(EXECUTOR_KINDS)})")
+        self.kind = kind
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self._pool = None
+        self._lock = threading.Lock()
+
+    def _get_pool(self):
+        with self._lock:
+            if self._pool is None:
+                if self.kind == 'thread':
+                    self._pool = ThreadPoolExecutor(self.max_workers, thread_name_prefix='eda-section')
+                else:
+                    # spawn zamiast fork - proces Streamlit ma już działające wątki
+                    self._pool = ProcessPoolExecutor(
+                        self.max_workers, mp_context=multiprocessing.get_context('spawn')
+                    )
+            return self._pool
+
+    def _run_inline(self, tasks):
+        # Tryb procesów bez uchwytu danych - liczymy w wątku skryptu
+        results = {}
+        for task in tasks:
+            if task.key in results:
+                continue
+            try:
+                value, seconds = _timed_call(task.func, task.args)
+                results[task.key] = TaskResult(value, None, seconds)
+                record(f"task:{task.name}", seconds)
+            except Exception as e:
+                results[task.key] = TaskResult(None, e, 0.0)
+        return results
+
+    def run(self, tasks, shared=None, frame=None, cube=None):
+        """
+        Liczy zadania równolegle i czeka na wszystkie (najdłużej `timeout` na zadanie).
+
+        Args:
+            tasks: Lista SectionTask (duplikaty kluczy liczone raz)
+            shared: Uchwyt SharedData (pula procesów) - argumenty zadań będące
+                `frame` / `cube` są zastępowane danymi z uchwytu w procesie roboczym
+            frame, cube: Tabela i kostka, do których odnosi się uchwyt
+
+        Returns:
+            dict: (nazwa, parametry) → TaskResult
+        """
+        if self.kind == 'process' and shared is None:
+            return self._run_inline(tasks)
+        pool = self._get_pool()
+        submitted = time.monotonic()
+        futures = {}
+        for task in tasks:
+            if task.key not in futures:
+                if self.kind == 'thread':
+                    # Kontekst wątku skryptu (profil reruna) przechodzi do zadania
+                    futures[task.key] = pool.submit(
+                        contextvars.copy_context().run, _timed_call, task.func, task.args
+                    )
+                else:
+                    args = tuple(
+                        _FRAME if arg is frame and frame is not None
+                        else _CUBE if arg is cube and cube is not None
+                        else arg
+                        for arg in task.args
+                    )
+                    futures[task.key] = pool.submit(_shared_call, shared, task.func, args)
+
+        results = {}
+        for key, future in futures.items():
+            remaining = max(submitted + self.timeout - time.monotonic(), 0)
+            try:
+                value, seconds = future.result(timeout=remaining)
+                results[key] = TaskResult(value, None, seconds)
+                record(f"task:{key[0]}", seconds)
+            except FutureTimeoutError:
+                future.cancel()
+                logger.warning("Zadanie sekcji %s przekroczyło limit %.1fs", key[0], self.timeout)
+                results[key] = TaskResult(None, None, self.timeout, timed_out=True)
+            except Exception as e:
+                results[key] = TaskResult(None, e, 0.0)
+        return results
+
+    def shutdown(self):
+        """Zamyka pulę (nowa zostanie utworzona przy kolejnym run)."""
+        with self._lock:
+            if self._pool is not None:
+                self._pool.shutdown(wait=False, cancel_futures=True)
+                self._pool = None
+
+
+def resolve(prefetched, name, params, func, *args):
+    """
+    Zwraca wynik policzony wcześniej przez SectionExecutor albo liczy go teraz.
+
+    Args:
+        prefetched: dict z SectionExecutor.run (None = tryb sekwencyjny)
+        name, params: Klucz wyniku (jak w SectionTask)
+        func, args: Obliczenie, gdy wyniku nie ma (np. inny stan widgetu)
+
+    Raises:
+        SectionTimeout: Zadanie nie zmieściło się w limicie czasu
+    """
+    result = prefetched.get((name, params)) if prefetched else None
+    if result is None:
+        return func(*args)
+    if result.timed_out:
+        raise SectionTimeout(name)
+    if result.error is not None:
+        raise result.error
+    return result.value
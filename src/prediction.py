@@ -0,0 +1,309 @@
+# 🤖 MODUŁ: Model predykcyjny wynagrodzeń (trening w tle, szybka predykcja wsadowa)
+
+# Model: regresja grzbietowa (Ridge) na log(salary_in_usd) z cechami
+# kategorycznymi one-hot: experience_level, job_title, company_location,
+# company_size, remote_ratio, work_year. Prosty, ale wystarcza do porównań
+# "what-if" - liczy się przepustowość dla setek profili naraz.
+
+# PREDYKCJA BEZ sklearn: model liniowy na one-hot to suma wkładów cech, więc
+# po treningu zamieniamy współczynniki na tabele wartość → wkład (per cecha).
+# Predykcja = suma odczytów z tabel: dla małych partii przez słowniki
+# (pojedynczy profil ~1 ms razem z budową wyniku), dla dużych przez
+# get_indexer + take (kolumny category: indeksujemy tylko kategorie, nie wiersze).
+# Nieznana wartość (np. nowe stanowisko) ma wkład 0 - jak handle_unknown='ignore'.
+
+# PRZEDZIAŁY: reszty z walidacji krzyżowej (w skali log) → ich kwantyle
+# (1-coverage)/2 i (1+coverage)/2 dodane do predykcji (split-conformal).
+# Przedział jest więc multiplikatywny: [pred·e^q_lo, pred·e^q_hi].
+# Kwantyle liczymy na części kalibracyjnej reszt, a pokrycie w metrykach
+# mierzymy na wstrzymanej części (HOLDOUT_FRACTION) - pokrycie zmierzone
+# na tych samych resztach, z których wzięto kwantyle, byłoby ≈ coverage z definicji.
+
+# TRENING POZA RERUNEM: PredictionEngine trenuje w osobnym wątku (jeden na
+# proces) i serwuje ostatni gotowy model. Artefakt SalaryModel jest
+# wersjonowany (odcisk danych + MODEL_VERSION) i - z EDA_CACHE_DIR - zapisywany
+# w DiskCache, więc restart/replika nie trenuje od nowa (src/warmup.py rozgrzewa).
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import NamedTuple
+
+import numpy as np
+import pandas as pd
+
+from src.instrumentation import span
+
+# Zmiana cech/algorytmu → nowa wersja (stare artefakty w cache przestają pasować)
+MODEL_VERSION = 2
+
+FEATURES = [
+    'experience_level',
+    'job_title',
+    'company_location',
+    'company_size',
+    'remote_ratio',
+    'work_year',
+]
+TARGET = 'salary_in_usd'
+
+DEFAULT_ALPHA = 1.0
+DEFAULT_COVERAGE = 0.8
+CV_FOLDS = 5
+# Część reszt walidacji krzyżowej wstrzymana od kalibracji - do pomiaru pokrycia
+HOLDOUT_FRACTION = 0.2
+# Powyżej tej liczby wierszy trenujemy na losowej próbie (czas treningu ograniczony)
+MAX_TRAIN_ROWS = 500_000
+# Do tylu profili odczyt wkładów przez słowniki, powyżej - wektorowo (get_indexer)
+SMALL_BATCH = 2000
+
+
+class ModelMetrics(NamedTuple):
+    """Jakość modelu z walidacji krzyżowej."""
+    rows: int
+    mae: float        # średni błąd bezwzględny w USD
+    coverage: float   # odsetek wartości w przedziale na resztach wstrzymanych (NaN bez nich)
+    seconds: float    # czas treningu
+
+
+def _as_strings(values):
+    # Jednolite klucze tabel: '2024', '100', 'SE' niezależnie od typu kolumny
+    return values.astype(str)
+
+
+def _positions(index, values):
+    # Pozycje wartości w tabeli wkładów (-1 = wartość nieznana modelowi)
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        per_category = index.get_indexer(_as_strings(values.cat.categories))
+        codes = values.cat.codes.to_numpy()
+        return np.where(codes >= 0, per_category[codes], -1)
+    return index.get_indexer(_as_strings(values))
+
+
+def _fit(features, y, alpha):
+    from sklearn.linear_model import Ridge
+    from sklearn.preprocessing import OneHotEncoder
+
+    encoder = OneHotEncoder(handle_unknown='ignore')
+    model = Ridge(alpha=alpha).fit(encoder.fit_transform(features), y)
+    return encoder, model
+
+
+class SalaryModel:
+    """
+    Wytrenowany model: wkłady wartości cech (skala log) i kwantyle reszt.
+
+    Args:
+        intercept: Wyraz wolny (log USD)
+        tables: Słownik cecha → pd.Series (wartość jako str → wkład)
+        residuals: (q_lo, q_hi) - kwantyle reszt w skali log
+        coverage: Nominalne pokrycie przedziału (np. 0.8)
+        version_id: Odcisk danych, na których trenowano
+        metrics: ModelMetrics
+    """
+
+    def __init__(self, intercept, tables, residuals, coverage, version_id, metrics):
+        self.intercept = float(intercept)
+        self.tables = tables
+        self.residuals = residuals
+        self.coverage = coverage
+        self.version_id = version_id
+        self.metrics = metrics
+        self.model_version = MODEL_VERSION
+        self._lookups = {feature: dict(table.items()) for feature, table in tables.items()}
+
+    def options(self, feature):
+        """Wartości cechy znane modelowi (posortowane; liczby - numerycznie)."""
+        values = list(self.tables[feature].index)
+        if all(value.isdigit() for value in values):
+            return sorted(values, key=int)
+        return sorted(values)
+
+    def log_predict(self, profiles):
+        """Predykcja w skali log dla DataFrame z kolumnami FEATURES."""
+        n = len(profiles)
+        total = np.full(n, self.intercept)
+        for feature, table in self.tables.items():
+            if n <= SMALL_BATCH:
+                lookup = self._lookups[feature]
+                values = profiles[feature].tolist()
+                total += np.fromiter((lookup.get(str(v), 0.0) for v in values), float, n)
+            else:
+                positions = _positions(table.index, profiles[feature])
+                total += np.where(positions >= 0, table.to_numpy()[positions], 0.0)
+        return total
+
+    def predict(self, profiles):
+        """
+        Predykcja wsadowa z przedziałami.
+
+        Args:
+            profiles: DataFrame z kolumnami FEATURES (dowolna liczba wierszy)
+
+        Returns:
+            pd.DataFrame: prediction, lower, upper (USD) - indeks jak w `profiles`
+        """
+        log_prediction = self.log_predict(profiles)
+        q_lo, q_hi = self.residuals
+        return pd.DataFrame({
+            'prediction': np.exp(log_prediction),
+            'lower': np.exp(log_prediction + q_lo),
+            'upper': np.exp(log_prediction + q_hi),
+        }, index=profiles.index)
+
+
+def train_model(df, version_id=None, alpha=DEFAULT_ALPHA, coverage=DEFAULT_COVERAGE,
+                folds=CV_FOLDS, max_rows=MAX_TRAIN_ROWS, holdout=HOLDOUT_FRACTION, seed=0):
+    """
+    Trenuje SalaryModel na danych wynagrodzeń.
+
+    Args:
+        df: DataFrame z kolumnami FEATURES i salary_in_usd
+        version_id: Odcisk danych zapisany w artefakcie
+        alpha: Siła regularyzacji Ridge
+        coverage: Pokrycie przedziałów predykcji
+        folds: Liczba podziałów walidacji krzyżowej (reszty do przedziałów)
+        max_rows: Maksymalna liczba wierszy treningowych (losowa próba)
+        holdout: Część reszt wstrzymana od kalibracji przedziału (pomiar pokrycia)
+
+    Returns:
+        SalaryModel
+    """
+    from sklearn.model_selection import KFold
+
+    start = time.perf_counter()
+    data = df[FEATURES + [TARGET]].dropna()
+    data = data[data[TARGET] > 0]
+    if len(data) < folds:
+        raise ValueError(f"Za mało danych do treningu modelu ({len(data)} wierszy)")
+    if len(data) > max_rows:
+        data = data.sample(max_rows, random_state=seed)
+    features = pd.DataFrame({feature: _as_strings(data[feature]) for feature in FEATURES})
+    y = np.log(data[TARGET].to_numpy(dtype=float))
+
+    # Reszty "poza próbą" z walidacji krzyżowej → kwantyle przedziału
+    residuals = np.empty(len(y))
+    for train, test in KFold(folds, shuffle=True, random_state=seed).split(features):
+        encoder, model = _fit(features.iloc[train], y[train], alpha)
+        residuals[test] = y[test] - model.predict(encoder.transform(features.iloc[test]))
+    # Kalibracja kwantyli bez reszt wstrzymanych (zawsze co najmniej jedna reszta)
+    held_out = np.random.default_rng(seed).random(len(y)) < holdout
+    if held_out.all():
+        held_out[0] = False
+    q_lo, q_hi = np.quantile(residuals[~held_out], [(1 - coverage) / 2, (1 + coverage) / 2])
+
+    # Model końcowy na wszystkich danych → tabele wkładów cech
+    encoder, model = _fit(features, y, alpha)
+    tables, offset = {}, 0
+    for feature, categories in zip(FEATURES, encoder.categories_):
+        tables[feature] = pd.Series(model.coef_[offset:offset + len(categories)], index=pd.Index(categories))
+        offset += len(categories)
+
+    predicted = y - residuals
+    metrics = ModelMetrics(
+        rows=len(y),
+        mae=float(np.mean(np.abs(np.exp(y) - np.exp(predicted)))),
+        coverage=(
+            float(np.mean((residuals[held_out] >= q_lo) & (residuals[held_out] <= q_hi)))
+            if held_out.any() else float('nan')
+        ),
+        seconds=time.perf_counter() - start,
+    )
+    return SalaryModel(model.intercept_, tables, (float(q_lo), float(q_hi)), coverage, version_id, metrics)
+
+
+def profile_grid(options, limit=None):
+    """
+    Wszystkie kombinacje wybranych wartości cech (scenariusze what-if).
+
+    Args:
+        options: Słownik cecha → lista wartości (wszystkie FEATURES)
+        limit: Maksymalna liczba profili (None = bez limitu)
+
+    Returns:
+        pd.DataFrame: Jeden wiersz na profil, kolumny FEATURES
+    """
+    grid = pd.MultiIndex.from_product([list(options[f]) for f in FEATURES], names=FEATURES)
+    if limit is not None:
+        grid = grid[:limit]
+    return grid.to_frame(index=False)
+
+
+class PredictionEngine:
+    """
+    Trenuje modele w tle (jeden wątek) i serwuje ostatni gotowy model.
+
+    Args:
+        disk_cache: Opcjonalny DiskCache - artefakty przeżywają restart procesu
+    """
+
+    def __init__(self, disk_cache=None):
+        self.disk_cache = disk_cache
+        self._pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix='salary-model')
+        self._lock = threading.Lock()
+        self._ready = None
+        self._pending = None  # (version_id, Future) ostatnio zleconego treningu
+        self.error = None
+
+    def _train(self, df, version_id):
+        def build():
+            with span('prediction:train'):
+                return train_model(df, version_id)
+
+        try:
+            if self.disk_cache is None:
+                model = build()
+            else:
+                model = self.disk_cache.get_or_build(('salary_model', version_id, MODEL_VERSION), build)
+        except Exception as e:
+            # Błąd zapisany przed zakończeniem zlecenia - widoczny od razu po wait()
+            with self._lock:
+                self.error = e
+            raise
+        with self._lock:
+            self._ready = model
+            # Błąd poprzedniej próby zostaje widoczny w sekcji do udanego treningu
+            self.error = None
+        return model
+
+    def model(self, df, version_id):
+        """
+        Zwraca ostatni gotowy model; gdy brak modelu dla tej wersji danych,
+        zleca trening w tle (bez czekania).
+
+        Returns:
+            tuple: (SalaryModel lub None, czy model pasuje do `version_id`)
+        """
+        with self._lock:
+            ready = self._ready
+            if ready is not None and ready.version_id == version_id:
+                return ready, True
+            # Zakończone zlecenie bez gotowego modelu tej wersji = nieudany trening
+            # (callback _on_done mógł jeszcze nie zdążyć go zwolnić) - ponawiamy
+            pending = self._pending
+            if pending is None or pending[0] != version_id or pending[1].done():
+                future = self._pool.submit(self._train, df, version_id)
+                future.add_done_callback(self._on_done)
+                self._pending = (version_id, future)
+        return ready, False
+
+    def _on_done(self, future):
+        if future.exception() is not None:
+            with self._lock:
+                # Nieudany trening nie blokuje wersji - kolejne model() zleci go ponownie
+                if self._pending is not None and self._pending[1] is future:
+                    self._pending = None
+
+    def wait(self, timeout=None):
+        """Czeka na zlecony trening (warm-up, testy); zwraca gotowy model."""
+        pending = self._pending
+        if pending is not None:
+            pending[1].result(timeout)
+        elif self.error is not None:
+            # Trening zdążył się nie udać (i zwolnić zlecenie) przed wait()
+            raise self.error
+        return self._ready
+
+    def shutdown(self):
+        """Zamyka wątek treningu."""
+        self._pool.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,178 @@
+# 🏆 MODUŁ: Zmaterializowane rankingi top-N
+
+# Tabela "Top 10 stanowisk" liczyła przy każdym ruchu suwaka min_count
+# (10-300) pełny groupby + sort_values. Ranking liczymy RAZ na wersję danych:
+# klucze posortowane malejąco po średniej, z licznością i sumą dla każdego.
+# Dowolny próg min_count to wtedy skan od góry z wczesnym wyjściem - kończymy,
+# gdy uzbieramy `limit` kluczy spełniających próg.
+
+# Dopisanie danych (src/live_data.py) nie przebudowuje rankingu: liczności
+# i sumy kluczy z delty są dodawane, a tylko zmienione klucze są wstawiane
+# w nowe miejsca (searchsorted) - reszta zostaje posortowana.
+
+# Ten sam mechanizm obsługuje inne widoki top-N, np. kraje wg średniej
+# w sekcji geograficznej. Rankingi są zapamiętywane przy kostce (jak indeks
+# stanowisk w src/job_index.py).
+
+import threading
+import weakref
+
+import numpy as np
+import pandas as pd
+
+# Pierwszy blok skanu = limit × SCAN_FACTOR kluczy (kolejne bloki są dwa razy większe)
+SCAN_FACTOR = 4
+
+_RANKINGS = weakref.WeakKeyDictionary()
+_RANKINGS_LOCK = threading.Lock()
+
+
+class Ranking:
+    """
+    Klucze posortowane malejąco po średnim wynagrodzeniu.
+
+    Args:
+        column: Kolumna klucza (np. 'job_title')
+        keys, counts, sums: Tablice per klucz (dowolna kolejność)
+    """
+
+    def __init__(self, column, keys, counts, sums):
+        self.column = column
+        counts = np.asarray(counts, dtype=np.int64)
+        sums = np.asarray(sums, dtype=np.float64)
+        means = sums / np.maximum(counts, 1)
+        order = np.argsort(-means, kind='stable')
+        self.keys = np.asarray(keys, dtype=object)[order]
+        self.counts = counts[order]
+        self.sums = sums[order]
+        self.means = means[order]
+
+    @classmethod
+    def from_cube(cls, cube, column):
+        """
+        Buduje ranking z komórek kostki.
+
+        Liczności i sumy per klucz to np.bincount po kodach kategorii - bez
+        groupby, więc koszt to jeden przebieg po komórkach (także dla małej
+        kostki delty w merged/carry_over).
+        """
+        cells = cube.cells
+        keys = pd.Categorical(cells[column])
+        present = keys.codes >= 0
+        codes = keys.codes[present]
+        size = len(keys.categories)
+        counts = np.bincount(codes, weights=cells['count'].to_numpy()[present], minlength=size)
+        sums = np.bincount(codes, weights=cells['sum'].to_numpy()[present], minlength=size)
+        # Kategorie bez komórek (np. po SalaryCube.subset) nie trafiają do rankingu
+        used = counts > 0
+        return cls(column, keys.categories.astype(str).to_numpy()[used], counts[used].round(), sums[used])
+
+    def __len__(self):
+        return len(self.keys)
+
+    def _frame(self, positions):
+        return pd.DataFrame({
+            self.column: self.keys[positions],
+            'mean_salary': self.means[positions],
+            'count': self.counts[positions],
+        })
+
+    def top(self, min_count=0, limit=10):
+        """
+        Top `limit` kluczy z co najmniej `min_count` rekordami.
+
+        Skanuje ranking blokami od góry i kończy, gdy ma `limit` wyników -
+        dla typowych progów czyta ułamek kluczy.
+
+        Returns:
+            pd.DataFrame: klucz, mean_salary, count - malejąco po średniej
+        """
+        found = []
+        start, step = 0, max(limit * SCAN_FACTOR, 1)
+        while len(found) < limit and start < len(self.keys):
+            block = np.flatnonzero(self.counts[start:start + step] >= min_count) + start
+            found.extend(block[:limit - len(found)])
+            start += step
+            step *= 2
+        return self._frame(np.asarray(found, dtype=np.int64))
+
+    def table(self, min_count=0):
+        """Cały ranking (opcjonalnie z progiem liczności) jako DataFrame."""
+        return self._frame(np.flatnonzero(self.counts >= min_count))
+
+    def merged(self, other):
+        """
+        Nowy ranking po dopisaniu danych (np. Ranking.from_cube(kostka_delty, ...)).
+
+        Tylko klucze obecne w `other` zmieniają pozycję - są wyjmowane
+        i wstawiane z powrotem w posortowaną resztę.
+        """
+        positions = pd.Index(self.keys).get_indexer(pd.Index(other.keys))
+        existing = positions >= 0
+        counts, sums = self.counts.copy(), self.sums.copy()
+        np.add.at(counts, positions[existing], other.counts[existing])
+        np.add.at(sums, positions[existing], other.sums[existing])
+
+        moved = np.zeros(len(self.keys), dtype=bool)
+        moved[positions[existing]] = True
+        moved_keys = np.concatenate([self.keys[moved], other.keys[~existing]])
+        moved_counts = np.concatenate([counts[moved], other.counts[~existing]])
+        moved_sums = np.concatenate([sums[moved], other.sums[~existing]])
+        moved_means = moved_sums / np.maximum(moved_counts, 1)
+        order = np.argsort(-moved_means, kind='stable')
+
+        keep = ~moved
+        kept_means = self.means[keep]
+        # Reszta jest posortowana malejąco → searchsorted na wartościach ujemnych
+        at = np.searchsorted(-kept_means, -moved_means[order], side='right')
+        result = Ranking.__new__(Ranking)
+        result.column = self.column
+        result.keys = np.insert(self.keys[keep], at, moved_keys[order])
+        result.counts = np.insert(counts[keep], at, moved_counts[order])
+        result.sums = np.insert(sums[keep], at, moved_sums[order])
+        result.means = np.insert(kept_means, at, moved_means[order])
+        return result
+
+
+def ranking(cube, column):
+    """
+    Ranking `column` dla kostki (budowany raz, zapamiętany przy kostce).
+
+    Args:
+        cube: SalaryCube danych lub widoku filtrów
+        column: Kolumna klucza z CUBE_KEYS
+    """
+    with _RANKINGS_LOCK:
+        built = _RANKINGS.get(cube, {}).get(column)
+    if built is not None:
+        return built
+    built = Ranking.from_cube(cube, column)
+    with _RANKINGS_LOCK:
+        _RANKINGS.setdefault(cube, {})[column] = built
+    return built
+
+
+def clear_rankings():
+    """Zapomina wszystkie zapamiętane rankingi (np. przed pomiarem "na zimno")."""
+    with _RANKINGS_LOCK:
+        _RANKINGS.clear()
+
+
+def carry_over(old_cube, new_cube, delta_cube):
+    """
+    Przenosi rankingi na kostkę po dopisaniu danych - przyrostowo.
+
+    Args:
+        old_cube: Kostka przed dopisaniem (z już zbudowanymi rankingami)
+        new_cube: old_cube.merge(delta_cube)
+        delta_cube: Kostka samych dopisanych wierszy
+    """
+    with _RANKINGS_LOCK:
+        built = dict(_RANKINGS.get(old_cube, {}))
+    updated = {
+        column: existing.merged(Ranking.from_cube(delta_cube, column))
+        for column, existing in built.items()
+    }
+    if updated:
+        with _RANKINGS_LOCK:
+            _RANKINGS.setdefault(new_cube, {}).update(updated)
@@ -0,0 +1,262 @@
+# 🧬 MODUŁ: Dane współdzielone między procesami (memory-mapped Arrow IPC)
+
+# Każdy proces Streamlit (i każda replika na węźle) trzymał własną kopię tabeli.
+# W tym trybie tabela jest PUBLIKOWANA raz jako plik Arrow IPC (bez kompresji)
+# w katalogu współdzielonym - najlepiej na tmpfs (/dev/shm) - a każdy proces
+# mapuje go read-only (pa.memory_map). Strony pliku leżą w page cache jądra
+# raz na węzeł, niezależnie od liczby procesów.
+
+# ZERO-COPY: kolumny liczbowe to widoki NumPy na zmapowane bufory, a kolumny
+# category to Categorical.from_codes na zmapowanych kodach (kopiowany jest
+# tylko mały słownik kategorii). Bufory są tylko do odczytu - pandas z
+# copy-on-write skopiuje kolumnę dopiero przy próbie zapisu.
+# Kolumny z brakami (null) nie dają się zmapować bez kopii - są konwertowane.
+
+# WERSJONOWANIE: każda publikacja to nowy, niezmienny plik
+#   salaries-v<wersja>.arrow
+# a plik wskaźnika CURRENT (JSON: wersja, plik, odcisk danych, odcisk źródła)
+# jest podmieniany atomowo (plik tymczasowy + os.replace). Czytelnik widzi
+# więc starą albo nową wersję - nigdy w połowie zapisu. Procesy, które
+# zmapowały starą wersję, korzystają z niej do najbliższego odświeżenia
+# (usunięty plik pozostaje dostępny przez mapowanie).
+
+# Publikuje pierwszy proces, który zauważy nowe dane źródłowe (blokada
+# plikowa O_EXCL) - pozostałe tylko mapują gotowy plik.
+
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+import pandas as pd
+
+from src.aggregates import SalaryCube
+from src.data_loader import _has_pyarrow, load_data
+from src.disk_cache import file_digest, write_atomic
+from src.figure_cache import dataset_fingerprint, file_fingerprint
+from src.instrumentation import span
+from src.live_data import DatasetSnapshot
+
+logger = logging.getLogger(__name__)
+
+POINTER_FILE = 'CURRENT'
+LOCK_FILE = 'publish.lock'
+
+# Ile ostatnich wersji zostawiamy na dysku (starsze są usuwane po publikacji)
+KEEP_VERSIONS = 2
+
+
+def read_pointer(directory):
+    """Zwraca wskaźnik bieżącej wersji (dict) lub None, gdy nic nie opublikowano."""
+    try:
+        with open(os.path.join(directory, POINTER_FILE)) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _to_arrow_table(df):
+    import pyarrow as pa
+
+    # Budujemy tablice ręcznie: category → słownik z kodami pandas (ten sam
+    # typ indeksów, więc odczyt mapuje je bez kopii), liczby bez zamiany NaN na null
+    arrays = []
+    for col in df.columns:
+        series = df[col]
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            codes = series.cat.codes.to_numpy()
+            arrays.append(pa.DictionaryArray.from_arrays(
+                pa.array(codes, mask=codes < 0),
+                pa.array(series.cat.categories.to_numpy(dtype=object)),
+            ))
+        else:
+            arrays.append(pa.array(series.to_numpy(), from_pandas=False))
+    return pa.Table.from_arrays(arrays, names=list(df.columns))
+
+
+def publish(df, directory, source=None, fingerprint=None):
+    """
+    Publikuje DataFrame jako nową wersję pliku Arrow IPC i podmienia wskaźnik.
+
+    Args:
+        df: Dane do opublikowania (schemat SCHEMA)
+        directory: Katalog współdzielony przez procesy
+        source: Opcjonalny odcisk pliku źródłowego (do wykrywania zmian)
+        fingerprint: Odcisk danych (domyślnie dataset_fingerprint(df))
+
+    Returns:
+        dict: Nowy wskaźnik (version, file, fingerprint, source, rows)
+    """
+    import pyarrow as pa
+    import pyarrow.ipc as ipc
+
+    os.makedirs(directory, exist_ok=True)
+    previous = read_pointer(directory)
+    version = previous['version'] + 1 if previous else 1
+    filename = f"salaries-v{version}.arrow"
+    table = _to_arrow_table(df)
+
+    def write_table(path):
+        # Jeden record batch = jeden blok na kolumnę (mapowanie bez sklejania)
+        with pa.OSFile(path, 'wb') as sink:
+            with ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table, max_chunksize=max(len(table), 1))
+
+    write_atomic(os.path.join(directory, filename), write_table)
+    pointer = {
+        'version': version,
+        'file': filename,
+        'fingerprint': fingerprint or dataset_fingerprint(df),
+        'source': source,
+        'rows': len(df),
+    }
+
+    def write_pointer(path):
+        with open(path, 'w') as f:
+            json.dump(pointer, f)
+
+    write_atomic(os.path.join(directory, POINTER_FILE), write_pointer)
+    _remove_old_versions(directory, version)
+    return pointer
+
+
+def _remove_old_versions(directory, version):
+    for name in os.listdir(directory):
+        if not (name.startswith('salaries-v') and name.endswith('.arrow')):
+            continue
+        try:
+            if int(name[len('salaries-v'):-len('.arrow')]) <= version - KEEP_VERSIONS:
+                os.remove(os.path.join(directory, name))
+        except (ValueError, OSError):
+            # Obcy plik albo (Windows) plik wciąż zmapowany - spróbujemy następnym razem
+            pass
+
+
+def map_frame(path):
+    """
+    Mapuje plik Arrow IPC read-only i zwraca DataFrame bez kopiowania danych.
+
+    Returns:
+        pd.DataFrame: Kolumny oparte na zmapowanych buforach (tylko do odczytu)
+    """
+    import pyarrow as pa
+    import pyarrow.ipc as ipc
+
+    # Mapowanie NIE jest zamykane - bufory tabeli trzymają do niego referencję
+    table = ipc.open_file(pa.memory_map(path, 'r')).read_all().combine_chunks()
+    columns = {}
+    for name, column in zip(table.column_names, table.columns):
+        chunk = column.chunk(0) if column.num_chunks else None
+        if chunk is None or chunk.null_count:
+            columns[name] = column.to_pandas()
+        elif pa.types.is_dictionary(chunk.type):
+            columns[name] = pd.Categorical.from_codes(
+                chunk.indices.to_numpy(zero_copy_only=True),
+                categories=pd.Index(chunk.dictionary.to_pylist()),
+            )
+        else:
+            columns[name] = chunk.to_numpy(zero_copy_only=True)
+    return pd.DataFrame(columns, copy=False)
+
+
+@contextmanager
+def _publish_lock(directory, timeout=300):
+    # Blokada międzyprocesowa przez O_EXCL (działa też poza Linuksem);
+    # blokada starsza niż `timeout` jest uznawana za porzuconą
+    path = os.path.join(directory, LOCK_FILE)
+    while True:
+        try:
+            fd = os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            break
+        except FileExistsError:
+            try:
+                if time.time() - os.path.getmtime(path) > timeout:
+                    os.remove(path)
+            except OSError:
+                pass
+            time.sleep(0.1)
+    try:
+        yield
+    finally:
+        os.close(fd)
+        os.remove(path)
+
+
+class SharedDataset:
+    """
+    Dane mapowane z katalogu współdzielonego; interfejs jak LiveDataset
+    (refresh() + current: DatasetSnapshot).
+
+    Args:
+        source: Ścieżka do pliku źródłowego z danymi
+        directory: Katalog współdzielony (np. /dev/shm/eda)
+        min_interval: Minimalny odstęp (s) między sprawdzeniami wskaźnika
+    """
+
+    def __init__(self, source, directory, min_interval=2.0):
+        if not os.path.exists(source):
+            raise FileNotFoundError(source)
+        if not _has_pyarrow():
+            # Bez pyarrow nie ma pa.memory_map / ipc - błąd od razu, nie przy publikacji
+            raise ImportError("Tryb współdzielony (EDA_SHARED_DIR) wymaga pakietu pyarrow (pip install pyarrow)")
+        self.source = source
+        self.directory = directory
+        self.min_interval = min_interval
+        self.current = None
+        self._lock = threading.Lock()
+        self._checked_at = 0.0
+        os.makedirs(directory, exist_ok=True)
+        self.refresh(force=True)
+
+    def _ensure_published(self):
+        # Publikujemy, gdy brak wersji albo plik źródłowy się zmienił
+        source = file_fingerprint(self.source)
+        pointer = read_pointer(self.directory)
+        if pointer is not None and pointer.get('source') == source:
+            return pointer
+        with _publish_lock(self.directory):
+            # Inny proces mógł opublikować w czasie oczekiwania na blokadę
+            pointer = read_pointer(self.directory)
+            if pointer is not None and pointer.get('source') == source:
+                return pointer
+            logger.info("Publikacja danych %s w %s", self.source, self.directory)
+            # Odcisk = hash zawartości pliku - ten sam, co w LiveDataset (src/live_data.py)
+            fingerprint = file_digest(self.source)
+            with span('publish'):
+                return publish(load_data(self.source), self.directory, source=source, fingerprint=fingerprint)
+
+    def refresh(self, force=False):
+        """
+        Sprawdza wskaźnik wersji i mapuje nową wersję, jeśli się pojawiła.
+
+        Returns:
+            bool: True, jeśli proces przełączył się na nową wersję danych
+        """
+        now = time.monotonic()
+        if not force and now - self._checked_at < self.min_interval:
+            return False
+        if not self._lock.acquire(blocking=False):
+            return False
+        try:
+            self._checked_at = now
+            while True:
+                pointer = self._ensure_published()
+                if self.current is not None and self.current.version == pointer['version']:
+                    return False
+                path = os.path.join(self.directory, pointer['file'])
+                try:
+                    with span('map_frame'):
+                        df = map_frame(path)
+                    break
+                except FileNotFoundError:
+                    # Wersja usunięta przez szybszą kolejną publikację - czytamy wskaźnik ponownie
+                    continue
+            self.current = DatasetSnapshot(
+                df, SalaryCube.from_frame(df), pointer['fingerprint'],
+                pointer['version'], None, None, path=path,
+            )
+            return True
+        finally:
+            self._lock.release()
@@ -0,0 +1,242 @@
+# 📸 MODUŁ: Snapshot dashboardu EDA (wyniki policzone offline)
+
+# Większość wejść na stronę EDA pokazuje stan domyślny widgetów (min_count=50,
+# kraje US/GB/DE/PL, cutoff=2) - a każde liczyło cały potok show_eda.
+# Krok budowania (CLI poniżej) liczy bez przeglądarki wszystkie zadania sekcji
+# (EDA_SECTION_TASKS) dla stanu domyślnego i listy popularnych stanów, i zapisuje:
+# - results.pkl   - wyniki zadań: (nazwa, parametry) → TaskResult, czyli
+#                   dokładnie to, czego oczekuje resolve() w sekcjach
+# - figures/*.json - każdy wykres jako JSON Plotly (np. dla CDN / innych klientów)
+# - index.html    - statyczna strona stanu domyślnego (działa bez serwera)
+# - manifest.json - odcisk danych, wersja kodu, stany, lista zadań i plików
+# Aplikacja (EDA_SNAPSHOT_DIR) podaje wyniki snapshotu jako `prefetched` do
+# show_eda: zadanie o pasującym kluczu (ten sam stan widgetu) nie jest
+# liczone, inne stany liczą się na żywo. Snapshot jest używany tylko dla
+# tego samego odcisku danych i wersji kodu (src/disk_cache.code_version).
+
+# Uruchomienie (z głównego katalogu projektu):
+#   python -m src.snapshot --out snapshot
+#   python -m src.snapshot --out snapshot --states popular_states.json
+# popular_states.json: lista słowników klucz widgetu → wartość, np.
+#   [{"top_jobs_min_count": 100}, {"distribution_cutoff": 5, "trend_mean": true}]
+
+import argparse
+import hashlib
+import html
+import json
+import logging
+import os
+import pickle
+import sys
+import time
+from typing import NamedTuple
+
+import pandas as pd
+import plotly.graph_objects as go
+import plotly.io as pio
+from plotly.offline import get_plotlyjs
+from streamlit import config as streamlit_config, logger as streamlit_logger
+
+from src.components.sidebar import EDA_SECTION_LABELS
+from src.disk_cache import code_version, write_atomic
+from src.eda import EDA_SECTION_TASKS
+from src.live_data import LiveDataset
+from src.parallel import TaskResult
+
+logger = logging.getLogger(__name__)
+
+RESULTS_FILE = 'results.pkl'
+MANIFEST_FILE = 'manifest.json'
+DEFAULT_DATA_PATH = os.path.join(os.path.dirname(__file__), '..', 'data', 'DataScience_salaries_2025.csv')
+
+# Stan domyślny = pusty słownik: każdy widget ma wartość domyślną z src/eda.py
+DEFAULT_STATE = {}
+
+
+class Snapshot(NamedTuple):
+    """Wczytany snapshot: odcisk danych, wersja kodu i wyniki zadań."""
+    fingerprint: str
+    version: str
+    results: dict
+
+    def matches(self, fingerprint):
+        return self.fingerprint == fingerprint and self.version == code_version()
+
+
+def build_results(df, cube, fingerprint, states=(DEFAULT_STATE,)):
+    """
+    Liczy zadania wszystkich sekcji dla podanych stanów widgetów.
+
+    Args:
+        df, cube, fingerprint: Dane jak dla show_eda (bez filtrów globalnych)
+        states: Stany widgetów (słowniki klucz widgetu → wartość)
+
+    Returns:
+        dict: (nazwa, parametry) → TaskResult (te same klucze co resolve())
+    """
+    results = {}
+    for state in states:
+        for planner in EDA_SECTION_TASKS.values():
+            for task in planner(df, cube, fingerprint, state):
+                if task.key in results:
+                    continue
+                start = time.perf_counter()
+                value = task.func(*task.args)
+                results[task.key] = TaskResult(value, None, time.perf_counter() - start)
+    return results
+
+
+def _figures(value):
+    # Wykresy w wyniku zadania: Figure, krotka (fig, ...) albo NamedTuple z polem Figure
+    if isinstance(value, go.Figure):
+        return [value]
+    if isinstance(value, tuple):
+        return [fig for item in value for fig in _figures(item)]
+    return []
+
+
+def _task_slug(key):
+    name, params = key
+    return f"{name}-{hashlib.sha1(repr(params).encode()).hexdigest()[:10]}"
+
+
+def _html_value(value):
+    if isinstance(value, go.Figure):
+        return pio.to_html(value, full_html=False, include_plotlyjs=False)
+    if isinstance(value, pd.DataFrame):
+        return value.to_html(index=False, float_format=lambda v: f"{v:,.0f}", border=0)
+    if hasattr(value, '_fields'):
+        scalars = {
+            field: item for field, item in zip(value._fields, value)
+            if isinstance(item, (int, float, str))
+        }
+        parts = []
+        if scalars:
+            parts.append(pd.DataFrame([scalars]).to_html(index=False, float_format=lambda v: f"{v:,.0f}", border=0))
+        parts += [_html_value(item) for item in value if isinstance(item, (pd.DataFrame, go.Figure))]
+        return "\n".join(parts)
+    if isinstance(value, tuple):
+        return "\n".join(_html_value(item) for item in value)
+    return ""
+
+
+def render_html(results, df, cube, fingerprint):
+    """Statyczna strona stanu domyślnego: sekcje w kolejności strony, tabele i wykresy."""
+    body = []
+    for key, planner in EDA_SECTION_TASKS.items():
+        tasks = planner(df, cube, fingerprint, DEFAULT_STATE)
+        if not tasks:
+            continue
+        body.append(f"<h2>{html.escape(EDA_SECTION_LABELS.get(key, key))}</h2>")
+        for task in tasks:
+            body.append(_html_value(results[task.key].value))
+    return (
+        "<!DOCTYPE html>\n<html lang=\"pl\">\n<head>\n<meta charset=\"utf-8\">\n"
+        "<title>Data Science Salaries - snapshot</title>\n"
+        "<script src=\"plotly.min.js\"></script>\n"
+        "<style>body{font-family:sans-serif;margin:2rem} table{border-collapse:collapse}"
+        " td,th{padding:0.2rem 0.6rem;text-align:right}</style>\n</head>\n<body>\n"
+        "<h1>💼 Dashboard Wynagrodzeń Data Science</h1>\n"
+        f"<p>Odcisk danych: <code>{html.escape(fingerprint)}</code></p>\n"
+        + "\n".join(body) + "\n</body>\n</html>\n"
+    )
+
+
+def write_snapshot(directory, results, fingerprint, states, page=None):
+    """
+    Zapisuje snapshot: wyniki (pickle), wykresy (JSON), manifest i opcjonalnie HTML.
+
+    Args:
+        directory: Katalog docelowy (tworzony w razie potrzeby)
+        results: Wynik build_results
+        fingerprint: Odcisk danych
+        states: Stany, dla których liczono wyniki
+        page: Gotowa strona HTML (render_html) albo None
+    """
+    os.makedirs(os.path.join(directory, 'figures'), exist_ok=True)
+    tasks = []
+    for key, result in results.items():
+        files = []
+        for i, fig in enumerate(_figures(result.value)):
+            name = f"figures/{_task_slug(key)}-{i}.json"
+            payload = pio.to_json(fig, validate=False)
+            write_atomic(os.path.join(directory, name), lambda tmp: _write_text(tmp, payload))
+            files.append(name)
+        tasks.append({'name': key[0], 'params': repr(key[1]), 'seconds': result.seconds, 'figures': files})
+
+    snapshot = Snapshot(fingerprint, code_version(), results)
+    payload = pickle.dumps(tuple(snapshot), protocol=pickle.HIGHEST_PROTOCOL)
+    write_atomic(os.path.join(directory, RESULTS_FILE), lambda tmp: _write_bytes(tmp, payload))
+
+    if page is not None:
+        write_atomic(os.path.join(directory, 'plotly.min.js'), lambda tmp: _write_text(tmp, get_plotlyjs()))
+        write_atomic(os.path.join(directory, 'index.html'), lambda tmp: _write_text(tmp, page))
+
+    manifest = {
+        'fingerprint': fingerprint,
+        'code_version': snapshot.version,
+        'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'states': list(states),
+        'tasks': tasks,
+    }
+    write_atomic(
+        os.path.join(directory, MANIFEST_FILE),
+        lambda tmp: _write_text(tmp, json.dumps(manifest, indent=2, ensure_ascii=False)),
+    )
+
+
+def _write_text(path, text):
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(text)
+
+
+def _write_bytes(path, data):
+    with open(path, 'wb') as f:
+        f.write(data)
+
+
+def load_snapshot(directory):
+    """
+    Wczytuje snapshot z katalogu.
+
+    Returns:
+        Snapshot albo None (brak katalogu/pliku albo plik nieczytelny)
+    """
+    try:
+        with open(os.path.join(directory, RESULTS_FILE), 'rb') as f:
+            return Snapshot(*pickle.load(f))
+    except FileNotFoundError:
+        return None
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError, TypeError) as e:
+        logger.warning("Nie udało się wczytać snapshotu %s: %s", directory, e)
+        return None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Snapshot dashboardu EDA (wyniki liczone offline)")
+    parser.add_argument('--data', default=DEFAULT_DATA_PATH, help="plik z danymi")
+    parser.add_argument('--out', default='snapshot', help="katalog snapshotu")
+    parser.add_argument('--states', help="plik JSON z listą dodatkowych stanów widgetów")
+    parser.add_argument('--no-html', action='store_true', help="bez statycznej strony index.html")
+    args = parser.parse_args(argv)
+
+    states = [DEFAULT_STATE]
+    if args.states:
+        with open(args.states, encoding='utf-8') as f:
+            states += json.load(f)
+
+    # Sekcje czytają stan z `state` - logi trybu "bare" Streamlit wyciszamy
+    streamlit_config.get_option('logger.level')
+    streamlit_logger.set_log_level(logging.CRITICAL)
+
+    snapshot = LiveDataset(args.data).current
+    start = time.perf_counter()
+    results = build_results(snapshot.df, snapshot.cube, snapshot.version_id, states)
+    page = None if args.no_html else render_html(results, snapshot.df, snapshot.cube, snapshot.version_id)
+    write_snapshot(args.out, results, snapshot.version_id, states, page)
+    print(f"📸 {args.out}: {len(results)} zadań dla {len(states)} stanów ({time.perf_counter() - start:.2f} s)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,34 +1,36 @@
+import numpy as np
 import plotly.express as px
 import plotly.graph_objects as go
 
-def create_salary_trend_chart(df, metric_type='mean'):
+def create_salary_trend_chart(trend_stats, metric_type='mean'):
     
     #Tworzy wykres trendu wynagrodzeń w czasie.
+    #trend_stats: agregaty per work_year (mean_salary / median_salary / count),
+    #np. SalaryCube.rollup(['work_year'])
     if metric_type in ['mean', 'median']:
         if metric_type == 'mean':
-            data = df.groupby('work_year')['salary_in_usd'].mean().reset_index()
+            y_column = 'mean_salary'
             title = "Średnie wynagrodzenie w czasie"
             y_label = "Średnie wynagrodzenie (USD)"
         else:
-            data = df.groupby('work_year')['salary_in_usd'].median().reset_index()
+            y_column = 'median_salary'
             title = "Mediana wynagrodzenia w czasie"
             y_label = "Mediana wynagrodzenia (USD)"
         
         fig = px.bar(
-            data,
+            trend_stats,
             x='work_year',
-            y='salary_in_usd',
+            y=y_column,
             title=title,
-            labels={'work_year': 'Rok', 'salary_in_usd': y_label},
+            labels={'work_year': 'Rok', y_column: y_label},
             color_discrete_sequence=["#DF3F3F"]
         )
         fig.update_xaxes(dtick=1)
         fig.update_traces(marker_line_width=1.2, marker_line_color="white")
         
     else:  # count
-        data = df.groupby('work_year').size().reset_index(name='count')
         fig = px.line(
-            data,
+            trend_stats,
             x='work_year',
             y='count',
             title="Liczba ofert pracy w czasie",
@@ -55,49 +57,52 @@ def create_top_jobs_chart(top10_df):
     fig.update_traces(marker_line_width=1.2, marker_line_color="white")
     return fig
 
-def create_salary_distribution_chart(df_plot):
+def create_salary_distribution_chart(bin_edges, counts):
     
-    #Tworzy histogram rozkładu wynagrodzeń.
-    fig = px.histogram(
-        df_plot,
-        x='salary_in_usd',
-        nbins=60,
-        title="Rozkład wynagrodzeń (USD)",
-        labels={'salary_in_usd': "Wynagrodzenie (USD)"},
-        color_discrete_sequence=["#1DB954"]
-    )
-    fig.update_traces(marker_line_width=1.2, marker_line_color="white")
+    #Tworzy histogram rozkładu wynagrodzeń z gotowych koszyków (krawędzie + liczności).
+    #Koszyki liczone po stronie serwera (SalaryCube.histogram_bins) - do wykresu
+    #trafia O(koszyków) liczb zamiast wszystkich wierszy.
+    bin_edges = np.asarray(bin_edges, dtype=float)
+    fig = go.Figure(go.Bar(
+        x=(bin_edges[:-1] + bin_edges[1:]) / 2,
+        y=counts,
+        width=np.diff(bin_edges),
+        marker_color="#1DB954",
+        marker_line_width=1.2,
+        marker_line_color="white"
+    ))
+    fig.update_layout(title="Rozkład wynagrodzeń (USD)", bargap=0)
+    fig.update_xaxes(title_text="Wynagrodzenie (USD)")
     fig.update_yaxes(title_text="Liczba pracowników")
     return fig
 
-def create_country_comparison_chart(df, selected_countries):
+def create_country_comparison_chart(country_stats, selected_countries):
     
     #Tworzy wykres porównujący kraje.
-    subset = df[df["company_location"].isin(selected_countries)]
-    compare_stats = subset.groupby("company_location")["salary_in_usd"].mean().reset_index()
+    #country_stats: agregaty per company_location, np. SalaryCube.rollup(['company_location'])
+    compare_stats = country_stats[country_stats["company_location"].isin(selected_countries)]
     
     fig = px.bar(
         compare_stats,
         x="company_location",
-        y="salary_in_usd",
+        y="mean_salary",
         title="Średnie wynagrodzenia — wybrane kraje",
-        labels={"company_location": "Kraj", "salary_in_usd": "Średnia (USD)"},
+        labels={"company_location": "Kraj", "mean_salary": "Średnia (USD)"},
         color_discrete_sequence=["#067EB5"]
     )
     fig.update_traces(marker_line_width=1.7, marker_line_color="white")
     return fig
 
-def create_job_trend_chart(job_df, selected_job):
+def create_job_trend_chart(trend_data, selected_job):
     
     #Tworzy wykres trendu wynagrodzeń dla konkretnego stanowiska.
-    trend_data = job_df.groupby('work_year')['salary_in_usd'].mean().reset_index()
-    
+    #trend_data: agregaty per work_year dla stanowiska (kolumna mean_salary)
     fig = px.line(
         trend_data,
         x='work_year',
-        y='salary_in_usd',
+        y='mean_salary',
         title=f"Trend wynagrodzeń — {selected_job}",
-        labels={"work_year": "Rok", "salary_in_usd": "Średnia (USD)"},
+        labels={"work_year": "Rok", "mean_salary": "Średnia (USD)"},
         markers=True,
         color_discrete_sequence=["#1DB954"]
     )
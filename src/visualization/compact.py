@@ -0,0 +1,155 @@
+# 📦 MODUŁ: Kompaktowe wykresy (mniej bajtów przez websocket, szybszy render)
+
+# Wykres Plotly trafia do przeglądarki jako JSON. Domyślnie zawiera:
+# - pełne tablice float64 (8 bajtów na liczbę, także dla pełnych dolarów)
+# - cały szablon (template.data - style dla WSZYSTKICH typów wykresów,
+#   ~2-6 KB na wykres, często więcej niż same dane)
+# - wszystkie punkty serii, nawet gdy ekran pokaże ich kilkaset
+# compact_figure() naprawia to w jednym przejściu:
+# 1. Zaokrąglenie liczb do `decimals` miejsc + zmniejszenie typu
+#    (liczby całkowite → int8/16/32, pozostałe → float32)
+# 2. Z template.data zostają tylko typy śladów obecne na wykresie
+# 3. Serie liniowe dłuższe niż budżet punktów → LTTB (Largest-Triangle-
+#    Three-Buckets): zostają punkty, które najbardziej zmieniają kształt linii
+# 4. Długie serie Scatter → Scattergl (WebGL). Krótkie zostają w SVG -
+#    przeglądarka ma limit kontekstów WebGL (~16 na stronę), a dla kilkunastu
+#    punktów SVG rysuje się równie szybko.
+
+import numpy as np
+import plotly.graph_objects as go
+
+DEFAULT_POINT_BUDGET = 2000
+WEBGL_MIN_POINTS = 1000
+DEFAULT_DECIMALS = 2
+
+# Atrybuty śladów z tablicami "po jednym elemencie na punkt"
+_POINT_ATTRIBUTES = ('x', 'y', 'z', 'text', 'hovertext', 'customdata', 'width', 'ids')
+
+
+def lttb_indices(x, y, n_out):
+    """
+    Wybiera `n_out` punktów serii metodą LTTB (Largest-Triangle-Three-Buckets).
+
+    Args:
+        x, y: Tablice liczbowe (x rosnąco)
+        n_out: Docelowa liczba punktów (>= 3)
+
+    Returns:
+        np.ndarray: Posortowane indeksy wybranych punktów (zawsze z pierwszym i ostatnim)
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    # Środkowe punkty dzielimy na n_out - 2 koszyki; z każdego bierzemy punkt
+    # tworzący największy trójkąt z poprzednio wybranym i średnią następnego koszyka
+    edges = np.linspace(1, n - 1, n_out - 1).astype(int)
+    selected = np.empty(n_out, dtype=np.int64)
+    selected[0], selected[-1] = 0, n - 1
+    previous = 0
+    for i in range(n_out - 2):
+        start, stop = edges[i], edges[i + 1]
+        next_start, next_stop = edges[i + 1], edges[i + 2] if i + 2 < len(edges) else n
+        next_x = x[next_start:next_stop].mean() if next_stop > next_start else x[-1]
+        next_y = y[next_start:next_stop].mean() if next_stop > next_start else y[-1]
+        area = np.abs(
+            (x[previous] - next_x) * (y[start:stop] - y[previous])
+            - (x[previous] - x[start:stop]) * (next_y - y[previous])
+        )
+        previous = start + int(np.argmax(area))
+        selected[i + 1] = previous
+    return selected
+
+
+def compact_array(values, decimals=DEFAULT_DECIMALS):
+    """
+    Zaokrągla i zmniejsza typ tablicy liczbowej; inne wartości zwraca bez zmian.
+
+    Liczby całkowite (po zaokrągleniu) → najmniejszy pasujący int,
+    pozostałe → float32 (~7 cyfr znaczących - wystarcza do wyświetlenia).
+    """
+    if values is None or isinstance(values, (str, bytes)):
+        return values
+    array = np.asarray(values)
+    if array.dtype.kind not in 'fiu' or array.ndim == 0 or array.size == 0:
+        return values
+    if array.dtype.kind == 'f':
+        if not np.isfinite(array).all():
+            return array.astype(np.float32)
+        array = np.round(array, decimals)
+        if not np.array_equal(array, np.round(array)):
+            return array.astype(np.float32)
+    for dtype in (np.int8, np.int16, np.int32):
+        info = np.iinfo(dtype)
+        if array.min() >= info.min and array.max() <= info.max:
+            return array.astype(dtype)
+    return array
+
+
+def _downsample(trace, point_budget):
+    # LTTB tylko dla serii liniowych z liczbowym, rosnącym x
+    if trace.type not in ('scatter', 'scattergl') or trace.x is None or trace.y is None:
+        return
+    if 'lines' not in (trace.mode or 'lines') or len(trace.x) <= point_budget:
+        return
+    x, y = np.asarray(trace.x), np.asarray(trace.y)
+    if x.dtype.kind not in 'fiu' or y.dtype.kind not in 'fiu' or np.any(np.diff(x) < 0):
+        return
+    keep = lttb_indices(x, y, point_budget)
+    n = len(x)
+    for attribute in _POINT_ATTRIBUTES:
+        value = trace[attribute] if attribute in trace else None
+        if value is not None and not isinstance(value, str) and np.ndim(value) >= 1 and len(value) == n:
+            trace[attribute] = np.asarray(value)[keep]
+
+
+def _to_webgl(trace):
+    props = trace.to_plotly_json()
+    props.pop('type', None)
+    return go.Scattergl(props, skip_invalid=True)
+
+
+def compact_figure(fig, point_budget=DEFAULT_POINT_BUDGET, decimals=DEFAULT_DECIMALS,
+                   webgl_min_points=WEBGL_MIN_POINTS):
+    """
+    Zmniejsza payload wykresu (modyfikuje `fig`; krotkę wykresów też).
+
+    Args:
+        fig: go.Figure albo krotka go.Figure
+        point_budget: Maksymalna liczba punktów serii liniowej (LTTB powyżej)
+        decimals: Miejsca po przecinku zachowane w danych
+        webgl_min_points: Od tylu punktów Scatter → Scattergl
+
+    Returns:
+        go.Figure lub krotka go.Figure (nowy obiekt, gdy ślady zamieniono na WebGL)
+    """
+    if isinstance(fig, tuple):
+        return tuple(compact_figure(f, point_budget, decimals, webgl_min_points) for f in fig)
+
+    for trace in fig.data:
+        _downsample(trace, point_budget)
+        for attribute in _POINT_ATTRIBUTES:
+            if attribute in trace and trace[attribute] is not None:
+                trace[attribute] = compact_array(trace[attribute], decimals)
+
+    # Plotly nie pozwala podmienić śladu w miejscu - przy zamianie budujemy nowy wykres
+    long_scatter = [
+        trace.type == 'scatter' and trace.x is not None and len(trace.x) >= webgl_min_points
+        for trace in fig.data
+    ]
+    if any(long_scatter):
+        fig = go.Figure(
+            data=[_to_webgl(trace) if gl else trace for trace, gl in zip(fig.data, long_scatter)],
+            layout=fig.layout,
+        )
+
+    # Szablon: zostawiamy layout (kolory, fonty) i style tylko użytych typów śladów
+    template = fig.layout.template
+    if template is not None and template.data is not None:
+        used = {trace.type for trace in fig.data}
+        template.data = {
+            name: styles for name, styles in template.data.to_plotly_json().items() if name in used
+        }
+    return fig
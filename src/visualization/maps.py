@@ -2,26 +2,44 @@
 
 # Demonstruje integrację Streamlit z:
 # 1. Plotly Express (mapy choropleth)
-# 2. PyCountry (konwersja kodów krajów)
-# 3. Pandas (agregacja danych)
+# 2. PyCountry (konwersja kodów krajów, import leniwy)
+# 3. Pandas (wektorowe mapowanie kategorii)
 
 # WAŻNE: Plotly wymaga kodów ISO-3 dla map świata
 # Nasze dane mają ISO-2, więc konwertujemy.
 
 
+import logging
+from functools import lru_cache
+
 import plotly.express as px
-import pycountry
 import pandas as pd
 
+from src.instrumentation import span
+
+logger = logging.getLogger(__name__)
+
 # 🔄 KONWERSJA: ISO-2 → ISO-3
     
 #     Problem: Nasze dane mają kody 2-literowe (US, PL, DE)
 #     Plotly chce 3-literowe (USA, POL, DEU) dla map świata
     
 #     Uwagi:
-#     - Nie wszystkie kody da się skonwertować (np. 'EU', 'XX')
-#     - PyCountry wymaga pip install pycountry
-#     - Zwraca None dla nieznanych kodów (obsługa błędów)
+#     - Tablica ISO-2 → ISO-3 budowana RAZ na proces (lru_cache)
+#     - pycountry importowany dopiero przy pierwszej mapie (szybszy start)
+#     - Mapowanie wektorowe: dla kolumn category mapujemy tylko kategorie
+#     - Nie wszystkie kody da się skonwertować (np. 'EU', 'XX') - raportujemy je
+
+@lru_cache(maxsize=None)
+def iso_lookup_table():
+    """
+    Zwraca słownik {kod ISO-2: kod ISO-3} dla wszystkich krajów z pycountry.
+    
+    Returns:
+        dict: Mapowanie kodów (budowane raz na proces)
+    """
+    import pycountry
+    return {country.alpha_2: country.alpha_3 for country in pycountry.countries}
 
 def iso2_to_iso3(code):
     """
@@ -31,41 +49,51 @@ def iso2_to_iso3(code):
         code: Kod ISO-2 (np. 'US', 'PL')
     
     Returns:
-        str: Kod ISO-3 lub None jeśli konwersja się nie powiedzie
+        str: Kod ISO-3 lub None jeśli kod jest nieznany
     """
-    try:
-        return pycountry.countries.get(alpha_2=code).alpha_3
-    except:
-        return None
+    return iso_lookup_table().get(code)
 
-def create_world_map(df, location_column="company_location"):
+def map_iso2_to_iso3(codes):
+    """
+    Wektorowo konwertuje serię kodów ISO-2 na ISO-3.
+    
+    Args:
+        codes: pd.Series z kodami ISO-2 (najlepiej typu category)
+    
+    Returns:
+        tuple: (pd.Series z kodami ISO-3 lub NaN, posortowana lista nieznanych kodów)
+    """
+    # Dla category .map() działa na kategoriach, nie na każdym wierszu
+    iso3 = codes.map(iso_lookup_table())
+    unmapped = sorted(pd.unique(codes[iso3.isna()].dropna().astype(str)))
+    return iso3, unmapped
+
+def create_world_map(location_stats, location_column="company_location"):
     #  🗺️ TWORZENIE MAPY ŚWIATA
     
     # Args:
-    #     df: DataFrame z danymi
+    #     location_stats: Agregaty per kraj z kolumną mean_salary,
+    #                     np. SalaryCube.rollup([location_column])
     #     location_column: 'company_location' lub 'employee_residence'
     
     # Returns:
     #     plotly.graph_objects.Figure: Gotowa mapa
     
     # Demonstruje:
-    # - Grupowanie danych z Pandas
+    # - Korzystanie z gotowych agregatów (bez groupby na surowych danych)
     # - Konwersję kodów krajów
     # - Tworzenie mapy choropleth z Plotly
     # - Obsługę brakujących wartości (dropna)
     
-    # 📊 AGREGUJ DANE - średnie wynagrodzenie per kraj
-    location_stats = (
-        df.groupby(location_column)
-        .agg(mean_salary=("salary_in_usd", "mean"))
-        .reset_index()
-    )
+    location_stats = location_stats[[location_column, "mean_salary"]].copy()
     
-    # 🔄 KONWERTUJ KODY KRAJÓW
-    # Uwaga: To może być wolne dla dużych datasetów
-    location_stats["iso3"] = location_stats[location_column].apply(iso2_to_iso3)
+    # 🔄 KONWERTUJ KODY KRAJÓW (wektorowo, tablica budowana raz)
+    with span('iso2_to_iso3'):
+        location_stats["iso3"], unmapped = map_iso2_to_iso3(location_stats[location_column])
     
-    # Usuń kraje bez poprawnego kodu ISO3
+    # Kraje bez kodu ISO3 nie trafią na mapę - ale mówimy o tym wprost
+    if unmapped:
+        logger.warning("Nieznane kody krajów (%s): %s", location_column, ", ".join(unmapped))
     location_stats = location_stats.dropna(subset=['iso3'])
     
     # Tworzenie mapy
@@ -86,22 +114,31 @@ def create_world_map(df, location_column="company_location"):
         labels={"mean_salary": "Średnie wynagrodzenie (USD)"}
     )
     
+    # ⚠️ ADNOTACJA Z POMINIĘTYMI KODAMI - widoczna pod mapą
+    if unmapped:
+        fig.add_annotation(
+            text=f"Pominięte kody (brak ISO-3): {', '.join(unmapped)}",
+            xref="paper", yref="paper", x=0, y=-0.05,
+            showarrow=False, font={"size": 11}
+        )
+    
     return fig
 
-def create_company_vs_employee_maps(df):
+def create_company_vs_employee_maps(company_stats, employee_stats):
     # Tworzy dwie mapy: dla lokalizacji firm i pracowników.
     
     # Args:
-    #     df: DataFrame z danymi
+    #     company_stats: Agregaty per company_location (analytics.location_stats)
+    #     employee_stats: Agregaty per employee_residence
     
     # Returns:
     #     tuple: (fig_company, fig_employee) - dwie mapy
     # Mapa dla firm
-    fig_company = create_world_map(df, "company_location")
+    fig_company = create_world_map(company_stats, "company_location")
     fig_company.update_layout(title="📍 Średnie wynagrodzenia — lokalizacja firm")
     
     # Mapa dla pracowników
-    fig_employee = create_world_map(df, "employee_residence")
+    fig_employee = create_world_map(employee_stats, "employee_residence")
     fig_employee.update_layout(title="👤 Średnie wynagrodzenia — lokalizacja pracowników")
     
     return fig_company, fig_employee
\ No newline at end of file
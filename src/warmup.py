@@ -0,0 +1,92 @@
+# 🔥 MODUŁ: Rozgrzanie trwałego cache (np. przy budowie obrazu / przed deployem)
+
+# Wypełnia katalog DiskCache (src/disk_cache.py) tym, co pierwszy rerun po
+# starcie liczyłby od zera:
+# - tabelą, kostką agregatów i odciskiem danych (klucz: hash pliku danych)
+# - wynikami i wykresami wszystkich sekcji EDA dla stanu domyślnego
+#   (bez filtrów, domyślne wartości widgetów - jak przy pierwszym wejściu)
+# - modelem predykcyjnym (src/prediction.py) dla tej wersji danych
+# Klucze zawierają wersję kodu, więc rozgrzewać trzeba tym samym kodem,
+# który zostanie uruchomiony.
+
+# Uruchomienie (z głównego katalogu projektu):
+#   EDA_CACHE_DIR=/var/cache/eda python -m src.warmup
+#   python -m src.warmup --cache-dir /var/cache/eda --data data/plik.csv
+
+import argparse
+import logging
+import os
+import sys
+import time
+
+from streamlit import config as streamlit_config, logger as streamlit_logger
+
+from src.disk_cache import CACHE_DIR, CACHE_MAX_BYTES, DiskCache
+from src.eda import EDA_SECTION_TASKS
+from src.figure_cache import FIGURE_CACHE
+from src.live_data import LiveDataset
+from src.prediction import PredictionEngine
+
+DEFAULT_DATA_PATH = os.path.join(os.path.dirname(__file__), '..', 'data', 'DataScience_salaries_2025.csv')
+
+
+def warm(data_path, cache):
+    """
+    Zapisuje w `cache` dane i wyniki sekcji EDA dla stanu domyślnego.
+
+    Args:
+        data_path: Ścieżka do pliku z danymi
+        cache: DiskCache do wypełnienia
+
+    Returns:
+        dict: nazwa zadania → czas liczenia (s)
+    """
+    timings = {}
+    start = time.perf_counter()
+    snapshot = LiveDataset(data_path, disk_cache=cache).current
+    timings['dataset'] = time.perf_counter() - start
+
+    # Wykresy trafiają na dysk przez drugi poziom FIGURE_CACHE
+    previous, FIGURE_CACHE.disk = FIGURE_CACHE.disk, cache
+    try:
+        for planner in EDA_SECTION_TASKS.values():
+            for task in planner(snapshot.df, snapshot.cube, snapshot.fingerprint):
+                start = time.perf_counter()
+                task.func(*task.args)
+                timings[task.name] = time.perf_counter() - start
+    finally:
+        FIGURE_CACHE.disk = previous
+
+    start = time.perf_counter()
+    engine = PredictionEngine(disk_cache=cache)
+    engine.model(snapshot.df, snapshot.version_id)
+    engine.wait()
+    engine.shutdown()
+    timings['salary_model'] = time.perf_counter() - start
+    return timings
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Rozgrzanie trwałego cache dashboardu EDA")
+    parser.add_argument('--data', default=DEFAULT_DATA_PATH, help="plik z danymi")
+    parser.add_argument('--cache-dir', default=CACHE_DIR, help="katalog cache (domyślnie EDA_CACHE_DIR)")
+    parser.add_argument('--max-bytes', type=int, default=CACHE_MAX_BYTES)
+    args = parser.parse_args(argv)
+    if not args.cache_dir:
+        parser.error("podaj --cache-dir albo ustaw EDA_CACHE_DIR")
+
+    # Sekcje czytają stan widgetów - poza `streamlit run` dostają wartości domyślne
+    streamlit_config.get_option('logger.level')
+    streamlit_logger.set_log_level(logging.CRITICAL)
+
+    cache = DiskCache(args.cache_dir, args.max_bytes)
+    timings = warm(args.data, cache)
+    for name, seconds in timings.items():
+        print(f"{name:<28} {seconds:8.3f} s")
+    stats = cache.stats()
+    print(f"\n💽 {args.cache_dir}: {stats['entries']} wpisów, {stats['bytes'] / 1e6:.1f} MB")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,149 @@
+# 🧪 MODUŁ: Testy kostki agregatów
+
+# Cel: Sprawdzenie, czy SalaryCube daje te same wyniki co groupby na surowych danych
+
+# Uruchomienie: pytest tests/ -v
+
+
+import numpy as np
+import pandas as pd
+import sys
+import os
+
+# Dodanie ścieżki do katalogu głównego projektu (importy src.*)
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.aggregates import SalaryCube, SalaryHistogram
+
+def _sample_frame(n=500, seed=0):
+    """Tworzy losowy DataFrame o schemacie danych wynagrodzeń."""
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        'work_year': rng.choice([2022, 2023, 2024], n).astype('int16'),
+        'job_title': pd.Categorical(rng.choice(['DS', 'DE', 'MLE', 'DA'], n)),
+        'company_location': pd.Categorical(rng.choice(['US', 'PL', 'DE'], n)),
+        'employee_residence': pd.Categorical(rng.choice(['US', 'PL', 'GB'], n)),
+        'experience_level': pd.Categorical(rng.choice(['EN', 'MI', 'SE'], n)),
+        'salary_in_usd': rng.uniform(20_000, 300_000, n).round(),
+    })
+
+def test_rollup_matches_groupby():
+    """Test czy średnie, liczności i odchylenia z kostki zgadzają się z pandas."""
+    df = _sample_frame()
+    cube = SalaryCube.from_frame(df)
+
+    stats = cube.rollup(['job_title']).set_index('job_title')
+    expected = df.groupby('job_title', observed=True)['salary_in_usd'].agg(['mean', 'count', 'std', 'max'])
+
+    np.testing.assert_allclose(stats.loc[expected.index, 'mean_salary'], expected['mean'])
+    np.testing.assert_array_equal(stats.loc[expected.index, 'count'], expected['count'])
+    np.testing.assert_allclose(stats.loc[expected.index, 'std_salary'], expected['std'])
+    np.testing.assert_allclose(stats.loc[expected.index, 'max'], expected['max'])
+
+def test_rollup_with_filters_and_total():
+    """Test filtrów w rollup oraz wiersza z sumą całkowitą."""
+    df = _sample_frame()
+    cube = SalaryCube.from_frame(df)
+
+    subset = df[df['company_location'].isin(['PL', 'DE'])]
+    stats = cube.rollup(['work_year'], filters={'company_location': ['PL', 'DE']})
+    expected = subset.groupby('work_year')['salary_in_usd'].mean()
+    np.testing.assert_allclose(stats.set_index('work_year')['mean_salary'], expected)
+
+    totals = cube.rollup().iloc[0]
+    assert totals['count'] == len(df)
+    assert np.isclose(totals['mean_salary'], df['salary_in_usd'].mean())
+
+def test_rollup_is_memoized():
+    """Test czy powtórzony rollup zwraca ten sam (zapamiętany) obiekt."""
+    cube = SalaryCube.from_frame(_sample_frame())
+    first = cube.rollup(['company_location'], filters={'job_title': ['DS']})
+    assert cube.rollup(['company_location'], filters={'job_title': ['DS']}) is first
+
+def test_merge_equals_cube_of_concatenation():
+    """Test czy scalenie dwóch kostek daje to samo co kostka z połączonych danych."""
+    df_a = _sample_frame(seed=1)
+    df_b = _sample_frame(seed=2)
+    merged = SalaryCube.from_frame(df_a).merge(SalaryCube.from_frame(df_b))
+    full = SalaryCube.from_frame(pd.concat([df_a, df_b], ignore_index=True))
+
+    left = merged.rollup(['experience_level']).set_index('experience_level')
+    right = full.rollup(['experience_level']).set_index('experience_level')
+    np.testing.assert_allclose(left.loc[right.index, 'mean_salary'], right['mean_salary'])
+    np.testing.assert_array_equal(left.loc[right.index, 'count'], right['count'])
+
+def test_from_chunks_equals_from_frame():
+    """Test czy kostka składana porcjami zgadza się z kostką z całej tabeli."""
+    df = _sample_frame(n=1000)
+    chunked = SalaryCube.from_chunks(df.iloc[i:i + 300] for i in range(0, len(df), 300))
+    full = SalaryCube.from_frame(df)
+
+    left = chunked.rollup(['company_location']).set_index('company_location')
+    right = full.rollup(['company_location']).set_index('company_location')
+    np.testing.assert_allclose(left.loc[right.index, 'mean_salary'], right['mean_salary'])
+    np.testing.assert_array_equal(chunked.histogram().counts, full.histogram().counts)
+
+def test_histogram_quantile_within_bin_width():
+    """Test czy kwantyle z histogramu mieszczą się w szerokości koszyka."""
+    values = np.random.default_rng(3).lognormal(11.5, 0.5, 20_000)
+    histogram = SalaryHistogram.from_values(values)
+    for q in (0.25, 0.5, 0.98):
+        assert abs(histogram.quantile(q) - np.quantile(values, q)) <= histogram.bin_width
+
+    edges, counts = histogram.rebin(60)
+    assert counts.sum() == len(values)
+    assert len(edges) == len(counts) + 1 and len(counts) <= 60
+
+def test_quantiles_match_numpy_for_small_cells():
+    """Test czy mediany z kostki (komórki ≤ SKETCH_SIZE) są dokładne."""
+    df = _sample_frame(n=800)
+    cube = SalaryCube.from_frame(df)
+
+    medians = cube.quantiles((0.5,), ['job_title']).set_index('job_title')[0.5]
+    expected = df.groupby('job_title', observed=True)['salary_in_usd'].median()
+    np.testing.assert_allclose(medians.loc[expected.index], expected)
+
+    merged = SalaryCube.from_frame(df.iloc[:400]).merge(SalaryCube.from_frame(df.iloc[400:]))
+    total = merged.quantiles((0.25, 0.75)).iloc[0]
+    np.testing.assert_allclose([total[0.25], total[0.75]], df['salary_in_usd'].quantile([0.25, 0.75]))
+
+def test_histogram_bins_per_filter_match_raw_rows():
+    """Test czy koszyki kostki po filtrze zgadzają się z histogramem surowych wierszy."""
+    df = _sample_frame(n=1000)
+    cube = SalaryCube.from_chunks(df.iloc[i:i + 300] for i in range(0, len(df), 300))
+
+    subset = df.loc[df['job_title'].isin(['DS', 'DE']), 'salary_in_usd']
+    histogram = cube.histogram({'job_title': ['DS', 'DE']})
+    np.testing.assert_array_equal(histogram.counts, SalaryHistogram.from_values(subset).counts)
+    assert cube.histogram({'job_title': ['DE', 'DS']}) is histogram
+
+    edges, counts = cube.histogram_bins(30, upper=150_000, filters={'job_title': ['DS', 'DE']})
+    assert len(counts) <= 30
+    assert counts.sum() == (subset < 151_000).sum()
+    assert edges[-1] >= 150_000
+
+def test_rows_with_missing_keys_are_skipped():
+    """Test czy wiersze z brakującym kluczem (pusta komórka w CSV) nie psują kostki."""
+    df = _sample_frame(n=1000)
+    df['job_title'] = df['job_title'].astype(object)
+    df.loc[:99, 'job_title'] = None
+    df.loc[100:109, 'company_location'] = None
+    df['job_title'] = df['job_title'].astype('category')
+    cube = SalaryCube.from_frame(df)
+
+    complete = df.dropna(subset=['job_title', 'company_location'])
+    assert cube.rollup().iloc[0]['count'] == len(complete)
+    assert cube.histogram().total == len(complete)
+    median = cube.quantiles((0.5,)).iloc[0][0.5]
+    assert np.isclose(median, complete['salary_in_usd'].median(), rtol=0.01)
+
+def test_filter_cache_key_keeps_value_types():
+    """Test czy filtr '2024' (tekst) i 2024 (liczba) nie dzielą zapamiętanego wyniku."""
+    df = _sample_frame(n=1000)
+    cube = SalaryCube.from_frame(df)
+    year = int(df['work_year'].iloc[0])
+
+    assert len(cube.rollup(['work_year'], {'work_year': [str(year)]})) == 0
+    assert len(cube.rollup(['work_year'], {'work_year': [year]})) == 1
+    assert cube.quantiles((0.5,), filters={'work_year': [str(year)]})[0.5].isna().all()
+    assert cube.quantiles((0.5,), filters={'work_year': [year]})[0.5].notna().all()
@@ -0,0 +1,94 @@
+# 🧪 MODUŁ: Testy warstwy obliczeń (src/analytics.py)
+
+# Cel: Sprawdzenie, czy wyniki analityki (bez Streamlit) zgadzają się z pandas
+
+# Uruchomienie: pytest tests/ -v
+
+
+import numpy as np
+import sys
+import os
+
+# Dodanie ścieżki do katalogu głównego projektu (importy src.*)
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from benchmarks.synthetic import make_salaries
+from src import analytics
+from src.aggregates import SalaryCube
+from src.job_index import existing_job_index, job_index
+
+def _dataset(n=3000):
+    df = make_salaries(n, seed=1)
+    return df, SalaryCube.from_frame(df)
+
+def test_summary_stats_match_pandas():
+    """Test czy liczność, średnia, maksimum i dokładna mediana zgadzają się z pandas."""
+    df, cube = _dataset()
+    stats = analytics.summary_stats(cube, df, exact=True)
+
+    assert stats.count == len(df)
+    assert stats.n_jobs == df['job_title'].nunique()
+    assert np.isclose(stats.mean, df['salary_in_usd'].mean())
+    assert stats.median == df['salary_in_usd'].median()
+    assert stats.max == df['salary_in_usd'].max()
+    # Bez surowych danych (out-of-core) nie ma describe(), a mediana pochodzi ze szkicu
+    sketched = analytics.summary_stats(cube)
+    assert sketched.describe is None
+    assert abs(sketched.median - stats.median) / stats.median < 0.02
+
+def test_top_jobs_match_groupby():
+    """Test czy ranking stanowisk z kostki to ten sam ranking co groupby."""
+    df, cube = _dataset()
+    top = analytics.top_jobs(cube, min_count=20)
+
+    grouped = df.groupby('job_title', observed=True)['salary_in_usd'].agg(['mean', 'count'])
+    expected = grouped[grouped['count'] >= 20].sort_values('mean', ascending=False).head(10)
+    assert list(top['job_title']) == list(expected.index)
+    np.testing.assert_allclose(top['mean_salary'], expected['mean'])
+
+def test_job_detail_consistent_with_country_and_trend():
+    """Test czy szczegóły stanowiska sumują się z trendem rocznym."""
+    df, cube = _dataset()
+    job = df['job_title'].value_counts().index[0]
+    detail = analytics.job_detail(cube, job, df, exact=True)
+
+    rows = df[df['job_title'] == job]
+    assert detail.count == len(rows)
+    assert detail.median == rows['salary_in_usd'].median()
+    assert detail.trend['count'].sum() == detail.count
+
+    countries = analytics.country_stats(cube, df, exact=True)
+    assert countries['count'].sum() == len(df)
+    assert countries['mean_salary'].is_monotonic_decreasing
+
+def test_job_list_and_detail_do_not_build_job_index():
+    """Test czy lista i szczegóły stanowiska bez wyszukiwania idą z kostki (bez indeksu) i zgadzają się z indeksem."""
+    df, cube = _dataset()
+    titles = analytics.job_titles(cube, df)
+    job = titles[0]
+    cold = analytics.job_detail(cube, job, df, exact=True)
+    assert existing_job_index(cube, df) is None
+
+    assert analytics.job_titles(cube, df, query=job[:4])[0].lower().startswith(job[:4].lower())
+    assert titles == job_index(cube, df).titles
+    warm = analytics.job_detail(cube, job, df, exact=True)
+    assert (cold.count, cold.median) == (warm.count, warm.median)
+    assert np.isclose(cold.mean, warm.mean)
+    np.testing.assert_array_equal(cold.trend['work_year'], warm.trend['work_year'])
+    np.testing.assert_array_equal(cold.trend['count'], warm.trend['count'])
+
+def test_salary_distribution_exact_vs_sketch():
+    """Test czy kwartyle ze szkiców są bliskie dokładnym, a koszyki kończą się na progu."""
+    df, cube = _dataset()
+    exact = analytics.salary_distribution(cube, cutoff=2, df=df, exact=True)
+    sketched = analytics.salary_distribution(cube, cutoff=2)
+
+    salaries = df['salary_in_usd']
+    threshold = np.percentile(salaries, 98)
+    assert exact.threshold == threshold
+    assert exact.q1 == salaries[salaries <= threshold].quantile(0.25)
+    assert abs(sketched.q3 - exact.q3) / exact.q3 < 0.02
+    assert exact.iqr == exact.q3 - exact.q1
+    # Histogram kończy się na progu (z dokładnością do drobnego koszyka)
+    assert len(sketched.bin_edges) == len(sketched.counts) + 1
+    assert sketched.counts.sum() <= len(df)
@@ -0,0 +1,55 @@
+# 🧪 MODUŁ: Testy zestawu benchmarków
+
+# Cel: Sprawdzenie, czy suite przechodzi wszystkie etapy na małych danych
+# i czy porównanie z baseline wykrywa regresje (a ignoruje szum)
+
+# Uruchomienie: pytest tests/ -v
+
+
+import sys
+import os
+
+# Dodanie ścieżki do katalogu głównego projektu (importy src.*, benchmarks.*)
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from benchmarks.suite import compare, missing, run_size
+from src.eda import EDA_SECTIONS
+
+def test_run_size_covers_all_stages(tmp_path):
+    """Test czy suite mierzy wczytanie, każdą sekcję i każdy builder wykresów."""
+    results = run_size(2000, str(tmp_path), memory=False)
+
+    assert 'load_data:csv' in results and 'cube:from_frame' in results
+    assert all(f'section:{key}' in results for key in EDA_SECTIONS)
+    assert 'rankings:merge' in results and 'rankings:rebuild' in results
+    charts = {stage: m for stage, m in results.items() if stage.startswith('chart:')}
+    assert len(charts) >= 9
+    assert all(m['json_bytes'] > 0 for m in charts.values())
+    assert all(m['seconds'] >= 0 and m['peak_mb'] is None for m in results.values())
+
+def test_compare_flags_regressions_above_tolerance():
+    """Test czy regresje czasu/pamięci/JSON są wykrywane, a drobne różnice nie."""
+    baseline = {'1M': {
+        'cube:from_frame': {'seconds': 1.0, 'peak_mb': 100.0, 'json_bytes': None},
+        'chart:top_jobs': {'seconds': 0.01, 'peak_mb': 0.4, 'json_bytes': 4000},
+    }}
+    ok = {'1M': {
+        'cube:from_frame': {'seconds': 1.1, 'peak_mb': 110.0, 'json_bytes': None},
+        'chart:top_jobs': {'seconds': 0.03, 'peak_mb': 0.9, 'json_bytes': 4100},
+    }}
+    assert compare(ok, baseline) == []
+
+    slow = {'1M': {
+        'cube:from_frame': {'seconds': 2.0, 'peak_mb': 200.0, 'json_bytes': None},
+        'chart:top_jobs': {'seconds': 0.01, 'peak_mb': 0.4, 'json_bytes': 9000},
+    }}
+    regressions = compare(slow, baseline)
+    assert len(regressions) == 3
+
+def test_missing_lists_stages_without_baseline():
+    """Test czy etapy dodane po ostatnim zapisie baseline są wykazywane (nie są pomijane po cichu)."""
+    stage = {'seconds': 0.1, 'peak_mb': None, 'json_bytes': None}
+    baseline = {'10k': {'cube:from_frame': stage}}
+    results = {'10k': {'cube:from_frame': stage, 'page:sequential': stage}, '1M': {'cube:from_frame': stage}}
+    assert missing(results, baseline) == ['10k page:sequential', '1M cube:from_frame']
+    assert missing({'10k': {'cube:from_frame': stage}}, baseline) == []
@@ -0,0 +1,52 @@
+# 🧪 MODUŁ: Testy kompaktowych wykresów
+
+# Cel: Sprawdzenie LTTB, zmniejszania typów i odchudzania szablonu wykresów
+
+# Uruchomienie: pytest tests/ -v
+
+
+import numpy as np
+import plotly.graph_objects as go
+import plotly.io as pio
+import sys
+import os
+
+# Dodanie ścieżki do katalogu głównego projektu (importy src.*)
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.visualization.compact import compact_array, compact_figure, lttb_indices
+
+def test_lttb_keeps_endpoints_and_peaks():
+    """Test czy LTTB zostawia pierwszy, ostatni i skrajne punkty serii."""
+    x = np.arange(10_000)
+    y = np.sin(x / 500)
+    y[4321] = 50  # pojedynczy pik musi przetrwać redukcję
+    keep = lttb_indices(x, y, 200)
+
+    assert len(keep) == 200
+    assert keep[0] == 0 and keep[-1] == len(x) - 1
+    assert np.all(np.diff(keep) > 0)
+    assert 4321 in keep
+
+def test_compact_array_downcasts():
+    """Test czy liczby całkowite dostają najmniejszy int, a ułamki float32."""
+    assert compact_array(np.array([2020.0, 2025.0])).dtype == np.int16
+    assert compact_array(np.array([120_000.0, 95_500.0])).dtype == np.int32
+    salaries = compact_array(np.array([123_456.789, 1.5]))
+    assert salaries.dtype == np.float32
+    np.testing.assert_allclose(salaries, [123_456.79, 1.5], rtol=1e-6)
+    assert compact_array(["US", "PL"]) == ["US", "PL"]
+
+def test_compact_figure_shrinks_payload():
+    """Test czy długa seria trafia do WebGL z budżetem punktów, a szablon traci nieużyte typy."""
+    x = np.arange(50_000)
+    fig = go.Figure(go.Scatter(x=x, y=np.cos(x / 100) * 1e5, mode='lines'))
+    fig.add_bar(x=[1.0, 2.0], y=[3.0, 4.0])
+    before = len(pio.to_json(fig))
+
+    compact = compact_figure(fig, point_budget=1000)
+
+    assert [trace.type for trace in compact.data] == ['scattergl', 'bar']
+    assert len(compact.data[0].x) == 1000
+    assert set(compact.layout.template.data.to_plotly_json()) <= {'scattergl', 'bar'}
+    assert len(pio.to_json(compact)) < before / 10
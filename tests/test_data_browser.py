@@ -0,0 +1,63 @@
+# 🧪 MODUŁ: Testy przeglądarki danych
+
+# Cel: Sprawdzenie paginacji, sortowania, filtrów i projekcji kolumn po stronie serwera
+
+# Uruchomienie: pytest tests/ -v
+
+
+import pandas as pd
+import sys
+import os
+
+# Dodanie ścieżki do katalogu głównego projektu (importy src.*)
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.components.data_browser import browser_index, query_page
+
+def _sample_frame():
+    """Tworzy mały DataFrame z kolumnami używanymi przez przeglądarkę."""
+    return pd.DataFrame({
+        'job_title': pd.Categorical(['Data Scientist', 'Data Engineer', 'ML Engineer', 'Data Analyst'] * 5),
+        'company_location': pd.Categorical(['US', 'PL', 'DE', 'US'] * 5),
+        'salary_in_usd': [float(v) for v in range(20)],
+    })
+
+def test_query_page_returns_only_window():
+    """Test czy zwracana jest tylko jedna strona i poprawna liczba wierszy."""
+    page, total = query_page(_sample_frame(), page=2, page_size=6)
+    assert total == 20
+    assert page['salary_in_usd'].tolist() == [6.0, 7.0, 8.0, 9.0, 10.0, 11.0]
+
+def test_query_page_sorts_filters_and_projects():
+    """Test sortowania malejącego, filtrów, wyszukiwania i wyboru kolumn."""
+    page, total = query_page(
+        _sample_frame(), page=1, page_size=3, sort_by='salary_in_usd', ascending=False,
+        filters={'company_location': ['US']}, search='data', columns=['salary_in_usd']
+    )
+    assert total == 10
+    assert list(page.columns) == ['salary_in_usd']
+    assert page['salary_in_usd'].tolist() == [19.0, 16.0, 15.0]
+
+def test_query_page_string_sort_and_empty_search():
+    """Test sortowania po kolumnie tekstowej i wyszukiwania bez dopasowań."""
+    df = _sample_frame()
+    page, total = query_page(df, page=1, page_size=4, sort_by='job_title', filters={'company_location': ['PL', 'DE']})
+    assert total == 10
+    assert page['job_title'].tolist() == ['Data Engineer'] * 4
+    assert page['salary_in_usd'].tolist() == [1.0, 5.0, 9.0, 13.0]
+    page, total = query_page(df, search='quant')
+    assert total == 0 and page.empty
+
+def test_paging_reuses_cached_order(monkeypatch):
+    """Test czy zmiana strony nie filtruje ani nie sortuje danych ponownie."""
+    df = _sample_frame()
+    query_page(df, page=1, page_size=3, sort_by='job_title', ascending=False, filters={'company_location': ['US']})
+    index = browser_index(df)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("pozycje powinny pochodzić z pamięci indeksu")
+    monkeypatch.setattr(index, 'positions', fail)
+    monkeypatch.setattr(index, 'sort_order', fail)
+    page, total = query_page(df, page=2, page_size=3, sort_by='job_title', ascending=False, filters={'company_location': ['US']})
+    assert total == 10
+    assert page['job_title'].tolist() == ['Data Scientist', 'Data Scientist', 'Data Analyst']
@@ -14,7 +14,7 @@ import os
 # Dodanie ścieżki do src
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
 
-from data_loader import load_data
+from data_loader import load_data, iter_chunks, detect_format, write_dataset
 
 def test_load_data_returns_dataframe():
     """Test czy funkcja load_data zwraca DataFrame."""
@@ -53,6 +53,100 @@ def test_load_data_types():
     try:
         df = load_data(test_data_path)
         assert df['salary_in_usd'].dtype == float, "salary_in_usd powinno być float"
-        assert df['work_year'].dtype == int, "work_year powinno być int"
+        assert df['work_year'].dtype == 'int16', "work_year powinno być int16"
+        assert df['job_title'].dtype == 'category', "job_title powinno być category"
     except FileNotFoundError:
-        pytest.skip(f"Plik {test_data_path} nie istnieje")
\ No newline at end of file
+        pytest.skip(f"Plik {test_data_path} nie istnieje")
+
+def _write_sample_csv(path):
+    """Zapisuje mały plik CSV zgodny ze schematem danych."""
+    pd.DataFrame({
+        'work_year': [2024, 2025, 2025],
+        'experience_level': ['SE', 'MI', 'SE'],
+        'employment_type': ['FT', 'FT', 'PT'],
+        'job_title': ['Data Scientist', 'Data Engineer', 'Data Scientist'],
+        'salary': [150000, 120000, 90000],
+        'salary_currency': ['USD', 'USD', 'EUR'],
+        'salary_in_usd': [150000, 120000, 97000],
+        'employee_residence': ['US', 'US', 'DE'],
+        'remote_ratio': [0, 100, 50],
+        'company_location': ['US', 'US', 'DE'],
+        'company_size': ['M', 'L', 'S'],
+    }).to_csv(path, index=False)
+
+def test_load_data_writes_and_reads_sidecar(tmp_path):
+    """Test czy pierwszy odczyt tworzy sidecar, a kolejny z niego korzysta."""
+    pytest.importorskip("pyarrow")
+    csv_path = tmp_path / "salaries.csv"
+    _write_sample_csv(csv_path)
+
+    df = load_data(str(csv_path))
+    sidecar = tmp_path / "salaries.parquet"
+    assert sidecar.exists(), "Sidecar Parquet powinien zostać zapisany"
+
+    cached = load_data(str(csv_path), columns=['job_title', 'salary_in_usd'])
+    assert list(cached.columns) == ['job_title', 'salary_in_usd']
+    assert cached['job_title'].dtype == 'category'
+    assert cached['salary_in_usd'].tolist() == df['salary_in_usd'].tolist()
+
+def test_load_data_without_sidecar(tmp_path):
+    """Test czy sidecar=None czyta tylko CSV."""
+    csv_path = tmp_path / "salaries.csv"
+    _write_sample_csv(csv_path)
+
+    df = load_data(str(csv_path), sidecar=None)
+    assert not (tmp_path / "salaries.parquet").exists()
+    assert df['remote_ratio'].dtype == 'int8'
+
+def test_iter_chunks_csv_and_sidecar(tmp_path):
+    """Test czy porcje z CSV i z sidecara dają razem wszystkie wiersze."""
+    csv_path = tmp_path / "salaries.csv"
+    _write_sample_csv(csv_path)
+
+    chunks = list(iter_chunks(str(csv_path), chunksize=2, sidecar=None))
+    assert [len(chunk) for chunk in chunks] == [2, 1]
+    assert chunks[0]['work_year'].dtype == 'int16'
+
+    pytest.importorskip("pyarrow")
+    load_data(str(csv_path))  # tworzy sidecar Parquet
+    chunks = list(iter_chunks(str(csv_path), chunksize=2, columns=['job_title', 'salary_in_usd']))
+    assert sum(len(chunk) for chunk in chunks) == 3
+    assert list(chunks[0].columns) == ['job_title', 'salary_in_usd']
+
+@pytest.mark.parametrize("name", [
+    "salaries.csv.gz", "salaries.ndjson", "salaries.jsonl.gz",
+    "salaries.json", "salaries.parquet", "salaries.feather",
+])
+def test_all_formats_give_same_typed_schema(tmp_path, name):
+    """Test czy każdy format z rejestru daje te same dane i typy co CSV."""
+    if name.endswith(("parquet", "feather")):
+        pytest.importorskip("pyarrow")
+    csv_path = tmp_path / "source.csv"
+    _write_sample_csv(csv_path)
+    expected = load_data(str(csv_path), sidecar=None)
+
+    path = str(tmp_path / name)
+    write_dataset(expected, path)
+    df = load_data(path, sidecar=None)
+    pd.testing.assert_frame_equal(df, expected, check_categorical=False)
+    assert df['job_title'].dtype == 'category' and df['work_year'].dtype == 'int16'
+
+    chunks = list(iter_chunks(path, chunksize=2, columns=['job_title', 'salary_in_usd'], sidecar=None))
+    assert sum(len(chunk) for chunk in chunks) == 3
+    assert list(chunks[0].columns) == ['job_title', 'salary_in_usd']
+
+def test_detect_format_by_magic_bytes(tmp_path):
+    """Test czy format bez rozszerzenia rozpoznajemy po zawartości pliku."""
+    csv_path = tmp_path / "source.csv"
+    _write_sample_csv(csv_path)
+    df = load_data(str(csv_path), sidecar=None)
+
+    write_dataset(df, str(tmp_path / "lines.ndjson.gz"))
+    os.rename(tmp_path / "lines.ndjson.gz", tmp_path / "export")
+    assert detect_format(str(tmp_path / "export")) == ('ndjson', 'gzip')
+
+    # Bliźniak .json zapisany jako NDJSON też jest rozpoznany
+    write_dataset(df, str(tmp_path / "twin.ndjson"))
+    os.rename(tmp_path / "twin.ndjson", tmp_path / "twin.json")
+    assert detect_format(str(tmp_path / "twin.json")) == ('ndjson', None)
+    assert len(load_data(str(tmp_path / "twin.json"))) == 3
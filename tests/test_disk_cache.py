@@ -0,0 +1,89 @@
+# 🧪 MODUŁ: Testy trwałego cache na dysku
+
+# Cel: Sprawdzenie odczytu między instancjami (restart), wersji kodu w kluczu,
+# usuwania najdawniej używanych wpisów i drugiego poziomu cache wykresów
+
+# Uruchomienie: pytest tests/ -v
+
+
+import os
+import sys
+import time
+
+import plotly.graph_objects as go
+
+# Dodanie ścieżki do katalogu głównego projektu (importy src.*)
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from benchmarks.synthetic import make_salaries
+from src.disk_cache import DiskCache
+from src.figure_cache import FigureCache
+from src.live_data import LiveDataset
+
+def test_entries_survive_new_instance_and_depend_on_code_version(tmp_path):
+    """Test czy nowa instancja (restart) czyta wpis, a inna wersja kodu go nie widzi."""
+    DiskCache(tmp_path, version='v1').put(('dataset', 'abc'), {'rows': 3})
+
+    assert DiskCache(tmp_path, version='v1').get(('dataset', 'abc')) == {'rows': 3}
+    assert DiskCache(tmp_path, version='v2').get(('dataset', 'abc')) is None
+    assert not [name for _, _, files in os.walk(tmp_path) for name in files if name.endswith('.tmp')]
+
+def test_eviction_removes_least_recently_used(tmp_path):
+    """Test czy po przekroczeniu limitu znika wpis najdawniej użyty, a uszkodzony to chybienie."""
+    cache = DiskCache(tmp_path, max_bytes=2500, version='v1')
+    cache.put('a', b'x' * 1000)
+    cache.put('b', b'x' * 1000)
+    old = time.time() - 60
+    os.utime(cache._path('b'), (old, old))
+    cache.get('a')  # odczyt odświeża "a"
+    cache.put('c', b'x' * 1000)
+
+    assert cache.get('b') is None
+    assert cache.get('a') is not None and cache.get('c') is not None
+    assert cache.stats()['evictions'] == 1
+
+    with open(cache._path('a'), 'wb') as f:
+        f.write(b'uszkodzony')
+    assert cache.get('a') is None
+    assert not os.path.exists(cache._path('a'))
+
+def test_put_scans_directory_only_over_limit(tmp_path, monkeypatch):
+    """Test czy zapis pod limitem nie skanuje katalogu (suma bieżąca), a przekroczenie - tak."""
+    cache = DiskCache(tmp_path, max_bytes=5000, version='v1')
+    cache.put('a', b'x' * 1000)  # pierwszy zapis: jeden skan katalogu
+    walks = []
+    walk = os.walk
+    monkeypatch.setattr(os, 'walk', lambda *args, **kwargs: walks.append(1) or walk(*args, **kwargs))
+
+    cache.put('b', b'x' * 1000)
+    cache.put('b', b'x' * 1000)  # nadpisanie nie zwiększa sumy
+    cache.put('c', b'x' * 1000)
+    assert walks == []
+    assert cache.stats()['entries'] == 3
+
+    cache.put('d', b'x' * 1000)
+    cache.put('e', b'x' * 1000)
+    assert walks and cache.stats()['evictions'] >= 1
+    assert cache.stats()['bytes'] <= 5000
+
+def test_dataset_and_figures_read_from_disk_after_restart(tmp_path):
+    """Test czy drugi "proces" bierze tabelę, kostkę i wykres z dysku zamiast liczyć."""
+    csv_path = tmp_path / "salaries.csv"
+    make_salaries(500, seed=4).to_csv(csv_path, index=False)
+    directory = tmp_path / "cache"
+
+    first = LiveDataset(str(csv_path), disk_cache=DiskCache(directory, version='v1')).current
+    cache = DiskCache(directory, version='v1')
+    second = LiveDataset(str(csv_path), disk_cache=cache).current
+    assert cache.stats()['hits'] == 1
+    assert second.fingerprint == first.fingerprint
+    assert second.df.equals(first.df)
+    assert second.cube.rollup(['job_title']).equals(first.cube.rollup(['job_title']))
+
+    build = lambda: go.Figure(go.Bar(x=[1, 2], y=[3, 4]))
+    FigureCache(disk=DiskCache(directory, version='v1')).get_or_build(('fp', 'bar', ()), build)
+    figures = FigureCache(disk=DiskCache(directory, version='v1'))
+    calls = []
+    fig = figures.get_or_build(('fp', 'bar', ()), lambda: calls.append(1))
+    assert not calls and list(fig.data[0].y) == [3, 4]
+    assert figures.stats()['disk_hits'] == 1
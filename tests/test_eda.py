@@ -0,0 +1,19 @@
+# 🧪 MODUŁ: Testy orkiestracji sekcji EDA
+
+# Cel: Sprawdzenie spójności rejestru sekcji z nawigacją w sidebarze
+
+# Uruchomienie: pytest tests/ -v
+
+
+import sys
+import os
+
+# Dodanie ścieżki do katalogu głównego projektu (importy src.*)
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.eda import EDA_SECTIONS
+from src.components.sidebar import EDA_SECTION_LABELS
+
+def test_section_registry_matches_navigation():
+    """Test czy każda sekcja z nawigacji ma funkcję w rejestrze (i odwrotnie)."""
+    assert list(EDA_SECTIONS) == list(EDA_SECTION_LABELS)
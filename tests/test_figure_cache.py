@@ -0,0 +1,91 @@
+# 🧪 MODUŁ: Testy cache wykresów
+
+# Cel: Sprawdzenie trafień/chybień, usuwania LRU i odcisku danych
+
+# Uruchomienie: pytest tests/ -v
+
+
+import pandas as pd
+import plotly.graph_objects as go
+import sys
+import os
+
+# Dodanie ścieżki do katalogu głównego projektu (importy src.*)
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src import figure_cache
+from src.figure_cache import FigureCache, cached_figure, dataset_fingerprint
+
+def _figure(n):
+    """Tworzy prosty wykres słupkowy z n punktami."""
+    return go.Figure(go.Bar(x=list(range(n)), y=list(range(n))))
+
+def test_get_or_build_counts_hits_and_misses():
+    """Test czy drugi odczyt tego samego klucza jest trafieniem."""
+    cache = FigureCache()
+    calls = []
+
+    def builder():
+        calls.append(1)
+        return _figure(5)
+
+    first = cache.get_or_build(('fp', 'chart', (1,)), builder)
+    second = cache.get_or_build(('fp', 'chart', (1,)), builder)
+
+    assert len(calls) == 1, "Builder powinien zostać wywołany tylko raz"
+    assert list(second.data[0].x) == list(first.data[0].x)
+    assert cache.stats()['hits'] == 1
+    assert cache.stats()['misses'] == 1
+
+def test_lru_eviction_by_size():
+    """Test czy przekroczenie limitu bajtów usuwa najdawniej używany wpis."""
+    probe = FigureCache()
+    probe.get_or_build('probe', lambda: _figure(50))
+    entry_size = probe.stats()['bytes']
+
+    cache = FigureCache(max_bytes=int(entry_size * 2.5))
+    cache.get_or_build('a', lambda: _figure(50))
+    cache.get_or_build('b', lambda: _figure(50))
+    cache.get_or_build('a', lambda: _figure(50))  # 'a' staje się najświeższy
+    cache.get_or_build('c', lambda: _figure(50))  # usuwa 'b'
+
+    assert cache.stats()['evictions'] == 1
+    assert cache.stats()['bytes'] <= cache.max_bytes
+    cache.get_or_build('a', lambda: _figure(50))
+    assert cache.stats()['hits'] == 2
+
+def test_tuple_of_figures_roundtrip():
+    """Test czy krotka wykresów wraca z cache jako krotka."""
+    cache = FigureCache()
+    cache.get_or_build('maps', lambda: (_figure(3), _figure(4)))
+    figures = cache.get_or_build('maps', lambda: None)
+    assert isinstance(figures, tuple) and len(figures) == 2
+
+def test_dataset_fingerprint_changes_with_content():
+    """Test czy odcisk zmienia się po zmianie danych."""
+    df = pd.DataFrame({'salary_in_usd': [1.0, 2.0], 'job_title': ['A', 'B']})
+    changed = df.assign(salary_in_usd=[1.0, 3.0])
+    assert dataset_fingerprint(df) == dataset_fingerprint(df.copy())
+    assert dataset_fingerprint(df) != dataset_fingerprint(changed)
+
+def test_cached_figure_key_includes_compaction_settings(monkeypatch):
+    """Test czy zmiana EDA_COMPACT_FIGURES / EDA_POINT_BUDGET nie zwraca wykresu z innymi ustawieniami."""
+    cache = FigureCache()
+    monkeypatch.setattr(figure_cache, 'FIGURE_CACHE', cache)
+    calls = []
+
+    def builder():
+        calls.append(1)
+        return _figure(5)
+
+    monkeypatch.setattr(figure_cache, 'COMPACT_FIGURES', True)
+    monkeypatch.setattr(figure_cache, 'POINT_BUDGET', 500)
+    cached_figure('fp', 'chart', (), builder)
+    cached_figure('fp', 'chart', (), builder)
+    monkeypatch.setattr(figure_cache, 'POINT_BUDGET', 100)
+    cached_figure('fp', 'chart', (), builder)
+    monkeypatch.setattr(figure_cache, 'COMPACT_FIGURES', False)
+    cached_figure('fp', 'chart', (), builder)
+
+    assert len(calls) == 3
+    assert cache.stats()['entries'] == 3
@@ -0,0 +1,115 @@
+# 🧪 MODUŁ: Testy globalnych filtrów
+
+# Cel: Sprawdzenie, czy FilterIndex daje te same wiersze co filtrowanie pandas
+
+# Uruchomienie: pytest tests/ -v
+
+
+import numpy as np
+import pandas as pd
+import sys
+import os
+
+# Dodanie ścieżki do katalogu głównego projektu (importy src.*)
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.filters import FilterIndex, MAX_BITMAP_VALUES
+
+def _sample_frame(n=2000, seed=0):
+    """Tworzy losowy DataFrame z kolumnami filtrów (stanowisk więcej niż limit bitmap)."""
+    rng = np.random.default_rng(seed)
+    titles = [f"Job {i}" for i in range(MAX_BITMAP_VALUES + 20)]
+    return pd.DataFrame({
+        'work_year': rng.choice([2021, 2022, 2023, 2024], n).astype('int16'),
+        'experience_level': pd.Categorical(rng.choice(['EN', 'MI', 'SE', 'EX'], n)),
+        'company_size': pd.Categorical(rng.choice(['S', 'M', 'L'], n)),
+        'remote_ratio': rng.choice([0, 50, 100], n).astype('int8'),
+        'company_location': pd.Categorical(rng.choice(['US', 'PL', 'DE', 'GB'], n)),
+        'employee_residence': pd.Categorical(rng.choice(['US', 'PL', 'DE', 'GB'], n)),
+        'job_title': pd.Categorical(rng.choice(titles, n)),
+        'salary_in_usd': rng.uniform(20_000, 300_000, n),
+    })
+
+def test_combined_filter_matches_pandas():
+    """Test połączonego filtra (zakres lat + bitmapy + pozycje) względem pandas."""
+    df = _sample_frame()
+    index = FilterIndex(df)
+    state = {
+        'work_year': (2022, 2023),
+        'experience_level': ['SE', 'EX'],
+        'remote_ratio': [100],
+        'job_title': ['Job 1', 'Job 70', 'Job 5'],
+    }
+    expected = df[
+        df['work_year'].between(2022, 2023)
+        & df['experience_level'].isin(['SE', 'EX'])
+        & (df['remote_ratio'] == 100)
+        & df['job_title'].isin(['Job 1', 'Job 70', 'Job 5'])
+    ]
+    view = index.view(state)
+    assert view.is_filtered
+    np.testing.assert_array_equal(view.positions, np.flatnonzero(df.index.isin(expected.index)))
+    assert view.count == len(expected)
+    assert np.isclose(view.cube.rollup().iloc[0]['mean_salary'], expected['salary_in_usd'].mean())
+
+def test_empty_state_returns_base_frame():
+    """Test czy brak filtrów (i pełny zakres lat) zwraca ten sam DataFrame bez kopii."""
+    df = _sample_frame()
+    index = FilterIndex(df)
+    view = index.view({'work_year': (2021, 2024), 'job_title': []})
+    assert not view.is_filtered
+    assert view.frame is df
+    assert view.fingerprint('abc') == 'abc'
+
+def test_views_are_memoized():
+    """Test czy ten sam stan filtrów zwraca zapamiętany widok."""
+    index = FilterIndex(_sample_frame())
+    state = {'company_location': ['PL']}
+    assert index.view(state) is index.view({'company_location': ['PL']})
+    assert index.view(state).fingerprint('abc') != 'abc'
+
+def test_view_cache_bounded_by_rows_held():
+    """Test czy zapamiętane widoki trzymają razem najwyżej max_cached_rows wierszy."""
+    df = _sample_frame(n=2000)
+    index = FilterIndex(df)
+    views = [index.view({'company_location': [country]}) for country in index.options('company_location')]
+    assert index._cached_rows == sum(view.rows_held for view in index._views.values()) <= len(df)
+
+    small = FilterIndex(df, max_cached_rows=views[0].count)
+    first = small.view({'company_location': [index.options('company_location')[0]]})
+    small.view({'company_location': [index.options('company_location')[1]]})
+    assert small.view({'company_location': [index.options('company_location')[0]]}) is not first
+    assert small._cached_rows <= views[0].count
+
+def test_cube_of_key_filters_comes_from_base_cells():
+    """Test czy kostka widoku po kluczach kostki to wybór komórek (bez ramki) równy przeliczeniu."""
+    from src.aggregates import SalaryCube
+
+    df = _sample_frame(n=5000)
+    base = SalaryCube.from_frame(df)
+    index = FilterIndex(df, cube=base)
+    view = index.view({'work_year': (2022, 2023), 'company_location': ['PL', 'DE'], 'job_title': ['Job 1', 'Job 70']})
+
+    cube = view.cube
+    assert view._frame is None
+    expected = SalaryCube.from_frame(view.frame)
+    left = cube.rollup(['job_title']).set_index('job_title')
+    right = expected.rollup(['job_title']).set_index('job_title')
+    np.testing.assert_allclose(left.loc[right.index, 'mean_salary'], right['mean_salary'])
+    np.testing.assert_array_equal(left.loc[right.index, 'count'], right['count'])
+    np.testing.assert_array_equal(cube.histogram().counts, expected.histogram().counts)
+    np.testing.assert_allclose(cube.quantiles((0.25, 0.5)).iloc[0], expected.quantiles((0.25, 0.5)).iloc[0])
+
+    # Filtr spoza kluczy kostki → kostka z wierszy widoku
+    other = index.view({'company_size': ['S'], 'company_location': ['PL']})
+    assert other.cube.rollup().iloc[0]['count'] == other.count
+
+def test_view_cube_is_built_once_across_threads():
+    """Test czy równoczesne odczyty kostki widoku z wielu wątków dają ten sam obiekt."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    df = _sample_frame()
+    view = FilterIndex(df).view({'remote_ratio': [100]})
+    with ThreadPoolExecutor(8) as pool:
+        cubes = list(pool.map(lambda _: view.cube, range(16)))
+    assert all(cube is cubes[0] for cube in cubes)
@@ -0,0 +1,66 @@
+# 🧪 MODUŁ: Testy instrumentacji
+
+# Cel: Sprawdzenie spanów, profilu reruna, eksportu Prometheus i endpointu /metrics
+
+# Uruchomienie: pytest tests/ -v
+
+
+import urllib.request
+import sys
+import os
+
+# Dodanie ścieżki do katalogu głównego projektu (importy src.*)
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.instrumentation import (
+    METRICS, current_profile, end_rerun, prometheus_text, record, span,
+    start_metrics_server, start_rerun,
+)
+from src.parallel import SectionExecutor, SectionTask
+
+def _traced_task():
+    with span('test:in_pool'):
+        return 1
+
+def test_spans_go_to_profile_and_process_metrics():
+    """Test czy span trafia do profilu reruna (także z puli wątków) i do liczników procesu."""
+    METRICS.clear()
+    profile = start_rerun()
+    with span('test:block'):
+        pass
+    record('test:payload', 0.01, payload_bytes=2048)
+    executor = SectionExecutor('thread', max_workers=2)
+    executor.run([SectionTask('traced', (), _traced_task, ())])
+    executor.shutdown()
+    end_rerun(profile, caches={'figures': {'hits': 3, 'misses': 1, 'hit_ratio': 0.75}})
+
+    names = [name for name, _, _ in profile.spans]
+    assert {'test:block', 'test:payload', 'test:in_pool', 'task:traced'} <= set(names)
+    assert current_profile() is None
+    assert profile.seconds > 0
+    assert METRICS.snapshot()['test:payload']['bytes'] == 2048
+    # Bez aktywnego profilu spany trafiają tylko do liczników procesu
+    with span('test:block'):
+        pass
+    assert METRICS.snapshot()['test:block']['count'] == 2
+    assert names.count('test:block') == 1
+
+def test_prometheus_text_and_endpoint():
+    """Test czy eksport ma format Prometheus i jest dostępny pod /metrics."""
+    METRICS.clear()
+    record('section:geo "x"', 0.5, payload_bytes=100)
+    text = prometheus_text({'figures': {'hits': 1, 'misses': 1, 'hit_ratio': 0.5}})
+    assert '# TYPE eda_span_seconds summary' in text
+    assert 'eda_span_seconds_count{span="section:geo \\"x\\""} 1' in text
+    assert 'eda_payload_bytes_total{span="section:geo \\"x\\""} 100' in text
+    assert 'eda_cache_hit_ratio{cache="figures"} 0.5000' in text
+
+    server = start_metrics_server(0, host='127.0.0.1')
+    try:
+        port = server.server_address[1]
+        with urllib.request.urlopen(f"http://127.0.0.1:{port}/metrics") as response:
+            body = response.read().decode()
+            assert response.headers['Content-Type'].startswith('text/plain')
+        assert 'eda_span_seconds_sum{span="section:geo \\"x\\""} 0.500000' in body
+    finally:
+        server.shutdown()
@@ -0,0 +1,69 @@
+# 🧪 MODUŁ: Testy indeksu stanowisk
+
+# Cel: Sprawdzenie, czy wycinki, trend i metryki z indeksu zgadzają się
+# z filtrowaniem surowych danych, oraz wyszukiwania stanowisk
+
+# Uruchomienie: pytest tests/ -v
+
+
+import numpy as np
+import pandas as pd
+import sys
+import os
+
+# Dodanie ścieżki do katalogu głównego projektu (importy src.*)
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from benchmarks.synthetic import make_salaries
+from src.aggregates import SalaryCube
+from src.job_index import JobTitleIndex, job_index
+
+def test_slices_and_stats_match_full_scan():
+    """Test czy pozycje, trend i mediana stanowiska to to samo co df[df['job_title'] == ...]."""
+    df = make_salaries(5000, seed=3)
+    cube = SalaryCube.from_frame(df)
+    index = JobTitleIndex(cube, df)
+
+    for title in index.titles[:5]:
+        expected = df[df['job_title'] == title]
+        np.testing.assert_array_equal(index.positions(title), np.flatnonzero(df['job_title'] == title))
+        assert index.rows(title).equals(expected)
+
+        count, mean, median = index.stats(title, exact=True)
+        assert count == len(expected)
+        assert np.isclose(mean, expected['salary_in_usd'].mean())
+        assert median == expected['salary_in_usd'].median()
+
+        yearly = expected.groupby('work_year', observed=True)['salary_in_usd'].agg(['count', 'mean'])
+        trend = index.trend(title).set_index('work_year')
+        np.testing.assert_array_equal(trend['count'], yearly['count'])
+        np.testing.assert_allclose(trend['mean_salary'], yearly['mean'])
+
+def test_search_prefix_substring_and_fuzzy():
+    """Test czy wyszukiwanie łapie prefiks, fragment i literówkę (bez wielkości liter)."""
+    titles = ['Data Scientist', 'Data Engineer', 'ML Engineer', 'Research Scientist', 'Analytics Engineer']
+    df = pd.DataFrame({
+        'work_year': np.int16(2024),
+        'job_title': pd.Categorical(titles),
+        'company_location': pd.Categorical(['US'] * 5),
+        'employee_residence': pd.Categorical(['US'] * 5),
+        'experience_level': pd.Categorical(['SE'] * 5),
+        'salary_in_usd': [100_000.0, 110_000.0, 120_000.0, 130_000.0, 140_000.0],
+    })
+    index = JobTitleIndex(SalaryCube.from_frame(df), df)
+
+    assert index.search('data') == ['Data Engineer', 'Data Scientist']
+    assert index.search('SCIENT')[:2] == ['Data Scientist', 'Research Scientist']
+    assert 'ML Engineer' in index.search('ml enginer')
+    assert index.search('') == sorted(titles)
+
+def test_index_is_built_once_per_cube():
+    """Test czy indeks jest zapamiętany przy kostce, a bez df działa na samych agregatach."""
+    df = make_salaries(1000)
+    cube = SalaryCube.from_frame(df)
+    assert job_index(cube, df) is job_index(cube, df)
+
+    out_of_core = job_index(cube)
+    title = out_of_core.titles[0]
+    assert out_of_core.positions(title) is None
+    assert out_of_core.stats(title)[0] == (df['job_title'] == title).sum()
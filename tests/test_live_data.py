@@ -0,0 +1,146 @@
+# 🧪 MODUŁ: Testy przyrostowego odświeżania danych
+
+# Cel: Sprawdzenie, czy dopisane do CSV wiersze trafiają do tabeli i kostki
+# tak samo, jak przy pełnym wczytaniu pliku
+
+# Uruchomienie: pytest tests/ -v
+
+
+import numpy as np
+import pandas as pd
+import pytest
+import sys
+import os
+
+# Dodanie ścieżki do katalogu głównego projektu (importy src.*)
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.data_loader import load_data, read_csv_delta
+from src.disk_cache import file_digest
+from src.live_data import LiveDataset
+
+def _rows(n, seed=0, titles=('Data Scientist', 'Data Engineer')):
+    """Tworzy n wierszy zgodnych ze schematem danych wynagrodzeń."""
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        'work_year': rng.choice([2024, 2025], n),
+        'experience_level': rng.choice(['SE', 'MI'], n),
+        'employment_type': 'FT',
+        'job_title': rng.choice(list(titles), n),
+        'salary': rng.integers(50_000, 200_000, n),
+        'salary_currency': 'USD',
+        'salary_in_usd': rng.integers(50_000, 200_000, n),
+        'employee_residence': rng.choice(['US', 'PL'], n),
+        'remote_ratio': rng.choice([0, 100], n),
+        'company_location': rng.choice(['US', 'PL'], n),
+        'company_size': rng.choice(['S', 'M'], n),
+    })
+
+def _append(path, rows):
+    """Dopisuje wiersze na końcu pliku CSV (bez nagłówka)."""
+    rows.to_csv(path, mode='a', header=False, index=False)
+
+def test_read_csv_delta_skips_incomplete_line(tmp_path):
+    """Test czy delta czyta tylko pełne linie za znacznikiem."""
+    csv_path = tmp_path / "salaries.csv"
+    _rows(5).to_csv(csv_path, index=False)
+    offset = os.path.getsize(csv_path)
+
+    _append(csv_path, _rows(3, seed=1))
+    with open(csv_path, 'a') as f:
+        f.write("2025,SE,FT,Data Scien")  # zapis w toku
+    delta, new_offset = read_csv_delta(str(csv_path), offset)
+    assert len(delta) == 3
+    assert delta['work_year'].dtype == 'int16'
+    assert new_offset < os.path.getsize(csv_path)
+
+def test_refresh_appends_delta_and_merges_cube(tmp_path):
+    """Test czy po dopisaniu wierszy tabela i kostka zgadzają się z pełnym wczytaniem."""
+    csv_path = tmp_path / "salaries.csv"
+    _rows(200).to_csv(csv_path, index=False)
+    dataset = LiveDataset(str(csv_path))
+    first = dataset.current
+    assert dataset.refresh(force=True) is False
+
+    # Nowe stanowisko w delcie - kategorie muszą zostać poszerzone
+    _append(csv_path, _rows(50, seed=1, titles=('ML Engineer',)))
+    assert dataset.refresh(force=True) is True
+    snapshot = dataset.current
+    assert snapshot.version == first.version + 1
+    assert snapshot.fingerprint != first.fingerprint
+    assert first.rows == 200 and snapshot.rows == 250
+
+    full = load_data(str(csv_path), sidecar=None)
+    assert snapshot.df['job_title'].dtype == 'category'
+    assert snapshot.df['job_title'].astype(str).tolist() == full['job_title'].astype(str).tolist()
+    stats = snapshot.cube.rollup(['job_title']).set_index('job_title')
+    expected = full.groupby('job_title', observed=True)['salary_in_usd'].mean()
+    np.testing.assert_allclose(stats.loc[expected.index, 'mean_salary'], expected)
+
+def test_refresh_reloads_rewritten_file(tmp_path):
+    """Test czy przepisany (krótszy) plik powoduje pełne wczytanie."""
+    csv_path = tmp_path / "salaries.csv"
+    _rows(100).to_csv(csv_path, index=False)
+    dataset = LiveDataset(str(csv_path))
+
+    _rows(10, seed=2).to_csv(csv_path, index=False)
+    assert dataset.refresh(force=True) is True
+    assert dataset.current.rows == 10
+    assert dataset.current.version == 2
+
+def test_snapshot_frame_is_read_only_and_shared(tmp_path):
+    """Test czy tabela snapshotu jest tylko do odczytu, bez kopii przy odczycie i po dopisaniu."""
+    csv_path = tmp_path / "salaries.csv"
+    _rows(100).to_csv(csv_path, index=False)
+    dataset = LiveDataset(str(csv_path))
+    _append(csv_path, _rows(20, seed=3))
+    dataset.refresh(force=True)
+    df = dataset.current.df
+
+    assert dataset.current.version_id == dataset.current.fingerprint
+    assert df is dataset.current.df
+    with pytest.raises(ValueError):
+        df.loc[0, 'salary_in_usd'] = 1.0
+    with pytest.raises(ValueError):
+        df.loc[0, 'job_title'] = 'Data Engineer'
+    # Nowe obiekty (filtr, assign) działają normalnie
+    high = df[df['salary_in_usd'] > 100_000].assign(k=1)
+    high.loc[high.index[0], 'salary_in_usd'] = 1.0
+    assert df['salary_in_usd'].min() >= 50_000
+
+def test_version_id_after_append_matches_fresh_load(tmp_path):
+    """Test czy wersja po dopisaniu ma ten sam identyfikator co pełne wczytanie pliku (np. po restarcie)."""
+    csv_path = tmp_path / "salaries.csv"
+    _rows(100).to_csv(csv_path, index=False)
+    dataset = LiveDataset(str(csv_path))
+    assert dataset.current.version_id == file_digest(str(csv_path))
+
+    _append(csv_path, _rows(30, seed=4))
+    dataset.refresh(force=True)
+    _append(csv_path, _rows(5, seed=5))
+    dataset.refresh(force=True)
+
+    restarted = LiveDataset(str(csv_path))
+    assert dataset.current.version == 3 and restarted.current.version == 1
+    assert dataset.current.version_id == restarted.current.version_id == file_digest(str(csv_path))
+
+def test_refresh_advances_watermark_past_blank_lines(tmp_path):
+    """Test czy dopisane puste linie przesuwają znacznik (bez nowych wierszy) i dalsze dopisanie działa."""
+    csv_path = tmp_path / "salaries.csv"
+    _rows(100).to_csv(csv_path, index=False)
+    dataset = LiveDataset(str(csv_path))
+    first = dataset.current
+
+    with open(csv_path, 'a') as f:
+        f.write("\n\n")
+    assert dataset.refresh(force=True) is True
+    blank = dataset.current
+    assert blank.offset == os.path.getsize(csv_path)
+    assert blank.df is first.df and blank.cube is first.cube
+    assert blank.version_id == file_digest(str(csv_path))
+    assert dataset.refresh(force=True) is False
+
+    _append(csv_path, _rows(10, seed=6))
+    assert dataset.refresh(force=True) is True
+    assert dataset.current.rows == 110
+    assert dataset.current.version_id == LiveDataset(str(csv_path)).current.version_id
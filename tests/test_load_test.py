@@ -0,0 +1,57 @@
+# 🧪 MODUŁ: Testy testu obciążenia (benchmarks/load_test.py)
+
+# Cel: Sprawdzenie percentyli i przyrostu RSS, progów regresji oraz krótkiego
+# przebiegu z równoczesnymi sesjami AppTest na małych danych
+
+# Uruchomienie: pytest tests/ -v
+
+
+import sys
+import os
+
+# Dodanie ścieżki do katalogu głównego projektu (importy src.*, benchmarks.*)
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from streamlit import config as streamlit_config
+from streamlit.runtime import Runtime
+
+from benchmarks.load_test import check, percentiles, rss_growth, run_load_test
+from benchmarks.synthetic import make_salaries
+from src.data_loader import write_dataset
+
+def test_percentiles_and_rss_growth():
+    """Test czy percentyle są w ms, a przyrost RSS liczony od pierwszej próbki."""
+    stats = percentiles([i / 1000 for i in range(1, 101)])
+    assert stats['count'] == 100
+    assert round(stats['p50_ms'], 1) == 50.5 and stats['p95_ms'] < stats['p99_ms'] <= stats['max_ms'] == 100
+    assert percentiles([])['p95_ms'] is None
+
+    # 1 MB więcej co 10 rerunów → ~100 KB/rerun
+    samples = [(t, 10 * t, 200e6 + t * 1024 * 1024) for t in range(5)]
+    growth = rss_growth(samples)
+    assert round(growth['growth_mb'], 1) == 4.2
+    assert round(growth['kb_per_rerun'], 1) == 102.4
+
+def test_check_flags_thresholds_and_errors():
+    """Test czy przekroczone progi i błędy rerunów kończą test porażką."""
+    result = {'errors': [], 'overall': {'p95_ms': 300.0}, 'rss': {'growth_mb': 5.0}}
+    assert check(result, max_p95_ms=500, max_rss_growth_mb=10) == []
+    assert len(check(result, max_p95_ms=200, max_rss_growth_mb=1)) == 2
+    assert check({**result, 'errors': ['boom']}) == ["1 rerunów z błędem"]
+
+def test_concurrent_sessions_report(tmp_path, monkeypatch):
+    """Test czy równoczesne sesje przechodzą scenariusz bez błędów i raportują każdy rerun."""
+    path = str(tmp_path / 'salaries.csv')
+    write_dataset(make_salaries(2000), path)
+    monkeypatch.setenv('EDA_DATA_PATH', path)
+    get_option = streamlit_config.get_option
+
+    result = run_load_test(sessions=2, steps=4, seed=1)
+
+    assert result['errors'] == []
+    assert result['actions']['start']['count'] == 2
+    # Każda interakcja to co najmniej jeden rerun (przełączenie sekcji - dodatkowy)
+    assert result['overall']['count'] >= 2 * 4
+    assert result['throughput_rps'] > 0 and result['rss']['start_mb'] > 0
+    # Globalny stan Streamlit przywrócony po teście
+    assert Runtime._instance is None and streamlit_config.get_option is get_option
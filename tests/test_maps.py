@@ -0,0 +1,40 @@
+# 🧪 MODUŁ: Testy map i konwersji kodów krajów
+
+# Cel: Sprawdzenie wektorowej konwersji ISO-2 → ISO-3 i raportowania nieznanych kodów
+
+# Uruchomienie: pytest tests/ -v
+
+
+import pandas as pd
+import sys
+import os
+
+# Dodanie ścieżki do katalogu głównego projektu (importy src.*)
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.visualization.maps import create_world_map, iso2_to_iso3, map_iso2_to_iso3
+
+def test_iso2_to_iso3_known_and_unknown():
+    """Test konwersji pojedynczego kodu."""
+    assert iso2_to_iso3('PL') == 'POL'
+    assert iso2_to_iso3('XX') is None
+
+def test_map_iso2_to_iso3_categorical_reports_unmapped():
+    """Test wektorowej konwersji kolumny category z nieznanymi kodami."""
+    codes = pd.Series(['US', 'PL', 'XX', 'US', 'EU'], dtype='category')
+    iso3, unmapped = map_iso2_to_iso3(codes)
+
+    assert list(iso3[:2]) == ['USA', 'POL']
+    assert iso3.isna().sum() == 2
+    assert unmapped == ['EU', 'XX']
+
+def test_create_world_map_annotates_unmapped_codes():
+    """Test czy mapa informuje o pominiętych kodach krajów."""
+    stats = pd.DataFrame({
+        'company_location': pd.Categorical(['US', 'XX']),
+        'mean_salary': [150000.0, 90000.0],
+    })
+    fig = create_world_map(stats, 'company_location')
+
+    assert list(fig.data[0].locations) == ['USA']
+    assert any('XX' in annotation.text for annotation in fig.layout.annotations)
@@ -0,0 +1,116 @@
+# 🧪 MODUŁ: Testy równoległego liczenia sekcji
+
+# Cel: Sprawdzenie puli sekcji (wyniki, limity czasu, błędy) i zgodności
+# planu zadań EDA z tym, o co proszą sekcje przy renderowaniu
+
+# Uruchomienie: pytest tests/ -v
+
+
+import pickle
+import time
+import sys
+import os
+
+import pytest
+
+# Dodanie ścieżki do katalogu głównego projektu (importy src.*)
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from benchmarks.synthetic import make_salaries
+from src import analytics, eda
+from src.aggregates import SalaryCube
+from src.filters import FilterIndex
+from src.parallel import SectionExecutor, SectionTask, SectionTimeout, SharedData, _worker_data, resolve
+from src.shared_data import publish
+
+def _boom():
+    raise ValueError("błąd w zadaniu")
+
+def test_executor_returns_results_and_errors():
+    """Test czy wyniki trafiają pod klucze zadań, a błędy wracają przez resolve."""
+    executor = SectionExecutor('thread', max_workers=2)
+    tasks = [
+        SectionTask('sum', (1, 2), lambda a, b: a + b, (1, 2)),
+        SectionTask('fail', (), _boom, ()),
+    ]
+    results = executor.run(tasks)
+    executor.shutdown()
+
+    assert resolve(results, 'sum', (1, 2), None) == 3
+    with pytest.raises(ValueError):
+        resolve(results, 'fail', (), None)
+    # Brak wyniku (inny stan widgetu) → liczone na miejscu
+    assert resolve(results, 'sum', (5, 5), lambda a, b: a + b, 5, 5) == 10
+
+def test_executor_marks_timed_out_tasks():
+    """Test czy zadanie dłuższe niż limit nie blokuje strony."""
+    executor = SectionExecutor('thread', max_workers=2, timeout=0.2)
+    start = time.monotonic()
+    results = executor.run([SectionTask('slow', (), time.sleep, (2,))])
+    assert time.monotonic() - start < 1.5
+    executor.shutdown()
+    with pytest.raises(SectionTimeout):
+        resolve(results, 'slow', (), None)
+
+def test_cube_pickles_for_process_pool():
+    """Test czy kostka przechodzi do procesu roboczego (bez blokady i rollupów)."""
+    cube = SalaryCube.from_frame(make_salaries(500))
+    cube.rollup(['job_title'])
+    copy = pickle.loads(pickle.dumps(cube))
+    assert len(copy._rollups) == 0
+    assert copy.rollup(['job_title']).equals(cube.rollup(['job_title']))
+
+def _published(tmp_path, df):
+    pointer = publish(df, str(tmp_path))
+    return os.path.join(str(tmp_path), pointer['file']), pointer['fingerprint']
+
+def test_worker_data_cached_per_version_and_view(tmp_path):
+    """Test czy proces roboczy mapuje wersję raz, a widok filtrów odtwarza z uchwytu."""
+    pytest.importorskip("pyarrow")
+    df = make_salaries(3000, seed=2)
+    path, version = _published(tmp_path, df)
+    frame, cube = _worker_data(SharedData(path, version))
+    assert _worker_data(SharedData(path, version))[1] is cube
+    assert len(frame) == len(df)
+
+    index = FilterIndex(df, cube=SalaryCube.from_frame(df))
+    view = index.view({'experience_level': ['SE']})
+    shared = SharedData(path, version, view.key, view.positions, index.cube_filters(view.key))
+    frame, cube = _worker_data(shared)
+    assert frame['salary_in_usd'].tolist() == view.frame['salary_in_usd'].tolist()
+    assert cube.rollup().iloc[0]['count'] == view.count
+
+def test_process_pool_gets_handle_not_data(tmp_path):
+    """Test czy pula procesów liczy z uchwytu SharedData, a bez uchwytu - w wątku skryptu."""
+    pytest.importorskip("pyarrow")
+    df = make_salaries(2000, seed=1)
+    cube = SalaryCube.from_frame(df)
+    path, version = _published(tmp_path, df)
+    tasks = [SectionTask('summary', (), analytics.summary_stats, (cube, df))]
+
+    executor = SectionExecutor('process', max_workers=1)
+    inline = executor.run(tasks)
+    assert executor._pool is None
+    results = executor.run(tasks, shared=SharedData(path, version), frame=df, cube=cube)
+    executor.shutdown()
+
+    expected = resolve(inline, 'summary', (), None)
+    stats = resolve(results, 'summary', (), None)
+    assert (stats.count, stats.mean) == (expected.count, expected.mean)
+
+def test_section_plan_matches_rendered_requests(monkeypatch):
+    """Test czy każdy wynik policzony na puli jest użyty przy renderowaniu (bez przeliczeń)."""
+    df = make_salaries(2000)
+    requested = []
+
+    def tracking_resolve(prefetched, name, params, func, *args):
+        requested.append(((name, params), (name, params) in prefetched))
+        return resolve(prefetched, name, params, func, *args)
+
+    monkeypatch.setattr(eda, 'resolve', tracking_resolve)
+    executor = SectionExecutor('thread')
+    eda.show_eda(df, executor=executor)
+    executor.shutdown()
+
+    assert requested
+    assert all(hit for _, hit in requested)
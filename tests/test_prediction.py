@@ -0,0 +1,81 @@
+# 🧪 MODUŁ: Testy modelu predykcyjnego
+
+# Cel: Sprawdzenie, czy predykcja z tabel wkładów zgadza się z modelem sklearn,
+# przedziały mają deklarowane pokrycie, a trening odbywa się w tle
+
+# Uruchomienie: pytest tests/ -v
+
+
+import numpy as np
+import pandas as pd
+import pytest
+import sys
+import os
+
+# Dodanie ścieżki do katalogu głównego projektu (importy src.*)
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from benchmarks.synthetic import make_salaries
+from src.prediction import (
+    FEATURES, SMALL_BATCH, PredictionEngine, _as_strings, _fit, profile_grid, train_model,
+)
+
+def test_table_prediction_matches_sklearn():
+    """Test czy suma wkładów z tabel to to samo co Ridge na one-hot (mała i duża partia)."""
+    df = make_salaries(4000, seed=1)
+    model = train_model(df, 'v1')
+    features = pd.DataFrame({f: _as_strings(df[f]) for f in FEATURES})
+    encoder, ridge = _fit(features, np.log(df['salary_in_usd'].to_numpy()), 1.0)
+
+    expected = ridge.predict(encoder.transform(features))
+    np.testing.assert_allclose(model.log_predict(df[FEATURES]), expected)
+    np.testing.assert_allclose(model.log_predict(df[FEATURES].iloc[:SMALL_BATCH]), expected[:SMALL_BATCH])
+
+    unknown = df[FEATURES].iloc[:1].astype(object).assign(job_title='Nieznane stanowisko')
+    assert np.isfinite(model.predict(unknown)['prediction']).all()
+
+def test_intervals_cover_held_out_rows():
+    """Test czy ~80% nowych rekordów mieści się w przedziale 80%."""
+    model = train_model(make_salaries(10_000, seed=2), 'v1', coverage=0.8)
+    held_out = make_salaries(5000, seed=3)
+    predicted = model.predict(held_out[FEATURES])
+    inside = (held_out['salary_in_usd'] >= predicted['lower']) & (held_out['salary_in_usd'] <= predicted['upper'])
+
+    assert (predicted['lower'] < predicted['prediction']).all()
+    assert (predicted['prediction'] < predicted['upper']).all()
+    assert 0.75 <= inside.mean() <= 0.85
+    # Pokrycie w metrykach - z reszt wstrzymanych od kalibracji, zgodne z nowymi rekordami
+    assert abs(model.metrics.coverage - inside.mean()) < 0.05
+
+def test_coverage_not_reported_without_held_out_residuals():
+    """Test czy bez reszt wstrzymanych pokrycie nie jest raportowane (zamiast ≈ coverage z definicji)."""
+    model = train_model(make_salaries(2000, seed=2), 'v1', coverage=0.8, holdout=0)
+    assert np.isnan(model.metrics.coverage)
+
+def test_engine_trains_in_background_and_grid_predicts():
+    """Test czy silnik oddaje model dopiero po treningu w tle, a siatka daje wszystkie kombinacje."""
+    df = make_salaries(2000, seed=4)
+    engine = PredictionEngine()
+    assert engine.model(df, 'v1') == (None, False)
+    ready = engine.wait(timeout=60)
+    assert ready.version_id == 'v1'
+    assert engine.model(df, 'v1') == (ready, True)
+    engine.shutdown()
+
+    options = {f: ready.options(f)[:2] for f in FEATURES}
+    grid = profile_grid(options)
+    assert len(grid) == 2 ** len(FEATURES)
+    assert len(ready.predict(grid)) == len(grid)
+
+def test_engine_retries_failed_training():
+    """Test czy nieudany trening nie blokuje wersji - kolejne model() trenuje ponownie."""
+    df = make_salaries(2000, seed=5)
+    engine = PredictionEngine()
+    engine.model(df.drop(columns=['experience_level']), 'v1')
+    with pytest.raises(KeyError):
+        engine.wait(timeout=60)
+    assert engine.error is not None
+    assert engine.model(df, 'v1') == (None, False)
+    ready = engine.wait(timeout=60)
+    assert ready.version_id == 'v1' and engine.error is None
+    engine.shutdown()
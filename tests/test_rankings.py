@@ -0,0 +1,77 @@
+# 🧪 MODUŁ: Testy rankingów top-N
+
+# Cel: Sprawdzenie, czy skan rankingu z progiem daje to samo co groupby +
+# sort_values oraz czy przyrostowe dopisanie zgadza się z pełną przebudową
+
+# Uruchomienie: pytest tests/ -v
+
+
+import numpy as np
+import pandas as pd
+import sys
+import os
+
+# Dodanie ścieżki do katalogu głównego projektu (importy src.*)
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from benchmarks.synthetic import make_salaries
+from src.aggregates import SalaryCube
+from src.rankings import Ranking, carry_over, ranking
+
+def _expected_top(df, column, min_count, limit):
+    stats = df.groupby(column, observed=True)['salary_in_usd'].agg(['mean', 'count'])
+    stats = stats[stats['count'] >= min_count]
+    return stats.sort_values('mean', ascending=False).head(limit)
+
+def test_top_matches_groupby_for_every_threshold():
+    """Test czy top-N z progiem min_count to to samo co pełny groupby + sort_values."""
+    df = make_salaries(20_000, seed=5)
+    jobs = ranking(SalaryCube.from_frame(df), 'job_title')
+
+    for min_count in (0, 10, 50, 300, 10**9):
+        expected = _expected_top(df, 'job_title', min_count, 10)
+        top = jobs.top(min_count, 10)
+        assert list(top['job_title']) == list(expected.index.astype(str))
+        np.testing.assert_allclose(top['mean_salary'], expected['mean'])
+        np.testing.assert_array_equal(top['count'], expected['count'])
+
+def test_merged_matches_full_rebuild():
+    """Test czy przyrostowe dopisanie delty daje ten sam ranking co przebudowa od zera."""
+    df = make_salaries(8000, seed=1)
+    base, delta = df.iloc[:6000], df.iloc[6000:]
+    extra = delta.iloc[:3].assign(job_title=pd.Categorical(['Nowe stanowisko'] * 3))
+    delta = pd.concat([delta, extra], ignore_index=True)
+
+    merged = Ranking.from_cube(SalaryCube.from_frame(base), 'job_title').merged(
+        Ranking.from_cube(SalaryCube.from_frame(delta), 'job_title')
+    )
+    full = Ranking.from_cube(SalaryCube.from_frame(pd.concat([base, delta], ignore_index=True)), 'job_title')
+
+    assert 'Nowe stanowisko' in set(merged.keys)
+    assert np.all(np.diff(merged.means) <= 0)
+    pd.testing.assert_frame_equal(merged.table(5), full.table(5))
+
+def test_rankings_carried_over_to_merged_cube():
+    """Test czy zbudowany ranking przechodzi na scaloną kostkę bez przebudowy."""
+    df = make_salaries(3000, seed=2)
+    old_cube = SalaryCube.from_frame(df.iloc[:2000])
+    delta_cube = SalaryCube.from_frame(df.iloc[2000:])
+    countries = ranking(old_cube, 'company_location')
+
+    new_cube = old_cube.merge(delta_cube)
+    carry_over(old_cube, new_cube, delta_cube)
+
+    carried = ranking(new_cube, 'company_location')
+    assert carried is not countries
+    expected = _expected_top(df, 'company_location', 0, len(df))
+    assert list(carried.table()['company_location']) == list(expected.index.astype(str))
+
+def test_ranking_of_filtered_cube_skips_absent_keys():
+    """Test czy ranking kostki widoku (SalaryCube.subset) nie zawiera kluczy bez rekordów."""
+    df = make_salaries(5000, seed=4)
+    filters = {'experience_level': ['SE']}
+    jobs = Ranking.from_cube(SalaryCube.from_frame(df).subset(filters), 'job_title')
+
+    expected = _expected_top(df[df['experience_level'] == 'SE'], 'job_title', 1, len(df))
+    assert list(jobs.table()['job_title']) == list(expected.index.astype(str))
+    np.testing.assert_array_equal(jobs.table()['count'], expected['count'])
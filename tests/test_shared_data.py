@@ -0,0 +1,70 @@
+# 🧪 MODUŁ: Testy danych współdzielonych (memory-mapped Arrow IPC)
+
+# Cel: Sprawdzenie, czy opublikowana tabela mapuje się bez kopii, z tym samym
+# schematem, a nowa wersja podmienia się atomowo dla wszystkich czytelników
+
+# Uruchomienie: pytest tests/ -v
+
+
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# Dodanie ścieżki do katalogu głównego projektu (importy src.*)
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+pytest.importorskip("pyarrow")
+
+from benchmarks.synthetic import make_salaries
+from src import shared_data
+from src.shared_data import SharedDataset, map_frame, publish, read_pointer, KEEP_VERSIONS
+
+def test_publish_and_map_zero_copy(tmp_path):
+    """Test czy zmapowana tabela jest równa źródłowej i oparta na buforach read-only."""
+    df = make_salaries(2000)
+    pointer = publish(df, str(tmp_path))
+    mapped = map_frame(str(tmp_path / pointer['file']))
+
+    pd.testing.assert_frame_equal(mapped, df)
+    salaries = mapped['salary_in_usd'].to_numpy()
+    codes = mapped['job_title'].array.codes
+    assert not salaries.flags.writeable and not salaries.flags.owndata
+    assert not codes.flags.writeable and not codes.flags.owndata
+
+def test_new_version_swaps_for_all_readers(tmp_path):
+    """Test czy zmiana źródła publikuje nową wersję widoczną dla każdego procesu."""
+    source = tmp_path / "salaries.csv"
+    shared = tmp_path / "shared"
+    make_salaries(500).to_csv(source, index=False)
+
+    # Dwa obiekty = dwa procesy; publikuje tylko pierwszy
+    first = SharedDataset(str(source), str(shared))
+    second = SharedDataset(str(source), str(shared))
+    assert first.current.version == second.current.version == 1
+    assert first.current.fingerprint == second.current.fingerprint
+
+    for rows in (600, 700):
+        make_salaries(rows, seed=rows).to_csv(source, index=False)
+        os.utime(source, ns=(0, os.stat(source).st_mtime_ns + 10 ** 9))
+        assert first.refresh(force=True) is True
+        assert second.refresh(force=True) is True
+        assert second.current.rows == rows
+
+    assert read_pointer(str(shared))['version'] == 3
+    assert len([n for n in os.listdir(shared) if n.endswith('.arrow')]) == KEEP_VERSIONS
+    np.testing.assert_allclose(
+        second.current.cube.rollup().iloc[0]['count'], len(second.current.df)
+    )
+
+def test_missing_pyarrow_fails_early(tmp_path, monkeypatch):
+    """Test czy bez pyarrow tryb współdzielony kończy się od razu czytelnym błędem."""
+    source = tmp_path / "salaries.csv"
+    make_salaries(100).to_csv(source, index=False)
+    monkeypatch.setattr(shared_data, '_has_pyarrow', lambda: False)
+
+    with pytest.raises(ImportError, match="pyarrow"):
+        SharedDataset(str(source), str(tmp_path / "shm"))
+    assert not (tmp_path / "shm").exists()
@@ -0,0 +1,43 @@
+# 🧪 MODUŁ: Testy szkiców kwantyli
+
+# Cel: Sprawdzenie dokładności (małe grupy) i granicy błędu rangi (duże grupy)
+
+# Uruchomienie: pytest tests/ -v
+
+
+import numpy as np
+import sys
+import os
+
+# Dodanie ścieżki do katalogu głównego projektu (importy src.*)
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.sketches import SKETCH_SIZE, compress_centroids, grouped_quantiles
+
+def test_small_groups_are_exact():
+    """Test czy grupy z ≤ SKETCH_SIZE wartościami dają kwantyle jak np.quantile."""
+    rng = np.random.default_rng(0)
+    groups = rng.integers(0, 4, 200)
+    values = rng.uniform(0, 100, 200)
+    sketch = compress_centroids(groups, values, np.ones(len(values)))
+
+    for q in (0.1, 0.5, 0.9):
+        present, result = grouped_quantiles(*sketch, q)
+        expected = [np.quantile(values[groups == g], q) for g in present]
+        np.testing.assert_allclose(result, expected)
+
+def test_large_group_rank_error_is_bounded():
+    """Test czy błąd rangi dla skompresowanej i scalonej grupy mieści się w ~1/k."""
+    rng = np.random.default_rng(1)
+    part_a = rng.lognormal(11.5, 0.5, 50_000)
+    part_b = rng.lognormal(11.8, 0.4, 30_000)
+    sketch_a = compress_centroids(np.zeros(len(part_a), int), part_a, np.ones(len(part_a)))
+    sketch_b = compress_centroids(np.zeros(len(part_b), int), part_b, np.ones(len(part_b)))
+    merged = compress_centroids(*(np.concatenate(pair) for pair in zip(sketch_a, sketch_b)))
+    values = np.concatenate([part_a, part_b])
+
+    assert len(merged[0]) <= SKETCH_SIZE
+    for q in (0.02, 0.25, 0.5, 0.75, 0.98):
+        _, (estimate,) = grouped_quantiles(*merged, q)
+        rank = (values <= estimate).mean()
+        assert abs(rank - q) <= 2 / SKETCH_SIZE
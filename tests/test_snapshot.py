@@ -0,0 +1,62 @@
+# 🧪 MODUŁ: Testy snapshotu dashboardu EDA
+
+# Cel: Sprawdzenie, czy snapshot zawiera wyniki dla wszystkich podanych stanów
+# widgetów (pod kluczami resolve()), zapisuje się i wczytuje bez zmian
+
+# Uruchomienie: pytest tests/ -v
+
+
+import json
+import sys
+import os
+
+# Dodanie ścieżki do katalogu głównego projektu (importy src.*)
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from benchmarks.synthetic import make_salaries
+from src import eda
+from src.aggregates import SalaryCube
+from src.parallel import resolve
+from src.snapshot import build_results, load_snapshot, render_html, write_snapshot
+
+def _fail(*args):
+    raise AssertionError("wynik powinien pochodzić ze snapshotu")
+
+def test_results_cover_default_and_popular_states():
+    """Test czy wyniki obejmują stan domyślny i dodatkowe stany pod kluczami resolve()."""
+    df = make_salaries(2000, seed=1)
+    cube = SalaryCube.from_frame(df)
+    states = [{}, {'top_jobs_min_count': 100, 'trend_mean': True}]
+    results = build_results(df, cube, 'fp', states)
+
+    assert resolve(results, 'top_jobs', (eda.DEFAULT_MIN_COUNT,), _fail)[0].equals(
+        eda._top_jobs_result(cube, 'fp', eda.DEFAULT_MIN_COUNT)[0]
+    )
+    resolve(results, 'top_jobs', (100,), _fail)
+    resolve(results, 'trend', ('mean', False), _fail)
+    countries = tuple(sorted(eda._default_countries(cube)))
+    resolve(results, 'country_comparison', countries, _fail)
+    distribution, _ = resolve(
+        results, 'salary_distribution', (eda.DEFAULT_CUTOFF, eda.DEFAULT_NBINS, False), _fail
+    )
+    assert distribution.cutoff == eda.DEFAULT_CUTOFF
+    # Stan spoza snapshotu → brak wyniku, sekcja liczy na żywo
+    assert ('top_jobs', (200,)) not in results
+
+def test_write_and_load_roundtrip(tmp_path):
+    """Test czy zapisany snapshot wczytuje się z tymi samymi kluczami i pasuje tylko do swoich danych."""
+    df = make_salaries(1000, seed=2)
+    cube = SalaryCube.from_frame(df)
+    results = build_results(df, cube, 'fp')
+    write_snapshot(tmp_path, results, 'fp', [{}], render_html(results, df, cube, 'fp'))
+
+    snapshot = load_snapshot(tmp_path)
+    assert set(snapshot.results) == set(results)
+    assert snapshot.matches('fp') and not snapshot.matches('inne-dane')
+
+    manifest = json.loads((tmp_path / 'manifest.json').read_text(encoding='utf-8'))
+    figures = [name for task in manifest['tasks'] for name in task['figures']]
+    assert figures and all((tmp_path / name).exists() for name in figures)
+    page = (tmp_path / 'index.html').read_text(encoding='utf-8')
+    assert 'Analiza wynagrodzeń' in page and 'plotly.min.js' in page
+    assert load_snapshot(tmp_path / 'brak') is None